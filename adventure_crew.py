@@ -6,42 +6,76 @@ into personalized, real-world micro-adventures with full logistics and audio gui
 """
 
 import os
+import logging
+import time
+import pickle
+import socket
+import hashlib
+import asyncio
+import functools
+import threading
 from pathlib import Path
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 import weave
-from crewai import Task, Crew
-from crewai.llm import LLM
 
 # Import Weave tracing utilities
 from weave_custom.trace_hooks import traced, setup_weave_tracing
 
-# Import our specialized adventure agents
-from agents.adventure_creative_agent import adventure_creative_agent
-from agents.adventure_research_agent import adventure_research_agent
-from agents.adventure_logistics_agent import adventure_logistics_agent
+TRANSCRIPT_PREVIEW_BYTES = 200
 
-@traced("adventure_crew", "create_crew")
-def create_adventure_crew():
-    """Create and configure the adventure transformation crew."""
-    
-    # Create the tasks for each phase of adventure creation
-    
-    # Task 1: Analyze transcript and generate creative adventure ideas
-    creative_task = Task(
-        description="""
-        Analyze the provided video transcript and generate inspiring micro-adventure ideas.
+# Per-step console output is opt-in; CrewAI's own logger stays at WARNING otherwise
+CREW_VERBOSE = os.getenv("CREW_VERBOSE", "false").lower() == "true"
+logging.getLogger("crewai").setLevel(logging.DEBUG if CREW_VERBOSE else logging.WARNING)
+
+# Full pipeline results keyed by blake2b(transcript bytes + user location + crew config)
+ADVENTURE_CACHE_ENABLED = os.getenv("ADVENTURE_CACHE", "true").lower() == "true"
+ADVENTURE_CACHE_DIR = Path(os.getenv("ADVENTURE_CACHE_DIR", ".adventure_cache"))
+ADVENTURE_CACHE_TTL = int(os.getenv("ADVENTURE_CACHE_TTL", "86400"))
+
+# Sources that define the crew's prompts, agents, models and schemas; editing any of
+# them changes the cache key, so stored adventures never outlive the config that made them
+ADVENTURE_CONFIG_FILES = (
+    "adventure_crew.py",
+    "adventure_schemas.py",
+    "agents/adventure_creative_agent.py",
+    "agents/adventure_research_agent.py",
+    "agents/adventure_logistics_agent.py",
+    "agents/_llm_pool.py"
+)
+ADVENTURE_CONFIG_ENV = ("ADVENTURE_PLANNING", "ADVENTURE_PLANNING_MODEL", "ADVENTURE_MEMORY")
+
+# Task outputs are written after kickoff rather than via Task.output_file, which would
+# block the hand-off to the next task on a file write and would have every concurrent
+# run write the same path instead of the caller's artifact directory
+TASK_ARTIFACTS = {
+    "creative": "adventure_ideas.json",
+    "context_research": "adventure_context.json",
+    "location_research": "adventure_research.json",
+    "logistics": "adventure_complete.md"
+}
+
+
+# Task prompts are static, so they live at module level rather than being rebuilt per crew
+CREATIVE_DESCRIPTION = """
+        Analyze the video transcript below and generate inspiring micro-adventure ideas.
         
-        You will receive a video transcript file. Your job is to:
+        Your job is to:
         1. Read and understand the core themes and actionable concepts
         2. Identify elements that can be experienced in the real world
         3. Generate 2-3 specific adventure ideas that connect to the video's content
         4. Focus on universally accessible locations (parks, museums, downtown areas, etc.)
         5. Design experiences that are achievable in a few hours or a day
         
-        The transcript will contain the video title, full transcript text, and metadata.
+        The transcript contains the video title, full transcript text, and metadata.
         Transform this passive content into active, engaging real-world experiences.
-        """,
-        expected_output="""
-        A structured adventure proposal containing:
+        
+        Video transcript:
+        {transcript}
+        """
+
+CREATIVE_EXPECTED_OUTPUT = """
+        A JSON adventure proposal with one entry per adventure containing:
         - Adventure Title (creative and engaging)
         - Core Theme Connection (how it relates to the video)
         - 2-3 Specific Location Types to Visit
@@ -50,60 +84,66 @@ def create_adventure_crew():
         - Photo/Share Opportunities
         - Estimated Duration
         - Accessibility Notes
-        """,
-        agent=adventure_creative_agent,
-        output_file="adventure_ideas.md"
-    )
-    
-    # Task 2: Research locations and gather rich contextual information
-    research_task = Task(
-        description="""
-        Take the adventure ideas from the Creative Agent and research specific locations
-        and rich contextual information to enhance the experience.
+        """
+
+CONTEXT_RESEARCH_DESCRIPTION = """
+        Take the adventure ideas from the Creative Agent and research the rich contextual
+        information that will make each proposed location memorable.
         
         For each proposed adventure location:
         1. Use EXA to find fascinating background information, stories, and context
-        2. Use Maps tools to find specific locations with addresses and directions
-        3. Gather 3-5 interesting facts or stories that will make each location special
-        4. Verify practical details like hours, accessibility, and requirements
-        5. Generate route information and shareable links
-        6. Find the best photo opportunities and unique features
-        
-        Focus on transforming generic location types into specific, engaging destinations
-        with rich stories and practical details for a successful adventure.
-        """,
-        expected_output="""
-        Detailed research for each location including:
-        - Specific Location Details (name, address, coordinates, access info)
+        2. Gather 3-5 interesting facts or stories that will make each location special
+        3. Look for local legends, cultural significance, or seasonal highlights
+        4. Find the best photo opportunities and unique features
+        
+        Focus only on stories and context - location logistics are researched in parallel.
+        """
+
+CONTEXT_RESEARCH_EXPECTED_OUTPUT = """
+        JSON contextual research with one entry per location including:
         - Rich Contextual Information (3-5 fascinating facts or stories)
-        - Practical Information (hours, costs, accessibility, parking)
         - Experience Enhancement (best photo spots, what to look for)
+        - Special Events or Seasonal Highlights
+        """
+
+LOCATION_RESEARCH_DESCRIPTION = """
+        Take the adventure ideas from the Creative Agent and turn each generic location type
+        into a specific, reachable destination.
+        
+        For each proposed adventure location:
+        1. Use Maps tools to find specific locations with addresses and directions
+        2. Verify practical details like hours, accessibility, and requirements
+        3. Get route information; every route result already includes a share_url link
+        4. Identify backup locations in case the first choice is unavailable
+        
+        Focus only on practical location details - background stories are researched in parallel.
+        """
+
+LOCATION_RESEARCH_EXPECTED_OUTPUT = """
+        JSON location research with one entry per adventure stop including:
+        - Specific Location Details (name, address, coordinates, access info)
+        - Practical Information (hours, costs, accessibility, parking)
         - Route Information (directions, travel time, navigation links)
         - Alternative Options (backup locations if needed)
-        """,
-        agent=adventure_research_agent,
-        context=[creative_task],
-        output_file="adventure_research.md"
-    )
-    
-    # Task 3: Build narrative, schedule adventure, and create audio guide
-    logistics_task = Task(
-        description="""
+        """
+
+LOGISTICS_DESCRIPTION = """
         Transform the research into a complete adventure experience with compelling narrative,
         perfect scheduling, and immersive audio guide.
         
         Your responsibilities:
         1. Weave all research into a compelling, story-driven narrative
         2. Structure it as a guided tour script with clear directions and timing
-        3. Create calendar events with optimal timing and complete details
+        3. Choose optimal timing and complete event details
         4. Generate a podcast-style audio guide script
-        5. Produce the actual audio file using TTS
+        5. Call the finalize tool once to create the calendar event and the TTS audio file together
         6. Include all practical logistics and follow-up suggestions
         
         The final output should be a complete, ready-to-experience adventure that appears
         in the user's calendar with audio guide and all necessary details.
-        """,
-        expected_output="""
+        """
+
+LOGISTICS_EXPECTED_OUTPUT = """
         Complete adventure package including:
         - Full Adventure Narrative (story-guided tour script)
         - Calendar Event (scheduled with details and links)
@@ -111,71 +151,319 @@ def create_adventure_crew():
         - Audio File (generated TTS audio guide)
         - Logistics Summary (what to bring, practical tips)
         - Follow-up Suggestions (additional exploration ideas)
-        """,
+        """
+
+def _read_transcript(transcript_file: str) -> str:
+    """
+    Read a transcript file for the crew's prompt.
+    
+    Args:
+        transcript_file: Path to the transcript file
+        
+    Returns:
+        Transcript text; undecodable bytes are replaced rather than failing the run
+    """
+    try:
+        with open(transcript_file, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Transcript file not found: {transcript_file}") from None
+
+def _scan_transcript_text(transcript_text: str, user_location: str, preview_limit: int) -> tuple:
+    """
+    Measure, preview, and fingerprint a transcript.
+    
+    Args:
+        transcript_text: Transcript content
+        user_location: User location, part of the cache key
+        preview_limit: Number of bytes to decode for the preview
+        
+    Returns:
+        Tuple of (size in bytes, preview text, cache key). A multi-byte
+        character cut at the preview boundary is dropped.
+    """
+    data = transcript_text.encode('utf-8')
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(user_location.encode('utf-8'))
+    digest.update(_config_fingerprint())
+    preview = data[:preview_limit].decode('utf-8', errors='ignore')
+    return len(data), preview, digest.hexdigest()
+
+@functools.cache
+def _config_fingerprint() -> bytes:
+    """
+    Hash the crew's configuration sources and settings once per process.
+    
+    Returns:
+        Digest bytes mixed into every adventure cache key
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    root = Path(__file__).parent
+    for name in ADVENTURE_CONFIG_FILES:
+        digest.update(name.encode('utf-8'))
+        try:
+            digest.update((root / name).read_bytes())
+        except OSError:
+            pass
+    for name in ADVENTURE_CONFIG_ENV:
+        digest.update(f"{name}={os.getenv(name, '')}".encode('utf-8'))
+    return digest.digest()
+
+def _load_cached_adventure(cache_key: str):
+    """Return a stored result for this transcript and location, or None on a miss or expired entry."""
+    cache_file = ADVENTURE_CACHE_DIR / f"{cache_key}.pkl"
+    try:
+        if time.time() - cache_file.stat().st_mtime > ADVENTURE_CACHE_TTL:
+            return None
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # Missing, unreadable, or pickled against classes that have since changed
+        return None
+
+def _store_cached_adventure(cache_key: str, result) -> None:
+    """Persist a result atomically so concurrent runs never read a partial entry."""
+    cache_file = ADVENTURE_CACHE_DIR / f"{cache_key}.pkl"
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        ADVENTURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except (pickle.PicklingError, TypeError, AttributeError, OSError):
+        # Some results hold unpicklable objects and disks fill up; caching is an optimization only
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def _write_task_artifacts(result, artifact_dir) -> None:
+    """
+    Write the task outputs of a finished crew run to disk.
+    
+    Args:
+        result: CrewOutput returned by kickoff
+        artifact_dir: Directory for this run's files, or None to skip writing them
+    """
+    if artifact_dir is None:
+        return
+    
+    artifact_dir = Path(artifact_dir)
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    for task_output in result.tasks_output:
+        artifact = TASK_ARTIFACTS.get(task_output.name)
+        if artifact:
+            (artifact_dir / artifact).write_text(task_output.raw, encoding='utf-8')
+
+@functools.cache
+def _load_crewai():
+    """Import CrewAI on first use; it pulls in LiteLLM and the provider SDKs."""
+    from crewai import Task, Crew
+    return Task, Crew
+
+def _prewarm_connections(crew) -> threading.Thread:
+    """
+    Warm up LLM and MCP tool connections in the background.
+    
+    Sends a one-token completion per distinct LLM (in parallel) so the TLS
+    session and Gemini routing are established before the first agent turn,
+    and resolves the MCP tool hosts so DNS lookups are cached.
+    
+    Args:
+        crew: Crew whose agent and planning LLMs should be warmed
+        
+    Returns:
+        The daemon thread doing the warm-up
+    """
+    from agents._llm_pool import prewarm
+    from tools import calendar_mcp, exa_mcp, maps_mcp, tts_mcp
+    
+    llms = {id(agent.llm): agent.llm for agent in crew.agents}
+    if getattr(crew, "planning_llm", None) is not None:
+        llms[id(crew.planning_llm)] = crew.planning_llm
+    
+    def resolve_host(base_url):
+        url = urlparse(base_url)
+        try:
+            socket.getaddrinfo(url.hostname, url.port or (443 if url.scheme == "https" else 80))
+        except (socket.gaierror, TypeError):
+            pass
+    
+    def warm_up():
+        base_urls = {module.BASE_URL for module in (calendar_mcp, exa_mcp, maps_mcp, tts_mcp)}
+        with ThreadPoolExecutor(max_workers=len(llms) + len(base_urls)) as pool:
+            pool.map(prewarm, llms.values())
+            pool.map(resolve_host, base_urls)
+    
+    thread = threading.Thread(target=warm_up, name="adventure-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+@functools.lru_cache(maxsize=1)
+@traced("adventure_crew", "create_crew")
+def create_adventure_crew():
+    """
+    Create and configure the adventure transformation crew.
+    
+    The tasks are static and per-run values arrive through kickoff inputs, so the
+    crew is built once per process as a template. A Crew keeps per-run state on its
+    tasks and agents and must not be kicked off concurrently, so callers kick off
+    crew.copy() rather than the shared instance.
+    """
+    
+    Task, Crew = _load_crewai()
+    
+    # Import our specialized adventure agents (deferred: each builds its LLM and tools)
+    from agents.adventure_creative_agent import adventure_creative_agent
+    from agents.adventure_research_agent import create_adventure_research_agent
+    from agents.adventure_logistics_agent import adventure_logistics_agent
+    from agents._llm_pool import get_llm, EMBEDDER_CONFIG, MEMORY_STORAGE_DIR
+    from adventure_schemas import AdventureIdeas, ContextResearch, LocationResearch
+    from tools import exa_search, exa_find_events, maps_route, maps_itinerary_route
+    
+    # Create the tasks for each phase of adventure creation. Intermediate tasks emit
+    # JSON (adventure_schemas) so downstream agents get structure rather than prose
+    
+    # Task 1: Analyze transcript and generate creative adventure ideas
+    creative_task = Task(
+        description=CREATIVE_DESCRIPTION,
+        expected_output=CREATIVE_EXPECTED_OUTPUT,
+        agent=adventure_creative_agent,
+        output_pydantic=AdventureIdeas,
+        name="creative"
+    )
+    
+    # Task 2a/2b: Research fans out into two independent branches that both depend
+    # only on the creative ideas. Marking them async lets CrewAI run the EXA
+    # context research and the Maps location research concurrently; the
+    # logistics task below is the join point. Each branch gets its own agent, since
+    # two tasks running at once on one Agent would share its executor and history.
+    context_research_agent = create_adventure_research_agent([exa_search, exa_find_events])
+    location_research_agent = create_adventure_research_agent([maps_route, maps_itinerary_route])
+    
+    context_research_task = Task(
+        description=CONTEXT_RESEARCH_DESCRIPTION,
+        expected_output=CONTEXT_RESEARCH_EXPECTED_OUTPUT,
+        agent=context_research_agent,
+        context=[creative_task],
+        async_execution=True,
+        output_pydantic=ContextResearch,
+        name="context_research"
+    )
+    
+    location_research_task = Task(
+        description=LOCATION_RESEARCH_DESCRIPTION,
+        expected_output=LOCATION_RESEARCH_EXPECTED_OUTPUT,
+        agent=location_research_agent,
+        context=[creative_task],
+        async_execution=True,
+        output_pydantic=LocationResearch,
+        name="location_research"
+    )
+    
+    # Task 3: Build narrative, schedule adventure, and create audio guide
+    logistics_task = Task(
+        description=LOGISTICS_DESCRIPTION,
+        expected_output=LOGISTICS_EXPECTED_OUTPUT,
         agent=adventure_logistics_agent,
-        context=[creative_task, research_task],
-        output_file="adventure_complete.md"
+        context=[creative_task, context_research_task, location_research_task],
+        name="logistics"
     )
     
+    # The task order is already fixed by the context dependencies above, so CrewAI's
+    # planning pass only adds an LLM round-trip; keep it available as an opt-in
+    planning = os.getenv("ADVENTURE_PLANNING", "false").lower() == "true"
+    
+    # Each run is one-shot and task context already carries prior outputs, so the
+    # default embedding-backed memory only adds embedding calls and vector-store I/O
+    memory = os.getenv("ADVENTURE_MEMORY", "false").lower() == "true"
+    if memory:
+        os.environ.setdefault("CREWAI_STORAGE_DIR", MEMORY_STORAGE_DIR)
+    
     # Create the crew
     crew = Crew(
-        agents=[adventure_creative_agent, adventure_research_agent, adventure_logistics_agent],
-        tasks=[creative_task, research_task, logistics_task],
-        verbose=True,
-        memory=True,
-        planning=True,
-        planning_llm=LLM(
-            model="gemini/gemini-2.0-flash-exp",
-            api_key=os.getenv("GEMINI_API_KEY"),
-            temperature=0.7
-        )
+        agents=[adventure_creative_agent, context_research_agent, location_research_agent,
+                adventure_logistics_agent],
+        tasks=[creative_task, context_research_task, location_research_task, logistics_task],
+        verbose=CREW_VERBOSE,
+        memory=memory,
+        embedder=EMBEDDER_CONFIG if memory else None,
+        planning=planning,
+        # Planning is a short structural task, so a smaller tier with low temperature suffices
+        planning_llm=get_llm(
+            0.2, os.getenv("ADVENTURE_PLANNING_MODEL", "gemini/gemini-1.5-flash-8b")
+        ) if planning else None
     )
     
+    # Overlap connection setup with the remaining kickoff preparation
+    if os.getenv("ADVENTURE_PREWARM", "true").lower() == "true":
+        _prewarm_connections(crew)
+    
     return crew
 
 @traced("adventure_crew", "transform_transcript") 
-def transform_transcript_to_adventure(transcript_file: str, user_location: str = ""):
+async def transform_transcript_to_adventure_async(transcript_file: str = None, user_location: str = "",
+                                                   transcript_text: str = None, artifact_dir: str = ".",
+                                                   use_cache: bool = True):
     """
     Transform a video transcript into a personalized micro-adventure.
     
     Args:
         transcript_file: Path to the transcript file
         user_location: Optional user location for personalization
+        transcript_text: Transcript content, used instead of transcript_file so
+            callers that already hold the text skip a temporary file
+        artifact_dir: Directory for the task output files (see TASK_ARTIFACTS);
+            concurrent callers should each pass their own, or None to skip them
+        use_cache: Read and write the adventure cache (ADVENTURE_CACHE); callers
+            measuring the crew itself, such as the evaluator, pass False
         
     Returns:
         Adventure transformation results
     """
     
+    if transcript_text is None:
+        if transcript_file is None:
+            raise ValueError("Either transcript_file or transcript_text is required")
+        transcript_text = _read_transcript(transcript_file)
+    
+    # File and in-memory transcripts with the same content share cached adventures
+    transcript_length, transcript_preview, cache_key = _scan_transcript_text(
+        transcript_text, user_location, TRANSCRIPT_PREVIEW_BYTES
+    )
+    
     # Initialize Weave tracing for this session
     setup_weave_tracing("adventure-transformation-crew")
     
-    # Log the transformation start
-    weave.log({
+    # Metrics are collected locally and sent to Weave in a single log call
+    run_log = {
         "transcript_file": transcript_file,
         "user_location": user_location,
         "operation": "transform_transcript_to_adventure"
-    })
-    
-    # Verify transcript file exists
-    if not os.path.exists(transcript_file):
-        raise FileNotFoundError(f"Transcript file not found: {transcript_file}")
-    
-    # Read transcript content for context
-    with open(transcript_file, 'r', encoding='utf-8') as f:
-        transcript_content = f.read()
+    }
+    run_log["transcript_length"] = transcript_length
+    run_log["transcript_preview"] = transcript_preview + "..." if transcript_length > TRANSCRIPT_PREVIEW_BYTES else transcript_preview
     
-    # Log transcript metadata
-    weave.log({
-        "transcript_length": len(transcript_content),
-        "transcript_preview": transcript_content[:200] + "..." if len(transcript_content) > 200 else transcript_content
-    })
+    # Re-submitted transcripts return the stored adventure without running the crew
+    use_cache = use_cache and ADVENTURE_CACHE_ENABLED
+    if use_cache:
+        cached = _load_cached_adventure(cache_key)
+        if cached is not None:
+            _write_task_artifacts(cached, artifact_dir)
+            run_log.update({
+                "status": "success",
+                "result_type": type(cached).__name__,
+                "cache_hit": True
+            })
+            weave.log(run_log)
+            return cached
     
-    # Create the adventure crew
-    crew = create_adventure_crew()
+    # Each call kicks off its own copy, so concurrent transformations don't share task state
+    crew = create_adventure_crew().copy()
     
     # Prepare inputs for the crew
     inputs = {
-        "transcript_file": transcript_file,
+        "transcript": transcript_text,
         "user_location": user_location or "General/Universal locations"
     }
     
@@ -187,10 +475,12 @@ def transform_transcript_to_adventure(transcript_file: str, user_location: str =
         
         try:
             # Execute the crew
-            result = crew.kickoff(inputs=inputs)
+            result = await crew.kickoff_async(inputs=inputs)
+            _write_task_artifacts(result, artifact_dir)
+            if use_cache:
+                _store_cached_adventure(cache_key, result)
             
-            # Log success metrics
-            weave.log({
+            run_log.update({
                 "status": "success",
                 "result_type": type(result).__name__,
                 "execution_completed": True
@@ -200,8 +490,7 @@ def transform_transcript_to_adventure(transcript_file: str, user_location: str =
             return result
             
         except Exception as e:
-            # Log error
-            weave.log({
+            run_log.update({
                 "status": "error",
                 "error_type": type(e).__name__,
                 "error_message": str(e)
@@ -210,6 +499,68 @@ def transform_transcript_to_adventure(transcript_file: str, user_location: str =
             trace.add_tag("status", "failed")
             trace.log_error(str(e))
             raise
+            
+        finally:
+            weave.log(run_log)
+
+def transform_transcript_to_adventure(transcript_file: str = None, user_location: str = "",
+                                      transcript_text: str = None, artifact_dir: str = ".",
+                                      use_cache: bool = True):
+    """
+    Synchronous entry point for transform_transcript_to_adventure_async.
+    
+    Args:
+        transcript_file: Path to the transcript file
+        user_location: Optional user location for personalization
+        transcript_text: Transcript content, used instead of transcript_file
+        artifact_dir: Directory for the task output files, or None to skip them
+        use_cache: Read and write the adventure cache
+        
+    Returns:
+        Adventure transformation results
+    """
+    return asyncio.run(transform_transcript_to_adventure_async(
+        transcript_file, user_location, transcript_text, artifact_dir, use_cache
+    ))
+
+@traced("adventure_crew", "transform_transcripts")
+def transform_transcripts_to_adventures(transcript_files: list, user_location: str = "",
+                                        artifact_dir: str = None):
+    """
+    Transform a batch of video transcripts into micro-adventures concurrently.
+    
+    Args:
+        transcript_files: Paths to the transcript files
+        user_location: Optional user location applied to every transcript
+        artifact_dir: Directory under which each transcript's task output files
+            are written to a subdirectory of its own; None skips them
+        
+    Returns:
+        List of adventure transformation results, in input order
+    """
+    
+    missing = [path for path in transcript_files if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"Transcript files not found: {', '.join(missing)}")
+    
+    setup_weave_tracing("adventure-transformation-crew")
+    
+    crew = create_adventure_crew()
+    inputs = [
+        {
+            "transcript": _read_transcript(transcript_file),
+            "user_location": user_location or "General/Universal locations"
+        }
+        for transcript_file in transcript_files
+    ]
+    
+    # kickoff_for_each_async runs an independent copy of the crew per input
+    results = asyncio.run(crew.kickoff_for_each_async(inputs=inputs))
+    
+    if artifact_dir is not None:
+        for index, (transcript_file, result) in enumerate(zip(transcript_files, results), 1):
+            _write_task_artifacts(result, Path(artifact_dir) / f"{index}_{Path(transcript_file).stem}")
+    return results
 
 if __name__ == "__main__":
     # Example usage
@@ -0,0 +1,60 @@
+"""
+Adventure Task Schemas
+
+Structured outputs passed between the adventure crew's tasks. Downstream agents
+receive these as JSON context instead of re-reading free-form markdown.
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class AdventureIdea(BaseModel):
+    """A single micro-adventure proposed by the creative agent."""
+    title: str
+    theme_connection: str = Field(description="How the adventure relates to the video")
+    location_types: List[str] = Field(description="2-3 kinds of places to visit")
+    activities: List[str] = Field(description="Key activities to do at each location")
+    learning_goals: List[str] = []
+    photo_opportunities: List[str] = []
+    estimated_duration: str = ""
+    accessibility_notes: str = ""
+
+
+class AdventureIdeas(BaseModel):
+    """Output of the creative task."""
+    adventures: List[AdventureIdea]
+
+
+class LocationContext(BaseModel):
+    """Background stories and highlights for one location."""
+    location: str
+    facts: List[str] = Field(description="3-5 fascinating facts or stories")
+    photo_spots: List[str] = []
+    highlights: List[str] = Field(default=[], description="Special events or seasonal highlights")
+
+
+class ContextResearch(BaseModel):
+    """Output of the context research task."""
+    locations: List[LocationContext]
+
+
+class LocationDetails(BaseModel):
+    """Practical details for one specific adventure stop."""
+    name: str
+    address: str
+    coordinates: Optional[str] = None
+    access_info: str = ""
+    hours: str = ""
+    costs: str = ""
+    accessibility: str = ""
+    parking: str = ""
+    directions: str = ""
+    travel_time: str = ""
+    navigation_link: str = ""
+    alternatives: List[str] = []
+
+
+class LocationResearch(BaseModel):
+    """Output of the location research task."""
+    locations: List[LocationDetails]
@@ -0,0 +1,114 @@
+"""
+Shared Gemini LLM Pool
+
+Agents differ only in sampling temperature, so they share one LLM instance per
+temperature and one pooled HTTP client instead of each opening their own.
+"""
+
+import os
+import functools
+import threading
+import importlib.util
+
+import httpx
+import litellm
+from crewai.llm import LLM
+
+GEMINI_MODEL = "gemini/gemini-2.0-flash-exp"
+
+# Crew memory embeds every task output; use Gemini rather than CrewAI's OpenAI default
+EMBEDDER_CONFIG = {
+    "provider": "google",
+    "config": {
+        "api_key": os.getenv("GEMINI_API_KEY"),
+        "model": os.getenv("GEMINI_EMBEDDER_MODEL", "models/text-embedding-004")
+    }
+}
+
+# CrewAI keeps memory (Chroma + SQLite) on disk under a folder named after the working
+# directory by default; crews built with memory=True set CREWAI_STORAGE_DIR to this
+# fixed name (unless already set) so every entry point reuses the same embeddings
+MEMORY_STORAGE_DIR = "wnb-hackathon-crew-memory"
+
+# HTTP/2 lets concurrent agent calls multiplex over one connection, but needs h2
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# LiteLLM reuses these clients for every completion instead of creating one per call
+litellm.client_session = httpx.Client(limits=_LIMITS, http2=_HTTP2)
+litellm.aclient_session = httpx.AsyncClient(limits=_LIMITS, http2=_HTTP2)
+
+# CrewAI calls the LLM from worker threads (async tasks, kickoff_async), so a thread
+# semaphore caps in-flight Gemini requests below the point where 429 retries kick in
+_LLM_SLOTS = threading.BoundedSemaphore(int(os.getenv("GEMINI_CONCURRENCY", "8")))
+
+
+class BoundedLLM(LLM):
+    """LLM whose completions share the process-wide Gemini concurrency limit."""
+    
+    def call(self, *args, **kwargs):
+        with _LLM_SLOTS:
+            return super().call(*args, **kwargs)
+
+
+def get_llm(temperature: float = 0.7, model: str = GEMINI_MODEL) -> BoundedLLM:
+    """
+    Get the shared Gemini LLM for a given temperature and model.
+
+    Args:
+        temperature: Sampling temperature for the agent
+        model: LiteLLM model name
+
+    Returns:
+        LLM instance shared by every caller using this temperature and model
+    """
+    # lru_cache keys positional and keyword calls separately; normalize so
+    # get_llm(0.2) and get_llm(temperature=0.2, model=GEMINI_MODEL) share one instance
+    return _shared_llm(float(temperature), model)
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_llm(temperature: float, model: str) -> BoundedLLM:
+    """Build the LLM for one (temperature, model) pair."""
+    return BoundedLLM(
+        model=model,
+        api_key=os.getenv("GEMINI_API_KEY"),
+        temperature=temperature,
+        # Cache the static system prompt (role, goal, backstory) across calls
+        cache_control_injection_points=[{"location": "message", "role": "system"}]
+    )
+
+
+def compact_prompt(text: str) -> str:
+    """
+    Strip the source indentation and trailing spaces from a triple-quoted prompt.
+
+    Agent prompts are resent with every LLM call, so the whitespace is removed
+    once at import instead of being paid for in tokens on each turn.
+
+    Args:
+        text: Prompt as written in the source
+
+    Returns:
+        Prompt with each line stripped, keeping line breaks
+    """
+    return "\n".join(line.strip() for line in text.strip().splitlines())
+
+
+def prewarm(llm: LLM) -> None:
+    """
+    Send a one-token completion so the pooled connection's TLS session and
+    Gemini routing are set up before the first real agent turn.
+
+    Args:
+        llm: LLM whose model and API key should be warmed
+    """
+    try:
+        litellm.completion(
+            model=llm.model,
+            api_key=llm.api_key,
+            messages=[{"role": "user", "content": "ok"}],
+            max_tokens=1
+        )
+    except Exception:
+        pass  # Warm-up is best effort; real calls report real failures
@@ -7,20 +7,16 @@ that transform passive content consumption into active real-world experiences.
 
 import os
 from crewai import Agent
-from crewai.llm import LLM
+from agents._llm_pool import get_llm, compact_prompt
 
 # Configure Gemini LLM
-gemini_llm = LLM(
-    model="gemini/gemini-2.0-flash-exp",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.8  # Higher temperature for more creativity
-)
+gemini_llm = get_llm(0.8)  # Higher temperature for more creativity
 
 # Create Adventure Creative Agent
 adventure_creative_agent = Agent(
     role="Adventure Creative Specialist",
     goal="Transform video content into inspiring real-world micro-adventures that connect digital learning with physical exploration",
-    backstory="""You are a creative mastermind who specializes in bridging the gap between digital content and real-world experiences. 
+    backstory=compact_prompt("""You are a creative mastermind who specializes in bridging the gap between digital content and real-world experiences. 
     Your unique talent lies in identifying the core themes and actionable elements from video transcripts, then crafting engaging 
     micro-adventures that allow people to experience those concepts firsthand in their local environment.
     
@@ -31,15 +27,15 @@ adventure_creative_agent = Agent(
     - Can be completed in a few hours or a day
     - Create memorable, Instagram-worthy moments
     
-    You think like a travel writer, urban explorer, and educational designer rolled into one.""",
+    You think like a travel writer, urban explorer, and educational designer rolled into one."""),
     
     llm=gemini_llm,
-    verbose=True,
+    verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true",
     allow_delegation=False,
     max_execution_time=300,
     
     # Agent-specific instructions
-    system_message="""When analyzing a transcript, focus on:
+    system_message=compact_prompt("""When analyzing a transcript, focus on:
     
     1. CORE THEME EXTRACTION:
     - Identify the main subject/topic of the video
@@ -72,5 +68,5 @@ adventure_creative_agent = Agent(
     - Photo/Share Opportunities
     - Estimated Duration
     - Accessibility Notes
-    """
+    """)
 ) 
\ No newline at end of file
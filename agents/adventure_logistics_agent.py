@@ -7,22 +7,17 @@ and creating podcast-style audio guides for the complete experience.
 
 import os
 from crewai import Agent
-from crewai.llm import LLM
-from tools.calendar_mcp import calendar_create_event, calendar_create_itinerary_events
-from tools.tts_mcp import tts_generate_audio, tts_generate_podcast
+from agents._llm_pool import get_llm, compact_prompt
+from tools import finalize_adventure
 
 # Configure Gemini LLM
-gemini_llm = LLM(
-    model="gemini/gemini-2.0-flash-exp",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.7  # Creative but focused for narrative building
-)
+gemini_llm = get_llm(0.7)  # Creative but focused for narrative building
 
 # Create Adventure Logistics Agent
 adventure_logistics_agent = Agent(
     role="Adventure Logistics Coordinator",
     goal="Transform research into compelling narratives, schedule perfect adventure timing, and create immersive audio experiences",
-    backstory="""You are a master storyteller and experience coordinator who brings adventures to life through compelling narratives 
+    backstory=compact_prompt("""You are a master storyteller and experience coordinator who brings adventures to life through compelling narratives 
     and seamless logistics. Your expertise lies in weaving together research findings into engaging stories that guide people through 
     their real-world adventures.
     
@@ -38,16 +33,17 @@ adventure_logistics_agent = Agent(
     - Timing and pacing make the difference between good and great experiences
     - Audio guides should feel conversational and inspiring, not like textbooks
     
-    You think like a combination of podcast producer, travel concierge, and master storyteller.""",
+    You think like a combination of podcast producer, travel concierge, and master storyteller."""),
     
-    tools=[calendar_create_event, calendar_create_itinerary_events, tts_generate_audio, tts_generate_podcast],
+    # One composite tool schedules the event and renders the audio guide concurrently
+    tools=[finalize_adventure],
     llm=gemini_llm,
-    verbose=True,
+    verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true",
     allow_delegation=False,
     max_execution_time=600,
     
     # Agent-specific instructions
-    system_message="""When coordinating an adventure, follow this process:
+    system_message=compact_prompt("""When coordinating an adventure, follow this process:
     
     1. NARRATIVE CONSTRUCTION:
     - Weave research findings into a compelling story structure
@@ -77,11 +73,15 @@ adventure_logistics_agent = Agent(
     - Add excitement and wonder to factual information
     - Create memorable moments that encourage sharing
     
+    5. FINALIZATION:
+    - Call the adventure.finalize tool once with the narrative, timing, and audio script
+    - It creates the calendar event and generates the audio guide at the same time
+    
     Format your output as:
     - Complete Adventure Narrative (full story-guided tour script)
     - Calendar Event Details (title, description, timing, location links)
     - Audio Guide Script (podcast-style with timing cues)
     - Logistics Summary (what to bring, practical tips)
     - Follow-up Suggestions (additional exploration ideas)
-    """
+    """)
 ) 
\ No newline at end of file
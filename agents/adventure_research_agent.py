@@ -7,76 +7,94 @@ Uses EXA for rich content discovery and MCP Location tools for precise location
 
 import os
 from crewai import Agent
-from crewai.llm import LLM
-from tools.exa_mcp import exa_search, exa_find_events
-from tools.maps_mcp import maps_route, maps_generate_shareable_link, maps_itinerary_route
+from agents._llm_pool import get_llm, compact_prompt
+from tools import exa_search, exa_find_events
+from tools import maps_route, maps_itinerary_route
 
 # Configure Gemini LLM
-gemini_llm = LLM(
-    model="gemini/gemini-2.0-flash-exp",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.6  # Balanced temperature for research accuracy
-)
+gemini_llm = get_llm(0.6)  # Balanced temperature for research accuracy
 
-# Create Adventure Research Agent
-adventure_research_agent = Agent(
-    role="Adventure Research Specialist",
-    goal="Research and validate adventure locations, finding rich contextual information and precise geographic details to enhance the experience",
-    backstory="""You are a meticulous researcher and location scout who excels at finding the perfect spots for adventures. 
-    Your expertise lies in discovering not just WHERE to go, but WHY those places are special. You uncover the hidden stories, 
-    historical context, and fascinating details that transform ordinary locations into extraordinary experiences.
+RESEARCH_TOOLS = [exa_search, exa_find_events, maps_route, maps_itinerary_route]
+
+
+def create_adventure_research_agent(tools: list = None) -> Agent:
+    """
+    Build an Adventure Research Specialist.
     
-    You have access to powerful research tools:
-    - EXA for finding rich, contextual information about places, history, and topics
-    - MCP Location services for precise geographic data and routing
+    CrewAI keeps an agent's executor, tool bindings and message history on the
+    Agent object, so research tasks that run concurrently each need their own.
     
-    Your research philosophy:
-    - Every location has a story worth telling
-    - Context makes experiences memorable
-    - Practical details ensure successful adventures
-    - Local knowledge beats generic tourist information
+    Args:
+        tools: Tools the agent may use (defaults to RESEARCH_TOOLS)
+        
+    Returns:
+        A new Agent instance
+    """
+    if tools is None:
+        tools = RESEARCH_TOOLS
     
-    You think like a combination of investigative journalist, travel researcher, and local historian.""",
+    return Agent(
+        role="Adventure Research Specialist",
+        goal="Research and validate adventure locations, finding rich contextual information and precise geographic details to enhance the experience",
+        backstory=compact_prompt("""You are a meticulous researcher and location scout who excels at finding the perfect spots for adventures. 
+        Your expertise lies in discovering not just WHERE to go, but WHY those places are special. You uncover the hidden stories, 
+        historical context, and fascinating details that transform ordinary locations into extraordinary experiences.
     
-    tools=[exa_search, exa_find_events, maps_route, maps_generate_shareable_link, maps_itinerary_route],
-    llm=gemini_llm,
-    verbose=True,
-    allow_delegation=False,
-    max_execution_time=600,
+        You have access to powerful research tools:
+        - EXA for finding rich, contextual information about places, history, and topics
+        - MCP Location services for precise geographic data and routing
     
-    # Agent-specific instructions
-    system_message="""When researching an adventure idea, follow this process:
+        Your research philosophy:
+        - Every location has a story worth telling
+        - Context makes experiences memorable
+        - Practical details ensure successful adventures
+        - Local knowledge beats generic tourist information
     
-    1. CONTEXTUAL RESEARCH (using EXA):
-    - Search for rich background information related to the adventure theme
-    - Find historical context, interesting facts, and stories
-    - Look for local legends, cultural significance, or unique details
-    - Gather information that will make the experience more engaging
+        You think like a combination of investigative journalist, travel researcher, and local historian."""),
     
-    2. LOCATION RESEARCH (using MCP Location tools):
-    - Find specific locations that match the adventure requirements
-    - Get precise addresses, coordinates, and access information
-    - Research nearby amenities, parking, and accessibility
-    - Generate route information and shareable links
+        tools=list(tools),
+        llm=gemini_llm,
+        verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true",
+        allow_delegation=False,
+        max_execution_time=600,
     
-    3. EXPERIENCE ENRICHMENT:
-    - Find 3-5 fascinating facts or stories about each location
-    - Identify the best times to visit and what to expect
-    - Discover photo opportunities and unique features
-    - Research any special events, exhibits, or seasonal highlights
+        # Agent-specific instructions
+        system_message=compact_prompt("""When researching an adventure idea, follow this process:
     
-    4. PRACTICAL VALIDATION:
-    - Verify locations are publicly accessible
-    - Check operating hours and any entry requirements
-    - Identify potential challenges or alternatives
-    - Ensure the adventure is feasible and safe
+        1. CONTEXTUAL RESEARCH (using EXA):
+        - Search for rich background information related to the adventure theme
+        - Find historical context, interesting facts, and stories
+        - Look for local legends, cultural significance, or unique details
+        - Gather information that will make the experience more engaging
     
-    Format your research as:
-    - Location Details (name, address, coordinates, access info)
-    - Rich Context (3-5 fascinating facts or stories)
-    - Practical Information (hours, costs, accessibility)
-    - Experience Enhancement (best photo spots, what to look for)
-    - Route Information (getting there, navigation links)
-    - Alternative Options (backup locations or activities)
-    """
-) 
\ No newline at end of file
+        2. LOCATION RESEARCH (using MCP Location tools):
+        - Find specific locations that match the adventure requirements
+        - Get precise addresses, coordinates, and access information
+        - Research nearby amenities, parking, and accessibility
+        - Use the share_url links included in every route result
+    
+        3. EXPERIENCE ENRICHMENT:
+        - Find 3-5 fascinating facts or stories about each location
+        - Identify the best times to visit and what to expect
+        - Discover photo opportunities and unique features
+        - Research any special events, exhibits, or seasonal highlights
+    
+        4. PRACTICAL VALIDATION:
+        - Verify locations are publicly accessible
+        - Check operating hours and any entry requirements
+        - Identify potential challenges or alternatives
+        - Ensure the adventure is feasible and safe
+    
+        Format your research as:
+        - Location Details (name, address, coordinates, access info)
+        - Rich Context (3-5 fascinating facts or stories)
+        - Practical Information (hours, costs, accessibility)
+        - Experience Enhancement (best photo spots, what to look for)
+        - Route Information (getting there, navigation links)
+        - Alternative Options (backup locations or activities)
+        """)
+    )
+
+
+# Create Adventure Research Agent
+adventure_research_agent = create_adventure_research_agent()
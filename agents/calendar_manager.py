@@ -6,25 +6,21 @@ Specialized agent for creating and managing calendar invitations with embedded n
 
 import os
 from crewai import Agent
-from crewai.llm import LLM
-from tools.calendar_mcp import calendar_create_event, calendar_create_itinerary_events
+from agents._llm_pool import get_llm, compact_prompt
+from tools import calendar_create_event, calendar_create_itinerary_events
 
 # Configure Gemini LLM
-gemini_llm = LLM(
-    model="gemini/gemini-2.0-flash-exp",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.7
-)
+gemini_llm = get_llm(0.7)
 
 # Create Calendar & Scheduling Manager Agent
 calendar_manager = Agent(
     role="Calendar & Scheduling Manager",
     goal="Create and manage calendar invitations and scheduling for planned experiences",
-    backstory="""You are an expert at calendar management and scheduling coordination.
+    backstory=compact_prompt("""You are an expert at calendar management and scheduling coordination.
     You understand the importance of proper scheduling, reminders, and making sure
-    all participants are properly informed about events and activities with seamless navigation.""",
+    all participants are properly informed about events and activities with seamless navigation."""),
     tools=[calendar_create_event, calendar_create_itinerary_events],
     llm=gemini_llm,
-    verbose=True,
+    verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true",
     allow_delegation=False
 )
\ No newline at end of file
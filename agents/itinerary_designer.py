@@ -6,26 +6,22 @@ Specialized agent for creating comprehensive, well-timed itineraries with naviga
 
 import os
 from crewai import Agent
-from crewai.llm import LLM
-from tools.exa_mcp import exa_search
-from tools.maps_mcp import maps_route, maps_generate_shareable_link
+from agents._llm_pool import get_llm, compact_prompt
+from tools import exa_search
+from tools import maps_route
 
 # Configure Gemini LLM
-gemini_llm = LLM(
-    model="gemini/gemini-2.0-flash-exp",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.7
-)
+gemini_llm = get_llm(0.7)
 
 # Create Itinerary Designer Agent
 itinerary_designer = Agent(
     role="Itinerary Designer",
     goal="Create comprehensive, well-timed itineraries that maximize experience value",
-    backstory="""You are a master at creating engaging itineraries that balance
+    backstory=compact_prompt("""You are a master at creating engaging itineraries that balance
     activities, travel time, and personal preferences. You understand timing,
-    logistics, and how to create memorable experiences with integrated navigation.""",
-    tools=[exa_search, maps_route, maps_generate_shareable_link],
+    logistics, and how to create memorable experiences with integrated navigation."""),
+    tools=[exa_search, maps_route],
     llm=gemini_llm,
-    verbose=True,
+    verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true",
     allow_delegation=False
 )
\ No newline at end of file
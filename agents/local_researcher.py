@@ -6,25 +6,21 @@ Specialized agent for discovering local activities, events, and experiences.
 
 import os
 from crewai import Agent
-from crewai.llm import LLM
-from tools.exa_mcp import exa_search, exa_find_events
+from agents._llm_pool import get_llm, compact_prompt
+from tools import exa_search, exa_find_events
 
 # Configure Gemini LLM
-gemini_llm = LLM(
-    model="gemini/gemini-2.0-flash-exp",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.7
-)
+gemini_llm = get_llm(float(os.getenv("RESEARCH_TEMPERATURE", "0.2")))  # Low temperature so repeat analyses agree
 
 # Create Local Experience Researcher Agent
 local_researcher = Agent(
     role="Local Experience Researcher", 
     goal="Find relevant local events, activities, and experiences based on content themes",
-    backstory="""You are a specialist in discovering local activities and experiences.
+    backstory=compact_prompt("""You are a specialist in discovering local activities and experiences.
     You excel at connecting abstract themes and interests to concrete, available
-    experiences in specific locations and timeframes.""",
+    experiences in specific locations and timeframes."""),
     tools=[exa_search, exa_find_events],
     llm=gemini_llm,
-    verbose=True,
+    verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true",
     allow_delegation=False
 )
\ No newline at end of file
@@ -6,25 +6,23 @@ Specialized agent for analyzing YouTube video content and extracting actionable
 
 import os
 from crewai import Agent
-from crewai.llm import LLM
-from tools.youtube_mcp import youtube_analyze, youtube_transcribe, youtube_metadata
+from agents._llm_pool import get_llm, compact_prompt
+from tools import youtube_process, youtube_analyze, youtube_transcribe, youtube_metadata
 
 # Configure Gemini LLM
-gemini_llm = LLM(
-    model="gemini/gemini-2.0-flash-exp",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.7
-)
+gemini_llm = get_llm(float(os.getenv("RESEARCH_TEMPERATURE", "0.2")))  # Low temperature so repeat analyses agree
 
 # Create YouTube Content Analyst Agent
 youtube_analyst = Agent(
     role="YouTube Content Analyst",
     goal="Extract key topics, themes, and actionable insights from YouTube videos",
-    backstory="""You are an expert at analyzing video content and extracting meaningful insights.
+    backstory=compact_prompt("""You are an expert at analyzing video content and extracting meaningful insights.
     You can identify main topics, key themes, emotional context, and actionable information
-    that can be used to plan real-world experiences.""",
-    tools=[youtube_analyze, youtube_transcribe, youtube_metadata],
+    that can be used to plan real-world experiences.
+    When you need more than one of a video's metadata, transcript and analysis, fetch
+    them together with youtube.process rather than calling the separate tools."""),
+    tools=[youtube_process, youtube_analyze, youtube_transcribe, youtube_metadata],
     llm=gemini_llm,
-    verbose=True,
+    verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true",
     allow_delegation=False
 )
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Content Task Schemas
+
+Structured outputs for the content creation crew, so later steps can act on
+individual parts of a result without re-parsing free-form text.
+"""
+
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class PodcastSegment(BaseModel):
+    """One self-contained section of a podcast script."""
+    id: int
+    text: str = Field(description="Narration to be spoken for this segment")
+    production_notes: str = ""
+
+
+class PodcastScript(BaseModel):
+    """Output of the podcast script task."""
+    title: str = ""
+    segments: List[PodcastSegment]
@@ -5,70 +5,144 @@ This is the air traffic controller for the entire CrewAI pipeline.
 It coordinates all agents and defines high-level workflows.
 """
 
-import weave
-from crewai import Crew, Task, Process
+import os
+import json
+import time
+import queue
+import logging
+import pickle
+import asyncio
+import uuid
+import string
+import hashlib
+import inspect
+import functools
+import threading
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from content_schemas import PodcastScript
+from weave_custom import sampled_op
 
-# Import all specialized agents
-from agents.youtube_analyst import youtube_analyst
-from agents.local_researcher import local_researcher
-from agents.route_planner import route_planner
-from agents.itinerary_designer import itinerary_designer
-from agents.podcast_creator import podcast_creator
-from agents.calendar_manager import calendar_manager
+if TYPE_CHECKING:
+    from crewai import Crew, Task
 
+# orjson serializes prompt data and cache keys several times faster; the stdlib encoder is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ContentCreationCrew:
-    """
-    Central orchestrator for the content creation pipeline.
-    
-    This crew coordinates all agents to transform YouTube content into
-    local experiences with calendar integration and podcast content.
-    """
-    
-    def __init__(self):
-        """Initialize the crew with all specialized agents."""
-        self.crew = Crew(
-            agents=[
-                youtube_analyst,
-                local_researcher,
-                route_planner,
-                itinerary_designer,
-                podcast_creator,
-                calendar_manager
-            ],
-            tasks=[],  # Tasks are defined dynamically for each workflow
-            process=Process.sequential,
-            verbose=True
-        )
-    
-    def _execute_workflow(self, tasks: list):
-        """Execute a workflow with the given tasks."""
-        # Create a temporary crew with specific tasks
-        workflow_crew = Crew(
-            agents=[
-                youtube_analyst,
-                local_researcher,
-                route_planner,
-                itinerary_designer,
-                podcast_creator,
-                calendar_manager
-            ],
-            tasks=tasks,
-            process=Process.sequential,
-            verbose=True
-        )
-        return workflow_crew.kickoff()
-    
-    @weave.op()
-    def analyze_content(self, video_url: str, location: str, date: str):
-        """
-        Workflow: Analyze YouTube content and find local experiences.
-        
-        Agents involved: YouTube Analyst → Local Researcher
-        """
-        
-        content_analysis_task = Task(
-            description=f"""
+# Upper bound on tasks from one workflow phase that run at the same time
+MAX_PARALLEL_TASKS = int(os.getenv("CREW_MAX_PARALLEL", "3"))
+
+# Upper bound on per-participant calendar crews running at the same time
+MAX_PARALLEL_EVENTS = int(os.getenv("CALENDAR_MAX_PARALLEL", "8"))
+
+# Upper bound on podcast segments being synthesized at the same time
+MAX_PARALLEL_TTS = int(os.getenv("TTS_MAX_PARALLEL", "3"))
+
+# Podcast and calendar results are cached by their inputs to skip repeat LLM/TTS/Calendar calls
+CONTENT_CACHE_ENABLED = os.getenv("CONTENT_CACHE", "true").lower() == "true"
+CONTENT_CACHE_DIR = Path(os.getenv("CONTENT_CACHE_DIR", ".content_crew_cache"))
+CONTENT_CACHE_TTL = int(os.getenv("CONTENT_CACHE_TTL", "86400"))
+CONTENT_CACHE_SIZE = int(os.getenv("CONTENT_CACHE_SIZE", "128"))
+
+# Task output text that means a tool answered with stub data or the agent gave up;
+# such results are returned but never cached, so the next call tries again
+UNCACHEABLE_MARKERS = ("fallback", "agent stopped due to iteration limit")
+
+
+# Rich step output serializes on stdout under parallel runs; off unless asked for
+CREW_VERBOSE = os.getenv("CREW_VERBOSE", "false").lower() == "true"
+logging.getLogger("crewai").setLevel(logging.DEBUG if CREW_VERBOSE else logging.WARNING)
+CREW_STEP_LOG = os.getenv("CREW_STEP_LOG", "crew_steps.jsonl")
+
+# A manager agent delegating the full pipeline is opt-in: it adds LLM round-trips and
+# runs tasks one at a time, while the default DAG phases run independent steps in parallel
+CREW_HIERARCHICAL = os.getenv("CREW_HIERARCHICAL", "false").lower() == "true"
+CREW_MEMORY = os.getenv("CREW_MEMORY", "false").lower() == "true"
+
+# Drafting the schedule alongside route planning overlaps the two LLM chains, at the
+# cost of one extra (short) merge turn for the itinerary designer; opt-in
+ITINERARY_DRAFT = os.getenv("ITINERARY_DRAFT", "false").lower() == "true"
+
+# Putting stops in visiting order locally spares the route planner reasoning about ordering,
+# but costs a geocode request per stop before any LLM work and needs a real geocoder; opt-in
+ROUTE_PREORDER = os.getenv("ROUTE_PREORDER", "false").lower() == "true"
+
+_step_queue = queue.Queue()
+
+
+def _drain_step_log():
+    """Append queued agent steps to the JSONL step log."""
+    with open(CREW_STEP_LOG, "a", encoding="utf-8") as f:
+        while True:
+            f.write(json.dumps(_step_queue.get(), default=str) + "\n")
+            if _step_queue.empty():
+                f.flush()
+
+
+@functools.cache
+def _start_step_writer():
+    threading.Thread(target=_drain_step_log, name="crew-step-log", daemon=True).start()
+
+
+def _log_step(step):
+    """Crew step callback: queue the step so agent threads never block on file I/O."""
+    _start_step_writer()
+    _step_queue.put({
+        "timestamp": datetime.now().isoformat(),
+        "type": type(step).__name__,
+        "tool": getattr(step, "tool", None),
+        "text": getattr(step, "text", None) or str(step)
+    })
+
+
+# Prompt text is fixed at import; only the itinerary and theme are substituted per call
+PODCAST_SCRIPT_TEMPLATE = string.Template("""
+            Create a podcast script for this itinerary:
+            $itinerary
+            
+            Theme: $theme
+            Focus on storytelling and practical value.
+            """)
+
+PODCAST_SCRIPT_EXPECTED_OUTPUT = "JSON array of segments, each with id, text, and production_notes"
+
+# Filled by CrewAI from the per-participant kickoff inputs
+CALENDAR_EVENT_DESCRIPTION = """
+            Create calendar events for this itinerary participant: {participant}
+            
+            Itinerary:
+            {itinerary}
+            
+            CRITICAL REQUIREMENTS:
+            1. Extract shareable Google Maps links from the itinerary data
+            2. Include clickable navigation links in each calendar event description
+            3. Add travel time estimates between locations
+            4. Format descriptions for mobile and desktop viewing
+            5. Coordinate timing with the podcast content timeline
+            6. Set appropriate reminders and notifications
+            
+            Each event must have clear navigation instructions with working Google Maps links.
+            """
+
+CALENDAR_EVENT_EXPECTED_OUTPUT = "Calendar events with embedded Google Maps navigation links ready to send"
+
+# Research step prompts, filled by str.format in the pipeline and by CrewAI from kickoff inputs in batches
+VIDEO_THEMES_DESCRIPTION = """
+            List the main themes of the YouTube video at {video_url} and the actionable
+            interests they suggest (activities someone could do in person).
+            Keep it short: no summary, insights or audience analysis.
+            """
+
+VIDEO_THEMES_EXPECTED_OUTPUT = "JSON object with themes and actionable_interests"
+
+VIDEO_ANALYSIS_DESCRIPTION = """
             Analyze the YouTube video at {video_url} and extract:
             1. Main topics and themes discussed
             2. Key insights and takeaways
@@ -77,14 +151,12 @@ class ContentCreationCrew:
             5. Target audience and demographics
             
             Return a structured JSON with these insights.
-            """,
-            agent=youtube_analyst,
-            expected_output="JSON object with topics, themes, insights, mood, and actionable_interests"
-        )
-        
-        local_research_task = Task(
-            description=f"""
-            Based on the YouTube content analysis, find relevant local experiences in {location} on {date}.
+            """
+
+VIDEO_ANALYSIS_EXPECTED_OUTPUT = "JSON object with topics, themes, insights, mood, and actionable_interests"
+
+LOCAL_RESEARCH_DESCRIPTION = """
+            Based on the YouTube video's themes, find relevant local experiences in {location} on {date}.
             
             Focus on:
             1. Activities that match the content themes
@@ -93,30 +165,55 @@ class ContentCreationCrew:
             4. Opportunities for hands-on engagement
             
             Rank results by relevance and provide practical details.
-            """,
-            agent=local_researcher,
-            expected_output="Ranked list of local experiences with descriptions, locations, times, and relevance scores",
-            context=[content_analysis_task]
-        )
-        
-        return self._execute_workflow([content_analysis_task, local_research_task])
-    
-    @weave.op()
-    def plan_experience(self, experiences: list, start_location: str, date: str, 
-                       duration: str = "full-day", transportation_mode: str = "driving"):
-        """
-        Workflow: Plan routes and create itinerary with shareable links.
-        
-        Agents involved: Route Planner → Itinerary Designer
-        """
-        
-        # Extract locations from experiences
-        locations = [exp.get('location', exp.get('address', '')) for exp in experiences if exp.get('location')]
-        
-        route_task = Task(
-            description=f"""
+            """
+
+LOCAL_RESEARCH_EXPECTED_OUTPUT = "Ranked list of local experiences with descriptions, locations, times, and relevance scores"
+
+
+# Later pipeline steps read their inputs from task context; only settings are filled per call
+PIPELINE_ROUTE_DESCRIPTION = """
+            Plan an optimized route for the discovered experiences using {transportation_mode}.
+            Generate shareable Google Maps links for each route segment for calendar integration.
+            """
+
+PIPELINE_ROUTE_EXPECTED_OUTPUT = "Optimized route with shareable Google Maps links"
+
+PIPELINE_ITINERARY_DESCRIPTION = """
+            Create a complete {duration} itinerary incorporating the route with shareable links.
+            Include timing, logistics, and calendar-ready descriptions.
+            """
+
+PIPELINE_ITINERARY_EXPECTED_OUTPUT = "Complete itinerary with navigation links"
+
+PIPELINE_SCRIPT_DESCRIPTION = """
+            Create an engaging podcast script based on the planned itinerary and the video analysis.
+            Theme: {theme}
+            """
+
+PIPELINE_SCRIPT_EXPECTED_OUTPUT = "Podcast script with production notes"
+
+PIPELINE_CALENDAR_DESCRIPTION = """
+            Create calendar events for participants: {participants}
+            Include shareable Google Maps links from the itinerary in each event description.
+            Ensure seamless navigation for all participants.
+            """
+
+PIPELINE_CALENDAR_EXPECTED_OUTPUT = "Calendar events with embedded navigation links"
+
+# Single-agent test task prompts, keyed like their templates
+TEST_TASK_DESCRIPTIONS = {
+    "youtube_analyst": "Analyze YouTube video: {video_url}. Extract topics, themes, and insights.",
+    "local_researcher": "Find local experiences in {location} on {date} for topics: {topics}",
+    "route_planner": "Plan optimized route from {start_location} through {locations} with shareable links",
+    "itinerary_designer": "Create itinerary for {date} with experiences: {experiences}",
+    "podcast_creator": "Create podcast script for itinerary: {itinerary} with theme: {theme}",
+    "calendar_manager": "Create calendar events for itinerary: {itinerary} with participants: {participants}"
+}
+
+# plan_experience prompts, filled by str.format per call
+ROUTE_PLAN_DESCRIPTION = """
             Plan an optimized route from {start_location} through these experience locations:
-            {', '.join(locations)}
+            {locations}
             
             Transportation: {transportation_mode}
             
@@ -128,13 +225,21 @@ class ContentCreationCrew:
             5. Accurate travel times and distances
             
             The output must include shareable links that can be embedded in calendar invitations.
-            """,
-            agent=route_planner,
-            expected_output="Complete route with shareable Google Maps links for calendar integration"
-        )
-        
-        itinerary_task = Task(
-            description=f"""
+            """
+
+ROUTE_PLAN_EXPECTED_OUTPUT = "Complete route with shareable Google Maps links for calendar integration"
+
+ITINERARY_DRAFT_DESCRIPTION = """
+            Draft a {duration} schedule for {date} covering these experiences:
+            {experiences}
+            
+            Allocate a time block to each experience and leave a buffer between them.
+            Travel times and navigation links are added later from the planned route.
+            """
+
+ITINERARY_DRAFT_EXPECTED_OUTPUT = "Draft schedule with a time block per experience"
+
+ITINERARY_PLAN_DESCRIPTION = """
             Using the route information with shareable links, create a {duration} itinerary for {date} that:
             1. Incorporates the planned route with Google Maps links
             2. Schedules each experience appropriately with travel buffers
@@ -145,210 +250,1297 @@ class ContentCreationCrew:
             
             IMPORTANT: Preserve all shareable Google Maps links from the route planning for calendar integration.
             Each experience should have associated navigation links that can be clicked from calendar invites.
-            """,
-            agent=itinerary_designer,
-            expected_output="Complete itinerary with shareable Google Maps links ready for calendar integration",
-            context=[route_task]
+            """
+
+ITINERARY_PLAN_EXPECTED_OUTPUT = "Complete itinerary with shareable Google Maps links ready for calendar integration"
+
+
+def _load_crewai():
+    """Import CrewAI on first use; it pulls in LiteLLM and the provider SDKs."""
+    from crewai import Task, Crew, Process
+    return Task, Crew, Process
+
+
+@functools.cache
+def _task_templates() -> dict:
+    """
+    Static parts of per-call tasks, validated once and copied per call.
+    
+    Keys are agent attribute names for the single-agent test tasks, plus the
+    plan_experience and pipeline steps.
+    """
+    Task, *_ = _load_crewai()
+    agents = _agents()
+    
+    return {
+        "youtube_analyst": Task(description="", agent=agents.youtube_analyst, expected_output="Analysis results with topics and themes"),
+        "local_researcher": Task(description="", agent=agents.local_researcher, expected_output="List of relevant local experiences"),
+        "route_planner": Task(description="", agent=agents.route_planner, expected_output="Route with Google Maps links"),
+        "itinerary_designer": Task(description="", agent=agents.itinerary_designer, expected_output="Detailed itinerary with timing"),
+        "podcast_creator": Task(description="", agent=agents.podcast_creator, expected_output="Podcast script with production notes"),
+        "calendar_manager": Task(description="", agent=agents.calendar_manager, expected_output="Calendar events with navigation links"),
+        "plan_route": Task(description="", agent=agents.route_planner, expected_output=ROUTE_PLAN_EXPECTED_OUTPUT),
+        "plan_draft": Task(description="", agent=agents.itinerary_designer, expected_output=ITINERARY_DRAFT_EXPECTED_OUTPUT),
+        "plan_itinerary": Task(description="", agent=agents.itinerary_designer, expected_output=ITINERARY_PLAN_EXPECTED_OUTPUT),
+        "pipeline_themes": Task(description="", agent=agents.youtube_analyst, expected_output=VIDEO_THEMES_EXPECTED_OUTPUT),
+        "pipeline_analysis": Task(description="", agent=agents.youtube_analyst, expected_output=VIDEO_ANALYSIS_EXPECTED_OUTPUT),
+        "pipeline_research": Task(description="", agent=agents.local_researcher, expected_output=LOCAL_RESEARCH_EXPECTED_OUTPUT),
+        "pipeline_route": Task(description="", agent=agents.route_planner, expected_output=PIPELINE_ROUTE_EXPECTED_OUTPUT),
+        "pipeline_itinerary": Task(description="", agent=agents.itinerary_designer, expected_output=PIPELINE_ITINERARY_EXPECTED_OUTPUT),
+        "pipeline_script": Task(description="", agent=agents.podcast_creator, expected_output=PIPELINE_SCRIPT_EXPECTED_OUTPUT),
+        "pipeline_calendar": Task(description="", agent=agents.calendar_manager, expected_output=PIPELINE_CALENDAR_EXPECTED_OUTPUT)
+    }
+
+
+@functools.cache
+def _agents() -> SimpleNamespace:
+    """Import the specialized agents on first use; each builds its LLM and tools."""
+    from agents.youtube_analyst import youtube_analyst
+    from agents.local_researcher import local_researcher
+    from agents.route_planner import route_planner
+    from agents.itinerary_designer import itinerary_designer
+    from agents.podcast_creator import podcast_creator
+    from agents.calendar_manager import calendar_manager
+    
+    return SimpleNamespace(
+        youtube_analyst=youtube_analyst,
+        local_researcher=local_researcher,
+        route_planner=route_planner,
+        itinerary_designer=itinerary_designer,
+        podcast_creator=podcast_creator,
+        calendar_manager=calendar_manager
+    )
+
+
+@functools.cache
+def _shared_crews() -> SimpleNamespace:
+    """
+    Build the reusable crews once per process.
+    
+    Every ContentCreationCrew swaps tasks into these same crews, so additional
+    instances cost no crew validation, callback wiring or connection warm-up.
+    """
+    Task, Crew, Process = _load_crewai()
+    agents = _agents()
+    agent_list = list(vars(agents).values())
+    
+    crew = Crew(
+        agents=agent_list,
+        tasks=[],  # Tasks are defined dynamically for each workflow
+        process=Process.sequential,
+        verbose=CREW_VERBOSE,
+        step_callback=None if CREW_VERBOSE else _log_step
+    )
+    
+    # Single-agent crews for parallel phases
+    agent_crews = {
+        agent.role: Crew(
+            agents=[agent],
+            tasks=[],
+            process=Process.sequential,
+            verbose=CREW_VERBOSE,
+            step_callback=None if CREW_VERBOSE else _log_step
         )
+        for agent in agent_list
+    }
+    
+    # Per-participant calendar crew; {participant} and {itinerary} are filled from kickoff inputs
+    calendar_crew = Crew(
+        agents=[agents.calendar_manager],
+        tasks=[
+            Task(
+                description=CALENDAR_EVENT_DESCRIPTION,
+                agent=agents.calendar_manager,
+                expected_output=CALENDAR_EVENT_EXPECTED_OUTPUT
+            )
+        ],
+        process=Process.sequential,
+        verbose=CREW_VERBOSE,
+        step_callback=None if CREW_VERBOSE else _log_step
+    )
+    
+    # Podcast script crew for batches; {itinerary} and {theme} are filled from kickoff inputs
+    script_crew = Crew(
+        agents=[agents.podcast_creator],
+        tasks=[
+            Task(
+                description=PODCAST_SCRIPT_TEMPLATE.substitute(itinerary="{itinerary}", theme="{theme}"),
+                agent=agents.podcast_creator,
+                expected_output=PODCAST_SCRIPT_EXPECTED_OUTPUT,
+                output_pydantic=PodcastScript
+            )
+        ],
+        process=Process.sequential,
+        verbose=CREW_VERBOSE,
+        step_callback=None if CREW_VERBOSE else _log_step
+    )
+    
+    # Per-video research crew for batches; {video_url}, {location} and {date} come from kickoff inputs
+    themes_task = Task(
+        description=VIDEO_THEMES_DESCRIPTION,
+        agent=agents.youtube_analyst,
+        expected_output=VIDEO_THEMES_EXPECTED_OUTPUT
+    )
+    research_crew = Crew(
+        agents=[agents.youtube_analyst, agents.local_researcher],
+        tasks=[
+            themes_task,
+            Task(
+                description=VIDEO_ANALYSIS_DESCRIPTION,
+                agent=agents.youtube_analyst,
+                expected_output=VIDEO_ANALYSIS_EXPECTED_OUTPUT,
+                context=[themes_task]
+            ),
+            Task(
+                description=LOCAL_RESEARCH_DESCRIPTION,
+                agent=agents.local_researcher,
+                expected_output=LOCAL_RESEARCH_EXPECTED_OUTPUT,
+                context=[themes_task]
+            )
+        ],
+        process=Process.sequential,
+        verbose=CREW_VERBOSE,
+        step_callback=None if CREW_VERBOSE else _log_step
+    )
+    
+    # Route -> itinerary crew for batches; placeholders are filled from kickoff inputs
+    route_task = Task(
+        description=ROUTE_PLAN_DESCRIPTION,
+        agent=agents.route_planner,
+        expected_output=ROUTE_PLAN_EXPECTED_OUTPUT
+    )
+    planning_crew = Crew(
+        agents=[agents.route_planner, agents.itinerary_designer],
+        tasks=[
+            route_task,
+            Task(
+                description=ITINERARY_PLAN_DESCRIPTION,
+                agent=agents.itinerary_designer,
+                expected_output=ITINERARY_PLAN_EXPECTED_OUTPUT,
+                context=[route_task]
+            )
+        ],
+        process=Process.sequential,
+        verbose=CREW_VERBOSE,
+        step_callback=None if CREW_VERBOSE else _log_step
+    )
+    
+    # Single crew for multi-step workflows in hierarchical mode, sharing memory and tool cache across steps
+    manager_crew = None
+    if CREW_HIERARCHICAL:
+        from agents._llm_pool import get_llm, EMBEDDER_CONFIG, MEMORY_STORAGE_DIR
         
-        return self._execute_workflow([route_task, itinerary_task])
+        if CREW_MEMORY:
+            os.environ.setdefault("CREWAI_STORAGE_DIR", MEMORY_STORAGE_DIR)
+        
+        manager_crew = Crew(
+            agents=agent_list,
+            tasks=[],
+            process=Process.hierarchical,
+            manager_llm=get_llm(0.2),
+            memory=CREW_MEMORY,
+            embedder=EMBEDDER_CONFIG if CREW_MEMORY else None,
+            cache=True,
+            verbose=CREW_VERBOSE,
+            step_callback=None if CREW_VERBOSE else _log_step
+        )
     
-    @weave.op()
-    def create_content(self, itinerary: dict, participants: list, podcast_theme: str = None):
+    # A crew runs one task list at a time, so each reused crew gets its own lock
+    reused_crews = [crew, manager_crew, *agent_crews.values()]
+    locks = {id(reused): threading.Lock() for reused in reused_crews if reused is not None}
+    
+    # Open the pooled Gemini connections while the caller prepares its first workflow
+    if os.getenv("CREW_PREWARM", "true").lower() == "true":
+        from agents._llm_pool import prewarm
+        
+        llms = {id(agent.llm): agent.llm for agent in agent_list}
+        for llm in llms.values():
+            threading.Thread(target=prewarm, args=(llm,), name="crew-prewarm", daemon=True).start()
+    
+    return SimpleNamespace(
+        crew=crew,
+        agent_crews=agent_crews,
+        calendar_crew=calendar_crew,
+        script_crew=script_crew,
+        research_crew=research_crew,
+        planning_crew=planning_crew,
+        manager_crew=manager_crew,
+        locks=locks
+    )
+
+
+def _memoized(name: str):
+    """
+    Decorator that caches a workflow method's result by its normalized arguments.
+    
+    Repeat calls (retries, re-runs while iterating) return the earlier result from
+    the instance's memory/disk cache instead of running the agents again.
+    
+    Args:
+        name: Cache namespace; methods sharing one also share results
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        def key_for(self, args, kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            inputs = dict(list(bound.arguments.items())[1:])  # Everything but self
+            return self._cache_key(name, **inputs)
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key = key_for(self, args, kwargs)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached
+                failures = _mcp_failures()
+                result = await func(self, *args, **kwargs)
+                self._cache_set(key, result, failures)
+                return result
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = key_for(self, args, kwargs)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+            failures = _mcp_failures()
+            result = func(self, *args, **kwargs)
+            self._cache_set(key, result, failures)
+            return result
+        
+        return wrapper
+    return decorator
+
+
+def _mcp_failures() -> int:
+    """Failed MCP requests so far in this process (see tools._http.failure_count)."""
+    from tools._http import failure_count
+    return failure_count()
+
+
+def _cacheable(result) -> bool:
+    """
+    Check that a workflow result holds no fallback data or failed task output.
+    
+    Args:
+        result: Crew output, task outputs, or the dicts/lists wrapping them
+        
+    Returns:
+        True if every part of the result completed normally
+    """
+    if isinstance(result, dict):
+        if result.get("fallback") or result.get("error"):
+            return False
+        return all(_cacheable(value) for value in result.values())
+    if isinstance(result, (list, tuple)):
+        return all(_cacheable(item) for item in result)
+    tasks_output = getattr(result, "tasks_output", None)
+    if tasks_output is not None:
+        return _cacheable(list(tasks_output))
+    raw = getattr(result, "raw", None)
+    if isinstance(raw, str):
+        raw = raw.lower()
+        return not any(marker in raw for marker in UNCACHEABLE_MARKERS)
+    return True
+
+
+# Free-text inputs whose case doesn't change the result. Everything else (URLs, video
+# IDs, emails) is case-sensitive and keeps its exact characters in the cache key.
+CASE_INSENSITIVE_FIELDS = frozenset({
+    "theme", "podcast_theme", "location", "start_location", "duration", "transportation_mode"
+})
+
+
+def _normalize(value, fold: bool = False):
+    """
+    Collapse whitespace in strings so formatting-only changes share a cache key.
+    
+    Args:
+        value: Input value, possibly nested in dicts and lists
+        fold: Also lowercase strings; set for values under CASE_INSENSITIVE_FIELDS
+        
+    Returns:
+        Normalized copy of value
+    """
+    if isinstance(value, str):
+        text = " ".join(value.split())
+        return text.lower() if fold else text
+    if isinstance(value, dict):
+        return {
+            str(key): _normalize(item, fold or key in CASE_INSENSITIVE_FIELDS)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item, fold) for item in value]
+    return value
+
+
+# Itinerary fields each agent actually reads; everything else is left out of its prompt
+CALENDAR_ACTIVITY_FIELDS = ("name", "time", "start_time", "end_time", "duration", "location", "maps_link")
+CALENDAR_LEG_FIELDS = ("destination", "duration", "shareable_link")
+NAVIGATION_FIELDS = {"maps_link", "shareable_link", "complete_route_link", "share_url", "coordinates", "waypoints"}
+
+
+def _experience_locations(experiences: list) -> list:
+    """Each experience's location, falling back to its address; experiences with neither are skipped."""
+    return [loc for exp in experiences if (loc := exp.get('location') or exp.get('address'))]
+
+
+def _project_for_calendar(itinerary):
+    """Keep only the scheduling and navigation fields of an itinerary."""
+    if not isinstance(itinerary, dict) or not ({"activities", "legs"} & itinerary.keys()):
+        return itinerary
+    
+    projected = {key: itinerary[key] for key in ("date", "complete_route_link") if key in itinerary}
+    if "activities" in itinerary:
+        projected["activities"] = [
+            {key: activity[key] for key in CALENDAR_ACTIVITY_FIELDS if key in activity}
+            if isinstance(activity, dict) else activity
+            for activity in itinerary["activities"]
+        ]
+    if "legs" in itinerary:
+        projected["legs"] = [
+            {key: leg[key] for key in CALENDAR_LEG_FIELDS if key in leg}
+            if isinstance(leg, dict) else leg
+            for leg in itinerary["legs"]
+        ]
+    return projected
+
+
+def _project_for_podcast(itinerary):
+    """Drop navigation links and coordinates, which a narrated script never uses."""
+    if isinstance(itinerary, dict):
+        return {
+            key: _project_for_podcast(value)
+            for key, value in itinerary.items()
+            if key not in NAVIGATION_FIELDS
+        }
+    if isinstance(itinerary, list):
+        return [_project_for_podcast(item) for item in itinerary]
+    return itinerary
+
+
+class DAGWorkflow:
+    """
+    Workflow tasks with named dependencies, grouped into parallel phases.
+    
+    Each task's context is wired from its dependencies, and phases() orders the
+    tasks into levels (Kahn's algorithm) whose members can run concurrently.
+    """
+    
+    def __init__(self):
+        self.nodes = {}
+    
+    def add(self, name: str, task: "Task", deps: list = ()) -> "Task":
         """
-        Workflow: Create podcast content and calendar events.
+        Add a task that runs after the named dependencies.
         
-        Agents involved: Podcast Creator → Calendar Manager
+        Args:
+            name: Unique task name within the workflow
+            task: Task to run
+            deps: Names of tasks whose output this task needs
+            
+        Returns:
+            The task, for chaining into other workflows
         """
+        if name in self.nodes:
+            raise ValueError(f"Duplicate workflow task: {name}")
+        self.nodes[name] = (task, list(deps))
+        return task
+    
+    def until(self, *names: str) -> "DAGWorkflow":
+        """
+        Get the sub-workflow needed to produce the given tasks.
         
-        script_task = Task(
-            description=f"""
-            Create a podcast script for this itinerary:
-            {itinerary}
+        Args:
+            names: Last tasks to run
             
-            Theme: {podcast_theme or 'Local Experience Adventure'}
-            Focus on storytelling and practical value.
-            """,
-            agent=podcast_creator,
-            expected_output="Engaging podcast script with production notes"
-        )
+        Returns:
+            Workflow with those tasks and everything they transitively depend on
+        """
+        unknown = [name for name in names if name not in self.nodes]
+        if unknown:
+            raise ValueError(f"Unknown workflow tasks: {unknown}")
+        
+        needed = set()
+        pending = list(names)
+        while pending:
+            current = pending.pop()
+            if current not in needed:
+                needed.add(current)
+                pending.extend(self.nodes[current][1])
+        
+        subset = DAGWorkflow()
+        for node, (task, deps) in self.nodes.items():
+            if node in needed:
+                subset.add(node, task, deps)
+        return subset
+    
+    def phases(self) -> list:
+        """
+        Group tasks into dependency levels.
         
-        audio_task = Task(
-            description=f"""
-            Generate high-quality audio from the podcast script.
-            Ensure professional quality output.
-            """,
-            agent=podcast_creator,
-            expected_output="Professional audio files and metadata",
-            context=[script_task]
+        Returns:
+            List of task lists; every task's dependencies are in earlier lists
+        """
+        indegree = {}
+        dependents = {name: [] for name in self.nodes}
+        for name, (task, deps) in self.nodes.items():
+            missing = [dep for dep in deps if dep not in self.nodes]
+            if missing:
+                raise ValueError(f"Workflow task {name} depends on unknown tasks: {missing}")
+            indegree[name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(name)
+            if deps:
+                task.context = [self.nodes[dep][0] for dep in deps]
+        
+        phases = []
+        ready = [name for name, count in indegree.items() if count == 0]
+        while ready:
+            phases.append([self.nodes[name][0] for name in ready])
+            next_ready = []
+            for name in ready:
+                for dependent in dependents[name]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = next_ready
+        
+        if sum(len(phase) for phase in phases) != len(self.nodes):
+            raise ValueError("Workflow dependencies contain a cycle")
+        return phases
+
+
+class ContentCreationCrew:
+    """
+    Central orchestrator for the content creation pipeline.
+    
+    This crew coordinates all agents to transform YouTube content into
+    local experiences with calendar integration and podcast content.
+    """
+    
+    def __init__(self):
+        """Initialize the crew with all specialized agents."""
+        self.agents = _agents()
+        self._agent_list = list(vars(self.agents).values())
+        
+        # Crews and their locks are shared by every instance in the process
+        crews = _shared_crews()
+        self.crew = crews.crew
+        self._agent_crews = crews.agent_crews
+        self._calendar_crew = crews.calendar_crew
+        self._script_crew = crews.script_crew
+        self._research_crew = crews.research_crew
+        self._planning_crew = crews.planning_crew
+        self._manager_crew = crews.manager_crew
+        self._crew_locks = crews.locks
+        
+        # In-process LRU layer over the on-disk result cache: key -> (write time, result)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Serialized itineraries, reused by every task prompt that embeds the same data
+        self._prompt_cache = {}
+    
+    def _canonical(self, obj) -> str:
+        """
+        Serialize prompt data to compact JSON once per distinct value.
+        
+        Args:
+            obj: Data embedded in a task description
+            
+        Returns:
+            Compact JSON string
+        """
+        digest = hashlib.blake2b(repr(obj).encode("utf-8"), digest_size=16).hexdigest()
+        text = self._prompt_cache.get(digest)
+        if text is None:
+            if orjson is not None:
+                text = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            else:
+                text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+            self._prompt_cache[digest] = text
+        return text
+    
+    def _cache_key(self, name: str, **inputs) -> str:
+        """Hash a workflow name and its normalized inputs into a cache key."""
+        payload = {"n": name, **_normalize(inputs)}
+        if orjson is not None:
+            data = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(data).hexdigest()
+    
+    def _cache_get(self, key: str):
+        """Return a cached workflow result, or None on a miss or expired entry."""
+        if not CONTENT_CACHE_ENABLED:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                written, result = entry
+                if time.time() - written <= CONTENT_CACHE_TTL:
+                    self._cache.move_to_end(key)
+                    return result
+                # The disk copy was written at the same time, so it has expired too
+                del self._cache[key]
+                return None
+        
+        path = CONTENT_CACHE_DIR / f"{key}.pkl"
+        try:
+            written = path.stat().st_mtime
+            if time.time() - written > CONTENT_CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # Missing, unreadable, or pickled against classes that have since changed
+            return None
+        
+        self._remember(key, written, result)
+        return result
+    
+    def _remember(self, key: str, written: float, result):
+        """Add a result to the in-memory layer, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._cache[key] = (written, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > CONTENT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _cache_set(self, key: str, result, failures: int = None):
+        """
+        Store a workflow result in memory and, when picklable, on disk.
+        
+        Results holding fallback data or failed task output are not stored.
+        
+        Args:
+            key: Cache key from _cache_key
+            result: Workflow result
+            failures: _mcp_failures() from before the run; if any MCP request
+                has failed since, a tool may have answered with fallback data
+        """
+        if not CONTENT_CACHE_ENABLED:
+            return
+        if failures is not None and _mcp_failures() != failures:
+            return
+        if not _cacheable(result):
+            return
+        self._remember(key, time.time(), result)
+        
+        path = CONTENT_CACHE_DIR / f"{key}.pkl"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            CONTENT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (pickle.PicklingError, TypeError, AttributeError, OSError):
+            # The disk copy is an optimization; a full or read-only disk keeps it in memory only
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+    
+    def _from_template(self, name: str, description: str) -> "Task":
+        """
+        Copy a pre-validated task template for one call.
+        
+        Args:
+            name: Template key (see _task_templates)
+            description: Task description for this call
+            
+        Returns:
+            New Task with a fresh id and its own per-run state
+        """
+        return _task_templates()[name].model_copy(update={
+            "id": uuid.uuid4(),
+            "description": description,
+            "processed_by_agents": set()
+        })
+    
+    def _kickoff(self, crew: "Crew", tasks: list):
+        """Run tasks on a reused crew instead of constructing a new one."""
+        with self._crew_locks[id(crew)]:
+            try:
+                crew.tasks = tasks
+            except (TypeError, ValueError):
+                # A CrewAI release that validates assignment would reject the swap;
+                # a shallow copy still skips re-validating agents and callbacks
+                return crew.model_copy(update={"tasks": tasks}).kickoff()
+            return crew.kickoff()
+    
+    def _execute_workflow(self, tasks: list):
+        """Execute a workflow with the given tasks."""
+        return self._kickoff(self.crew, tasks)
+    
+    async def _stream_workflow(self, workflow: DAGWorkflow):
+        """
+        Execute a workflow, yielding each task's output as it finishes.
+        
+        Each task starts as soon as its own dependencies are done rather than
+        when its whole phase is ready, so wall-clock time follows the critical
+        path. Tasks run on their agent's reusable crew and read earlier results
+        through their Task context, which CrewAI resolves from finished outputs.
+        
+        Args:
+            workflow: Workflow to run
+            
+        Yields:
+            Task outputs in completion order
+        """
+        workflow.phases()  # Validates the graph and wires each task's context
+        slots = asyncio.Semaphore(MAX_PARALLEL_TASKS)
+        
+        async def run_task(task):
+            async with slots:
+                task_crew = self._agent_crews[task.agent.role]
+                await asyncio.to_thread(self._kickoff, task_crew, [task])
+        
+        pending = dict(workflow.nodes)
+        done = set()
+        running = {}
+        try:
+            while pending or running:
+                for name, (task, deps) in list(pending.items()):
+                    if done.issuperset(deps):
+                        running[asyncio.ensure_future(run_task(task))] = name
+                        del pending[name]
+                
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    future.result()  # Re-raise a failed task
+                    done.add(name)
+                    yield workflow.nodes[name][0].output
+        finally:
+            for future in running:
+                future.cancel()
+    
+    async def _execute_workflow_async(self, workflow: DAGWorkflow):
+        """
+        Execute a workflow, running each task once its dependencies are done.
+        
+        Args:
+            workflow: Workflow to run
+            
+        Returns:
+            Task outputs in workflow order
+        """
+        async for _ in self._stream_workflow(workflow):
+            pass
+        
+        return [task.output for phase in workflow.phases() for task in phase]
+    
+    async def _run_workflow(self, workflow: DAGWorkflow):
+        """
+        Run a workflow through the manager crew when CREW_HIERARCHICAL is set,
+        otherwise as a parallel DAG.
+        
+        Args:
+            workflow: Workflow to run
+            
+        Returns:
+            The manager crew's output, or task outputs in workflow order
+        """
+        if self._manager_crew is not None:
+            tasks = [task for phase in workflow.phases() for task in phase]
+            return await asyncio.to_thread(self._kickoff, self._manager_crew, tasks)
+        return await self._execute_workflow_async(workflow)
+    
+    async def _bounded_kickoff_each(self, crew: "Crew", inputs_list: list,
+                                    limit: int = MAX_PARALLEL_EVENTS) -> list:
+        """
+        Run a crew once per input set, at most limit at a time.
+        
+        Same as Crew.kickoff_for_each_async, which copies the crew for every
+        input, but without starting every copy at once.
+        
+        Args:
+            crew: Crew whose task descriptions use the input placeholders
+            inputs_list: One inputs dict per run
+            limit: Maximum number of copies running at the same time
+            
+        Returns:
+            Crew outputs in input order
+        """
+        slots = asyncio.Semaphore(limit)
+        
+        async def run(inputs):
+            async with slots:
+                return await crew.copy().kickoff_async(inputs=inputs)
+        
+        return await asyncio.gather(*(run(inputs) for inputs in inputs_list))
+    
+    async def _generate_segment_audio(self, script_output) -> list:
+        """
+        Synthesize each script segment concurrently instead of the whole script at once.
+        
+        Args:
+            script_output: Output of a script task using the PodcastScript schema
+            
+        Returns:
+            TTS results in segment order
+        """
+        script = script_output.pydantic
+        if script is not None:
+            texts = [segment.text for segment in sorted(script.segments, key=lambda segment: segment.id)]
+        else:
+            texts = [script_output.raw]  # Unstructured script: synthesize it as one segment
+        
+        from tools import tts_generate_audio
+        
+        slots = asyncio.Semaphore(MAX_PARALLEL_TTS)
+        
+        async def synthesize(text):
+            async with slots:
+                return await asyncio.to_thread(tts_generate_audio.func, text=text)
+        
+        return await asyncio.gather(*(synthesize(text) for text in texts))
+    
+    async def create_calendar_events_async(self, itinerary: dict, participants: list) -> list:
+        """
+        Create calendar events for each participant concurrently.
+        
+        Args:
+            itinerary: Itinerary the events are built from
+            participants: Participant email addresses
+            
+        Returns:
+            One crew output per participant, in participant order
+        """
+        itinerary_text = self._canonical(_project_for_calendar(itinerary))
+        inputs_list = [
+            {"participant": participant, "itinerary": itinerary_text}
+            for participant in participants
+        ]
+        return await self._bounded_kickoff_each(self._calendar_crew, inputs_list)
+    
+    def create_podcast_scripts(self, itineraries: list, podcast_theme: str = None) -> list:
+        """Synchronous wrapper for create_podcast_scripts_async."""
+        return asyncio.run(self.create_podcast_scripts_async(itineraries, podcast_theme))
+    
+    @sampled_op()
+    async def create_podcast_scripts_async(self, itineraries: list, podcast_theme: str = None) -> list:
+        """
+        Write podcast scripts for several itineraries concurrently.
+        
+        Each script runs on its own copy of the script crew, so the LLM calls
+        overlap instead of queueing behind the shared podcast creator crew.
+        
+        Args:
+            itineraries: Itineraries to write scripts for
+            podcast_theme: Optional theme shared by every script
+            
+        Returns:
+            One crew output per itinerary, in itinerary order
+        """
+        theme = podcast_theme or 'Local Experience Adventure'
+        keys = [self._cache_key("script", itinerary=itinerary, theme=theme) for itinerary in itineraries]
+        results = [self._cache_get(key) for key in keys]
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        inputs_list = [
+            {"itinerary": self._canonical(_project_for_podcast(itineraries[index])), "theme": theme}
+            for index in missing
+        ]
+        failures = _mcp_failures()
+        outputs = await self._bounded_kickoff_each(self._script_crew, inputs_list, MAX_PARALLEL_TASKS)
+        
+        for index, output in zip(missing, outputs):
+            self._cache_set(keys[index], output, failures)
+            results[index] = output
+        return results
+    
+    def analyze_content(self, video_url: str, location: str, date: str):
+        """Synchronous wrapper for analyze_content_async."""
+        return asyncio.run(self.analyze_content_async(video_url, location, date))
+    
+    @sampled_op()
+    @_memoized("research")
+    async def analyze_content_async(self, video_url: str, location: str, date: str):
+        """
+        Workflow: Analyze YouTube content and find local experiences.
+        
+        Agents involved: YouTube Analyst (themes) → YouTube Analyst ∥ Local Researcher
+        """
+        return await self.run_full(video_url, location, date, stop_after=("analysis", "research"))
+    
+    def analyze_content_batch(self, video_urls: list, location: str, date: str) -> list:
+        """Synchronous wrapper for analyze_content_batch_async."""
+        return asyncio.run(self.analyze_content_batch_async(video_urls, location, date))
+    
+    @sampled_op()
+    async def analyze_content_batch_async(self, video_urls: list, location: str, date: str) -> list:
+        """
+        Analyze several videos and find local experiences for each, concurrently.
+        
+        Each video runs on its own copy of the research crew (themes, analysis,
+        research), at most CREW_MAX_PARALLEL at a time.
+        
+        Args:
+            video_urls: YouTube video URLs
+            location: Target location shared by every video
+            date: Target date shared by every video
+            
+        Returns:
+            Per video, the same task outputs analyze_content returns, in video_urls order
+        """
+        # Shares analyze_content's cache entries, so a video analyzed either way is never re-run
+        keys = [
+            self._cache_key("research", video_url=video_url, location=location, date=date)
+            for video_url in video_urls
+        ]
+        results = [self._cache_get(key) for key in keys]
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        inputs_list = [
+            {"video_url": video_urls[index], "location": location, "date": date}
+            for index in missing
+        ]
+        failures = _mcp_failures()
+        outputs = await self._bounded_kickoff_each(self._research_crew, inputs_list, MAX_PARALLEL_TASKS)
+        
+        for index, output in zip(missing, outputs):
+            results[index] = list(output.tasks_output)
+            self._cache_set(keys[index], results[index], failures)
+        return results
+    
+    def plan_experience(self, experiences: list, start_location: str, date: str, 
+                       duration: str = "full-day", transportation_mode: str = "driving"):
+        """Synchronous wrapper for plan_experience_async."""
+        return asyncio.run(self.plan_experience_async(
+            experiences, start_location, date, duration, transportation_mode
+        ))
+    
+    @sampled_op()
+    @_memoized("plan")
+    async def plan_experience_async(self, experiences: list, start_location: str, date: str, 
+                                    duration: str = "full-day", transportation_mode: str = "driving"):
+        """
+        Workflow: Plan routes and create itinerary with shareable links.
+        
+        Agents involved: Route Planner (∥ Itinerary Designer draft) → Itinerary Designer
+        """
+        
+        # Extract locations from experiences
+        locations = _experience_locations(experiences)
+        if not locations:
+            return []  # Nothing to route or schedule
+        
+        ordered = None
+        if ROUTE_PREORDER and len(locations) > 1:
+            from tools.maps_mcp import order_stops
+            
+            ordered = await asyncio.to_thread(order_stops, start_location, locations)
+            locations = ordered or locations
+        
+        route_description = ROUTE_PLAN_DESCRIPTION.format(
+            start_location=start_location,
+            locations=self._canonical(locations),
+            transportation_mode=transportation_mode
         )
+        if ordered:
+            route_description += """
+            The locations above are already in a short visiting order; keep that order.
+            """
+        route_task = self._from_template("plan_route", route_description)
         
-        calendar_task = Task(
-            description=f"""
-            Create calendar events for the itinerary participants: {participants}
+        itinerary_description = ITINERARY_PLAN_DESCRIPTION.format(duration=duration, date=date)
+        
+        # A single stop has nothing to optimize, so its one leg is built here instead of by the route planner
+        single_stop = len(locations) == 1
+        if single_stop:
+            from tools.maps_mcp import build_shareable_link
             
-            CRITICAL REQUIREMENTS:
-            1. Extract shareable Google Maps links from the itinerary data
-            2. Include clickable navigation links in each calendar event description
-            3. Add travel time estimates between locations
-            4. Format descriptions for mobile and desktop viewing
-            5. Coordinate timing with the podcast content timeline
-            6. Set appropriate reminders and notifications
+            leg = {
+                "origin": start_location,
+                "destination": locations[0],
+                "mode": transportation_mode,
+                "shareable_link": build_shareable_link(start_location, locations[0])
+            }
+            itinerary_description += f"""
+            Route information:
+            {self._canonical(leg)}
+            """
+        
+        # The draft only needs the experiences, so it runs in the same phase as the route
+        draft = ITINERARY_DRAFT and not single_stop
+        if draft:
+            draft_task = self._from_template("plan_draft", ITINERARY_DRAFT_DESCRIPTION.format(
+                duration=duration, date=date, experiences=self._canonical(experiences)
+            ))
+            itinerary_description += """
+            Start from the drafted schedule and adjust its buffers to the route's travel times.
+            """
+        
+        itinerary_task = self._from_template("plan_itinerary", itinerary_description)
+        
+        workflow = DAGWorkflow()
+        if single_stop:
+            workflow.add("itinerary", itinerary_task)
+        elif draft:
+            workflow.add("route", route_task)
+            workflow.add("draft", draft_task)
+            workflow.add("itinerary", itinerary_task, ["route", "draft"])
+        else:
+            workflow.add("route", route_task)
+            workflow.add("itinerary", itinerary_task, ["route"])
+        
+        return await self._run_workflow(workflow)
+    
+    def plan_experience_batch(self, requests: list) -> list:
+        """Synchronous wrapper for plan_experience_batch_async."""
+        return asyncio.run(self.plan_experience_batch_async(requests))
+    
+    def plan_experience_pool(self, requests: list, max_workers: int = MAX_PARALLEL_TASKS) -> list:
+        """
+        Plan several requests on a thread pool, for callers that cannot use asyncio.
+        
+        Each worker thread kicks off its own copy of the planning crew, so no crew
+        instance is ever shared between threads. LLM calls spend their time waiting
+        on the network, so the threads overlap almost fully.
+        
+        Args:
+            requests: Same as plan_experience_batch_async
+            max_workers: Maximum number of crews running at the same time
             
-            Each event must have clear navigation instructions with working Google Maps links.
-            """,
-            agent=calendar_manager,
-            expected_output="Calendar events with embedded Google Maps navigation links ready to send"
+        Returns:
+            Per request, the same task outputs plan_experience returns, in request order
+        """
+        requests, keys, results, missing = self._plan_batch_lookup(requests)
+        failures = _mcp_failures()
+        worker = threading.local()
+        
+        def run(item):
+            index, locations = item
+            if not hasattr(worker, "crew"):
+                worker.crew = self._planning_crew.copy()
+            return worker.crew.kickoff(inputs=self._planning_inputs(requests[index], locations))
+        
+        # The with block joins every worker before returning, so no thread outlives the call
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            outputs = list(pool.map(run, missing))
+        
+        for (index, _), output in zip(missing, outputs):
+            results[index] = list(output.tasks_output)
+            self._cache_set(keys[index], results[index], failures)
+        return results
+    
+    @sampled_op()
+    async def plan_experience_batch_async(self, requests: list) -> list:
+        """
+        Plan routes and itineraries for several requests concurrently.
+        
+        Each request runs on its own copy of the planning crew (route, itinerary),
+        at most CREW_MAX_PARALLEL at a time.
+        
+        Args:
+            requests: Dicts of plan_experience arguments (experiences, start_location,
+                date, and optionally duration and transportation_mode)
+            
+        Returns:
+            Per request, the same task outputs plan_experience returns, in request order
+        """
+        requests, keys, results, missing = self._plan_batch_lookup(requests)
+        failures = _mcp_failures()
+        
+        inputs_list = await asyncio.gather(*(
+            asyncio.to_thread(self._planning_inputs, requests[index], locations)
+            for index, locations in missing
+        ))
+        outputs = await self._bounded_kickoff_each(self._planning_crew, inputs_list, MAX_PARALLEL_TASKS)
+        
+        for (index, _), output in zip(missing, outputs):
+            results[index] = list(output.tasks_output)
+            self._cache_set(keys[index], results[index], failures)
+        return results
+    
+    def _plan_batch_lookup(self, requests: list) -> tuple:
+        """
+        Fill in defaults and answer what a planning batch can from the cache.
+        
+        Args:
+            requests: Dicts of plan_experience arguments
+            
+        Returns:
+            (requests with defaults, cache keys, results with cached entries filled in,
+            (index, locations) pairs still to be planned)
+        """
+        requests = [
+            {"duration": "full-day", "transportation_mode": "driving", **request}
+            for request in requests
+        ]
+        # Shares plan_experience's cache entries
+        keys = [self._cache_key("plan", **request) for request in requests]
+        results = [self._cache_get(key) for key in keys]
+        
+        missing = []
+        for index, request in enumerate(requests):
+            if results[index] is None:
+                locations = _experience_locations(request["experiences"])
+                if locations:
+                    missing.append((index, locations))
+                else:
+                    results[index] = []  # Nothing to route or schedule
+        return requests, keys, results, missing
+    
+    def _planning_inputs(self, request: dict, locations: list) -> dict:
+        """Kickoff inputs for the planning crew, with the stops pre-ordered when enabled."""
+        if ROUTE_PREORDER and len(locations) > 1:
+            from tools.maps_mcp import order_stops
+            
+            locations = order_stops(request["start_location"], locations) or locations
+        return {
+            "start_location": request["start_location"],
+            "locations": self._canonical(locations),
+            "transportation_mode": request["transportation_mode"],
+            "duration": request["duration"],
+            "date": request["date"]
+        }
+    
+    def create_content(self, itinerary: dict, participants: list, podcast_theme: str = None):
+        """Synchronous wrapper for create_content_async."""
+        return asyncio.run(self.create_content_async(itinerary, participants, podcast_theme))
+    
+    @sampled_op()
+    # A repeat request returns the earlier result, which also avoids double-booking events
+    @_memoized("content")
+    async def create_content_async(self, itinerary: dict, participants: list, podcast_theme: str = None):
+        """
+        Workflow: Create podcast content and calendar events.
+        
+        Agents involved: Podcast Creator ∥ Calendar Manager
+        """
+        
+        Task, *_ = _load_crewai()
+        script_task = Task(
+            description=PODCAST_SCRIPT_TEMPLATE.substitute(
+                itinerary=self._canonical(_project_for_podcast(itinerary)),
+                theme=podcast_theme or 'Local Experience Adventure'
+            ),
+            agent=self.agents.podcast_creator,
+            expected_output=PODCAST_SCRIPT_EXPECTED_OUTPUT,
+            output_pydantic=PodcastScript
         )
         
-        return self._execute_workflow([script_task, audio_task, calendar_task])
+        async def produce_podcast():
+            workflow = DAGWorkflow()
+            workflow.add("script", script_task)
+            script_outputs = await self._execute_workflow_async(workflow)
+            # Segments are independent audio clips, so TTS runs on all of them at once
+            audio = await self._generate_segment_audio(script_task.output)
+            return [*script_outputs, {"audio_segments": audio}]
+        
+        # Calendar events only need the itinerary, so they are booked while the podcast is produced
+        podcast_outputs, calendar_outputs = await asyncio.gather(
+            produce_podcast(),
+            self.create_calendar_events_async(itinerary, participants)
+        )
+        return [*podcast_outputs, *calendar_outputs]
     
-    @weave.op()
     def complete_pipeline(self, video_url: str, location: str, date: str, 
                          participants: list, duration: str = "full-day",
                          transportation_mode: str = "driving", podcast_theme: str = None):
+        """Synchronous wrapper for complete_pipeline_async."""
+        return asyncio.run(self.complete_pipeline_async(
+            video_url, location, date, participants,
+            duration, transportation_mode, podcast_theme
+        ))
+    
+    @sampled_op()
+    async def complete_pipeline_async(self, video_url: str, location: str, date: str, 
+                                      participants: list, duration: str = "full-day",
+                                      transportation_mode: str = "driving", podcast_theme: str = None):
         """
         Complete end-to-end pipeline workflow.
         
-        Agents involved: All agents in sequence
-        YouTube Analyst → Local Researcher → Route Planner → Itinerary Designer → Podcast Creator → Calendar Manager
+        Agents involved: All agents, with independent steps in parallel
+        YouTube Analyst (themes) → YouTube Analyst ∥ Local Researcher → Route Planner
+        → Itinerary Designer → Podcast Creator ∥ Calendar Manager
         """
-        
-        analysis_task = Task(
-            description=f"""
-            Analyze the YouTube video at {video_url} and extract key topics and themes.
-            Return actionable insights for real-world experience planning.
-            """,
-            agent=youtube_analyst,
-            expected_output="Video analysis with topics and themes"
+        return await self.run_full(
+            video_url, location, date, participants,
+            duration, transportation_mode, podcast_theme
         )
+    
+    def _pipeline_workflow(self, video_url: str, location: str, date: str, participants: list,
+                           duration: str, transportation_mode: str, podcast_theme: str) -> DAGWorkflow:
+        """Build the end-to-end pipeline's tasks and their dependencies."""
         
-        research_task = Task(
-            description=f"""
-            Based on the video analysis, find relevant local experiences in {location} on {date}.
-            Focus on activities that match the content themes and are practically available.
-            """,
-            agent=local_researcher,
-            expected_output="List of relevant local experiences with details",
-            context=[analysis_task]
-        )
+        # Only the themes gate the local search; the full analysis runs alongside it
+        themes_task = self._from_template("pipeline_themes", VIDEO_THEMES_DESCRIPTION.format(video_url=video_url))
+        analysis_task = self._from_template("pipeline_analysis", VIDEO_ANALYSIS_DESCRIPTION.format(video_url=video_url))
+        research_task = self._from_template("pipeline_research", LOCAL_RESEARCH_DESCRIPTION.format(location=location, date=date))
+        route_task = self._from_template("pipeline_route", PIPELINE_ROUTE_DESCRIPTION.format(
+            transportation_mode=transportation_mode
+        ))
+        itinerary_task = self._from_template("pipeline_itinerary", PIPELINE_ITINERARY_DESCRIPTION.format(duration=duration))
+        script_task = self._from_template("pipeline_script", PIPELINE_SCRIPT_DESCRIPTION.format(
+            theme=podcast_theme or 'Local Experience Adventure'
+        ))
+        # Without participants there is nobody to invite, so the calendar step is left out
+        calendar_task = self._from_template("pipeline_calendar", PIPELINE_CALENDAR_DESCRIPTION.format(
+            participants=self._canonical(participants)
+        )) if participants else None
         
-        route_task = Task(
-            description=f"""
-            Plan an optimized route for the discovered experiences using {transportation_mode}.
-            Generate shareable Google Maps links for each route segment for calendar integration.
-            """,
-            agent=route_planner,
-            expected_output="Optimized route with shareable Google Maps links",
-            context=[research_task]
-        )
+        workflow = DAGWorkflow()
+        workflow.add("themes", themes_task)
+        # Deep analysis and local research both start from the themes and run concurrently
+        workflow.add("analysis", analysis_task, ["themes"])
+        workflow.add("research", research_task, ["themes"])
+        workflow.add("route", route_task, ["research"])
+        workflow.add("itinerary", itinerary_task, ["route"])
+        # Script and calendar both depend only on earlier steps, so they share the last phase
+        workflow.add("script", script_task, ["itinerary", "analysis"])
+        if participants:
+            workflow.add("calendar", calendar_task, ["itinerary"])
+        return workflow
+    
+    @sampled_op()
+    @_memoized("pipeline")
+    async def run_full(self, video_url: str, location: str, date: str, participants: list = None,
+                       duration: str = "full-day", transportation_mode: str = "driving",
+                       podcast_theme: str = None, stop_after=None):
+        """
+        Run the pipeline as one workflow, optionally stopping after a given step.
         
-        itinerary_task = Task(
-            description=f"""
-            Create a complete {duration} itinerary incorporating the route with shareable links.
-            Include timing, logistics, and calendar-ready descriptions.
-            """,
-            agent=itinerary_designer,
-            expected_output="Complete itinerary with navigation links",
-            context=[route_task]
-        )
+        Intermediate results stay inside the workflow as task context instead of
+        being returned to the caller and re-embedded into the next call's prompts.
         
-        script_task = Task(
-            description=f"""
-            Create an engaging podcast script based on the planned itinerary.
-            Theme: {podcast_theme or 'Local Experience Adventure'}
-            """,
-            agent=podcast_creator,
-            expected_output="Podcast script with production notes",
-            context=[itinerary_task]
+        Args:
+            video_url: YouTube video URL
+            location: Target location
+            date: Target date
+            participants: Participant emails for calendar events
+            duration: Itinerary length
+            transportation_mode: Travel mode for routing
+            podcast_theme: Optional podcast theme
+            stop_after: Last step or steps to run ("themes", "analysis", "research",
+                "route", "itinerary", "script" or, with participants, "calendar");
+                runs everything if None
+            
+        Returns:
+            Task outputs in workflow order
+        """
+        workflow = self._pipeline_workflow(
+            video_url, location, date, participants or [],
+            duration, transportation_mode, podcast_theme
         )
+        if stop_after:
+            workflow = workflow.until(*([stop_after] if isinstance(stop_after, str) else stop_after))
         
-        calendar_task = Task(
-            description=f"""
-            Create calendar events for participants: {participants}
-            Include shareable Google Maps links from the itinerary in each event description.
-            Ensure seamless navigation for all participants.
-            """,
-            agent=calendar_manager,
-            expected_output="Calendar events with embedded navigation links",
-            context=[itinerary_task]
+        return await self._run_workflow(workflow)
+    
+    async def stream_full(self, video_url: str, location: str, date: str, participants: list = None,
+                          duration: str = "full-day", transportation_mode: str = "driving",
+                          podcast_theme: str = None, stop_after=None):
+        """
+        Run the pipeline like run_full, yielding each task's output as soon as it is ready.
+        
+        Callers can act on early results (e.g. show the research while the route is
+        still being planned) instead of waiting for the last task to finish.
+        
+        Args:
+            Same as run_full
+            
+        Yields:
+            Task outputs in completion order
+        """
+        workflow = self._pipeline_workflow(
+            video_url, location, date, participants or [],
+            duration, transportation_mode, podcast_theme
         )
+        if stop_after:
+            workflow = workflow.until(*([stop_after] if isinstance(stop_after, str) else stop_after))
+        
+        if self._manager_crew is not None:
+            # The manager runs every task inside one kickoff, so there is nothing to stream early
+            tasks = [task for phase in workflow.phases() for task in phase]
+            result = await asyncio.to_thread(self._kickoff, self._manager_crew, tasks)
+            for output in result.tasks_output:
+                yield output
+            return
         
-        return self._execute_workflow([
-            analysis_task, research_task, route_task, 
-            itinerary_task, script_task, calendar_task
-        ])
+        async for output in self._stream_workflow(workflow):
+            yield output
     
     # Individual agent testing methods
-    @weave.op()
+    @sampled_op()
     def test_youtube_analyst(self, video_url: str):
         """Test YouTube analyst individually."""
-        task = Task(
-            description=f"Analyze YouTube video: {video_url}. Extract topics, themes, and insights.",
-            agent=youtube_analyst,
-            expected_output="Analysis results with topics and themes"
-        )
+        task = self._from_template("youtube_analyst", TEST_TASK_DESCRIPTIONS["youtube_analyst"].format(video_url=video_url))
         return self._execute_workflow([task])
     
-    @weave.op()
+    @sampled_op()
     def test_local_researcher(self, topics: list, location: str, date: str):
         """Test local researcher individually."""
-        task = Task(
-            description=f"Find local experiences in {location} on {date} for topics: {topics}",
-            agent=local_researcher,
-            expected_output="List of relevant local experiences"
-        )
+        if not topics:
+            return []  # Nothing to research
+        task = self._from_template("local_researcher", TEST_TASK_DESCRIPTIONS["local_researcher"].format(
+            location=location, date=date, topics=self._canonical(topics)
+        ))
         return self._execute_workflow([task])
     
-    @weave.op()
+    @sampled_op()
     def test_route_planner(self, experiences: list, start_location: str):
         """Test route planner individually."""
-        locations = [exp.get('location', '') for exp in experiences]
-        task = Task(
-            description=f"Plan optimized route from {start_location} through {locations} with shareable links",
-            agent=route_planner,
-            expected_output="Route with Google Maps links"
-        )
+        locations = _experience_locations(experiences)
+        if not locations:
+            return []  # Nothing to route
+        task = self._from_template("route_planner", TEST_TASK_DESCRIPTIONS["route_planner"].format(
+            start_location=start_location, locations=self._canonical(locations)
+        ))
         return self._execute_workflow([task])
     
-    @weave.op()
+    @sampled_op()
     def test_itinerary_designer(self, experiences: list, date: str):
         """Test itinerary designer individually."""
-        task = Task(
-            description=f"Create itinerary for {date} with experiences: {experiences}",
-            agent=itinerary_designer,
-            expected_output="Detailed itinerary with timing"
-        )
+        if not experiences:
+            return []  # Nothing to schedule
+        task = self._from_template("itinerary_designer", TEST_TASK_DESCRIPTIONS["itinerary_designer"].format(
+            date=date, experiences=self._canonical(experiences)
+        ))
         return self._execute_workflow([task])
     
-    @weave.op()
+    @sampled_op()
+    @_memoized("script")
     def test_podcast_creator(self, itinerary: dict, theme: str):
         """Test podcast creator individually."""
-        task = Task(
-            description=f"Create podcast script for itinerary: {itinerary} with theme: {theme}",
-            agent=podcast_creator,
-            expected_output="Podcast script with production notes"
-        )
+        task = self._from_template("podcast_creator", TEST_TASK_DESCRIPTIONS["podcast_creator"].format(
+            itinerary=self._canonical(_project_for_podcast(itinerary)), theme=theme
+        ))
         return self._execute_workflow([task])
     
-    @weave.op()
+    @sampled_op()
     def test_calendar_manager(self, itinerary: dict, participants: list):
         """Test calendar manager individually."""
-        task = Task(
-            description=f"Create calendar events for itinerary: {itinerary} with participants: {participants}",
-            agent=calendar_manager,
-            expected_output="Calendar events with navigation links"
-        )
+        task = self._from_template("calendar_manager", TEST_TASK_DESCRIPTIONS["calendar_manager"].format(
+            itinerary=self._canonical(_project_for_calendar(itinerary)), participants=self._canonical(participants)
+        ))
         return self._execute_workflow([task])
 
 
-# Create the main crew instance for import
-crew = ContentCreationCrew()
+def __getattr__(name: str):
+    """Create the shared crew instance (and load every agent) only when it is imported."""
+    if name == "crew":
+        globals()["crew"] = ContentCreationCrew()
+        return globals()["crew"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Example usage and testing
 if __name__ == "__main__":
+    crew = ContentCreationCrew()
+    
     # Initialize Weave tracking
+    import weave
     weave.init("content-creation-crew")
     
     print("🎯 CrewAI Content Creation Orchestrator")
@@ -6,9 +6,11 @@ test cases and metrics for quality assessment.
 """
 
 import os
+import re
 import sys
 import json
 import asyncio
+import functools
 import weave
 from pathlib import Path
 from datetime import datetime
@@ -20,6 +22,179 @@ sys.path.append(str(Path(__file__).parent))
 from adventure_crew import transform_transcript_to_adventure
 from weave_custom.trace_hooks import setup_weave_tracing
 
+# Test cases are dominated by LLM and MCP latency, so several run at once; the cap
+# keeps a large suite from tripping provider rate limits
+EVAL_MAX_PARALLEL = int(os.getenv("EVAL_MAX_PARALLEL", "3"))
+
+# Results are saved as compact JSON; indenting them is opt-in
+EVAL_PRETTY_JSON = os.getenv("EVAL_PRETTY_JSON", "false").lower() == "true"
+
+# Theme coverage can be scored by embedding similarity, so "architectural" counts
+# toward "architecture"; opt-in because it adds embedding calls and shifts scores
+EVAL_EMBEDDINGS = os.getenv("EVAL_EMBEDDINGS", "false").lower() == "true"
+EVAL_EMBEDDING_MODEL = os.getenv("EVAL_EMBEDDING_MODEL", "gemini/text-embedding-004")
+
+# Single-word keywords are matched by stem against the content's words, so "stories",
+# "explored" and "adventures" count for story, explore and adventure while "photo"
+# still doesn't count "photography". Multi-word and hyphenated keywords are matched
+# as substrings: pyahocorasick finds them all in one pass over the content, and
+# without it a single regex alternation does the same scan
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@functools.lru_cache(maxsize=65536)
+def _stem(word: str) -> str:
+    """
+    Strip common inflectional suffixes so the forms of one word compare equal.
+    
+    Deliberately light: plurals, -ed/-ing, and a trailing -al or -e, which is
+    enough for adventure/adventures, explore/explored, story/stories and
+    architecture/architectural without conflating unrelated words.
+    
+    Args:
+        word: Lowercase word
+        
+    Returns:
+        The word's stem
+    """
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif (len(word) > 4 and word.endswith("es") and word[-3] in "sxz") or word.endswith(("ches", "shes")):
+        word = word[:-2]
+    elif len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    
+    if len(word) > 5 and word.endswith("ing"):
+        word = word[:-3]
+    elif len(word) > 4 and word.endswith("ied"):
+        word = word[:-3] + "y"
+    elif len(word) > 4 and word.endswith("ed"):
+        word = word[:-2]
+    
+    if len(word) > 5 and word.endswith("al"):
+        word = word[:-2]
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+CREATIVE_INDICATORS = (
+    "adventure", "explore", "discover", "experience",
+    "journey", "immersive", "story", "narrative"
+)
+FEASIBILITY_INDICATORS = (
+    "location", "address", "hours", "cost", "duration",
+    "transportation", "accessibility", "nearby"
+)
+ENGAGEMENT_INDICATORS = (
+    "photo", "share", "social", "experience", "memorable",
+    "interactive", "hands-on", "participate", "engage"
+)
+
+
+class _KeywordScanner:
+    """Finds which of a fixed set of keywords occur in lowercase text."""
+    
+    def __init__(self, keywords):
+        self.keywords = frozenset(keyword.lower() for keyword in keywords)
+        words = {keyword for keyword in self.keywords if _WORD_RE.fullmatch(keyword)}
+        phrases = self.keywords - words
+        
+        # Stem -> the single-word keywords with that stem
+        self._stems = {}
+        for word in words:
+            self._stems.setdefault(_stem(word), set()).add(word)
+        
+        # A phrase inside a longer one is present whenever the longer one is; the
+        # regex reports one match per position, so those are added after the scan
+        self._implied = {
+            phrase: {other for other in phrases if other != phrase and other in phrase}
+            for phrase in phrases
+        }
+        
+        # The evaluators of one test case scan the same string; the last result is reused
+        self._last = (None, frozenset())
+        
+        self._automaton = self._pattern = None
+        if not phrases:
+            return
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+        else:
+            # Lookahead so overlapping phrases are all seen; longest first at each position
+            alternation = "|".join(map(re.escape, sorted(phrases, key=len, reverse=True)))
+            self._pattern = re.compile(f"(?=({alternation}))")
+    
+    def scan(self, text: str) -> set:
+        """
+        Keywords that occur in text.
+        
+        Args:
+            text: Already lowercased content
+            
+        Returns:
+            Set of the (lowercase) keywords found
+        """
+        last_text, last_found = self._last
+        if text is last_text:
+            return last_found
+        
+        if self._automaton is not None:
+            found = {phrase for _, phrase in self._automaton.iter(text)}
+        elif self._pattern is not None:
+            found = set(self._pattern.findall(text))
+        else:
+            found = set()
+        
+        for phrase in list(found):
+            found |= self._implied[phrase]
+        if self._stems:
+            for stem in {_stem(word) for word in set(_WORD_RE.findall(text))} & self._stems.keys():
+                found |= self._stems[stem]
+        found = frozenset(found)
+        self._last = (text, found)
+        return found
+
+
+@functools.lru_cache(maxsize=64)
+def _theme_scanner(themes: tuple) -> _KeywordScanner:
+    """Scanner for one test case's expected themes, reused across runs."""
+    return _KeywordScanner(themes)
+
+
+def _embed(texts: List[str], batch_size: int = 100):
+    """
+    Embed texts with as few requests as the provider allows.
+    
+    Args:
+        texts: Texts to embed
+        batch_size: Maximum texts per request (Gemini accepts 100)
+        
+    Returns:
+        numpy array with one unit-length row per text
+    """
+    import litellm
+    import numpy as np
+    
+    rows = []
+    for start in range(0, len(texts), batch_size):
+        response = litellm.embedding(
+            model=EVAL_EMBEDDING_MODEL,
+            input=texts[start:start + batch_size],
+            api_key=os.getenv("GEMINI_API_KEY")
+        )
+        rows.extend(item["embedding"] for item in response.data)
+    vectors = np.array(rows, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
 class AdventureEvaluator:
     """Evaluates adventure transformation system using Weave."""
     
@@ -27,6 +202,15 @@ class AdventureEvaluator:
         self.project_name = project_name
         self.test_cases = []
         self.results = []
+        # weave.log payloads from the active full run, sent together once it finishes;
+        # None while no full run is active, so single evaluations log directly
+        self._pending_logs = None
+        # All three evaluators' indicators, matched in a single scan of the content
+        self._indicator_scanner = _KeywordScanner(
+            CREATIVE_INDICATORS + FEASIBILITY_INDICATORS + ENGAGEMENT_INDICATORS
+        )
+        # Expected theme embeddings per theme tuple, computed once per evaluator
+        self._theme_embeddings = {}
         
     def initialize_weave(self):
         """Initialize Weave for evaluation tracking."""
@@ -46,39 +230,26 @@ class AdventureEvaluator:
         })
         
     @weave.op(name="evaluate_creativity")
-    def evaluate_creativity(self, result: Any, expected_themes: List[str]) -> Dict[str, Any]:
-        """Evaluate the creativity of generated adventure ideas."""
+    def evaluate_creativity(self, content_lower: str, expected_themes: List[str],
+                            semantic: bool = EVAL_EMBEDDINGS) -> Dict[str, Any]:
+        """Evaluate the creativity of generated adventure ideas (semantic: embed the themes)."""
         try:
-            # Extract adventure ideas from result
-            if hasattr(result, 'output') and result.output:
-                content = str(result.output)
-            else:
-                content = str(result)
-                
-            # Simple creativity metrics
-            creativity_score = 0
-            themes_found = []
-            
             # Check for expected themes
-            for theme in expected_themes:
-                if theme.lower() in content.lower():
-                    themes_found.append(theme)
-                    creativity_score += 1
+            theme_hits = _theme_scanner(tuple(expected_themes)).scan(content_lower)
+            themes_found = [theme for theme in expected_themes if theme.lower() in theme_hits]
                     
             # Check for creative elements
-            creative_indicators = [
-                "adventure", "explore", "discover", "experience",
-                "journey", "immersive", "story", "narrative"
-            ]
-            
-            creative_elements = 0
-            for indicator in creative_indicators:
-                if indicator.lower() in content.lower():
-                    creative_elements += 1
+            hits = self._indicator_scanner.scan(content_lower)
+            creative_elements = sum(indicator in hits for indicator in CREATIVE_INDICATORS)
                     
             # Calculate final score
             theme_score = len(themes_found) / len(expected_themes) if expected_themes else 0
-            creative_score = min(creative_elements / len(creative_indicators), 1.0)
+            if semantic and expected_themes:
+                try:
+                    theme_score = self._semantic_theme_score(content_lower, expected_themes)
+                except Exception as e:
+                    print(f"⚠️  Warning: Embedding theme score unavailable, using keyword match: {e}")
+            creative_score = min(creative_elements / len(CREATIVE_INDICATORS), 1.0)
             final_score = (theme_score + creative_score) / 2
             
             return {
@@ -87,7 +258,7 @@ class AdventureEvaluator:
                 "creative_elements": creative_elements,
                 "theme_coverage": theme_score,
                 "creative_richness": creative_score,
-                "content_length": len(content)
+                "content_length": len(content_lower)
             }
             
         except Exception as e:
@@ -98,31 +269,36 @@ class AdventureEvaluator:
                 "creative_elements": 0
             }
             
+    def _semantic_theme_score(self, content: str, expected_themes: List[str]) -> float:
+        """
+        Theme coverage as the mean cosine similarity between the content and each theme.
+        
+        Args:
+            content: Evaluated content
+            expected_themes: Themes the content should cover
+            
+        Returns:
+            Score clipped to [0, 1]
+        """
+        key = tuple(expected_themes)
+        theme_vectors = self._theme_embeddings.get(key)
+        if theme_vectors is None:
+            theme_vectors = self._theme_embeddings[key] = _embed(list(key))
+        
+        similarities = _embed([content]) @ theme_vectors.T
+        return min(max(float(similarities.mean()), 0.0), 1.0)
+            
     @weave.op(name="evaluate_feasibility")
-    def evaluate_feasibility(self, result: Any) -> Dict[str, Any]:
+    def evaluate_feasibility(self, content_lower: str) -> Dict[str, Any]:
         """Evaluate the feasibility of generated adventures."""
         try:
-            if hasattr(result, 'output') and result.output:
-                content = str(result.output)
-            else:
-                content = str(result)
-                
             # Check for feasibility indicators
-            feasibility_indicators = [
-                "location", "address", "hours", "cost", "duration",
-                "transportation", "accessibility", "nearby"
-            ]
-            
-            feasibility_score = 0
-            indicators_found = []
-            
-            for indicator in feasibility_indicators:
-                if indicator.lower() in content.lower():
-                    indicators_found.append(indicator)
-                    feasibility_score += 1
+            hits = self._indicator_scanner.scan(content_lower)
+            indicators_found = [indicator for indicator in FEASIBILITY_INDICATORS if indicator in hits]
+            feasibility_score = len(indicators_found)
                     
             # Calculate score
-            final_score = min(feasibility_score / len(feasibility_indicators), 1.0)
+            final_score = min(feasibility_score / len(FEASIBILITY_INDICATORS), 1.0)
             
             return {
                 "feasibility_score": final_score,
@@ -141,30 +317,16 @@ class AdventureEvaluator:
             }
             
     @weave.op(name="evaluate_engagement")
-    def evaluate_engagement(self, result: Any) -> Dict[str, Any]:
+    def evaluate_engagement(self, content_lower: str) -> Dict[str, Any]:
         """Evaluate the engagement level of generated adventures."""
         try:
-            if hasattr(result, 'output') and result.output:
-                content = str(result.output)
-            else:
-                content = str(result)
-                
             # Check for engagement indicators
-            engagement_indicators = [
-                "photo", "share", "social", "experience", "memorable",
-                "interactive", "hands-on", "participate", "engage"
-            ]
-            
-            engagement_score = 0
-            indicators_found = []
-            
-            for indicator in engagement_indicators:
-                if indicator.lower() in content.lower():
-                    indicators_found.append(indicator)
-                    engagement_score += 1
+            hits = self._indicator_scanner.scan(content_lower)
+            indicators_found = [indicator for indicator in ENGAGEMENT_INDICATORS if indicator in hits]
+            engagement_score = len(indicators_found)
                     
             # Calculate score
-            final_score = min(engagement_score / len(engagement_indicators), 1.0)
+            final_score = min(engagement_score / len(ENGAGEMENT_INDICATORS), 1.0)
             
             return {
                 "engagement_score": final_score,
@@ -183,30 +345,51 @@ class AdventureEvaluator:
             }
             
     @weave.op(name="run_single_evaluation")
-    def run_single_evaluation(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
-        """Run evaluation for a single test case."""
+    def run_single_evaluation(self, test_case: Dict[str, Any], timestamp: Optional[str] = None,
+                              defer_embeddings: bool = False) -> Dict[str, Any]:
+        """
+        Run evaluation for a single test case.
+        
+        Args:
+            test_case: Test case to run
+            timestamp: Timestamp for the result (default: now)
+            defer_embeddings: Score themes by keyword and keep the content under
+                "_content", so the caller can embed a whole run at once
+                
+        Returns:
+            Evaluation result
+        """
         print(f"\n🧪 Testing: {test_case['name']}")
+        timestamp = timestamp or datetime.now().isoformat()
         
-        # Create temporary transcript file
-        transcript_file = f"test_transcript_{test_case['name'].replace(' ', '_')}.txt"
-        with open(transcript_file, 'w', encoding='utf-8') as f:
-            f.write(test_case['transcript_content'])
-            
         try:
             # Transform transcript to adventure
             with weave.trace(name=f"test_case_{test_case['name']}") as trace:
                 trace.add_tag("test_case", test_case['name'])
                 trace.add_tag("expected_themes", test_case['expected_themes'])
                 
+                # The transcript is passed in memory, so no temporary file is written.
+                # Scores come from the returned result, and test cases run in parallel,
+                # so the task output files are not written at all. The adventure cache
+                # is bypassed so every run measures the current crew.
                 result = transform_transcript_to_adventure(
-                    transcript_file=transcript_file,
-                    user_location="Test City"
+                    transcript_text=test_case['transcript_content'],
+                    user_location="Test City",
+                    artifact_dir=None,
+                    use_cache=False
                 )
                 
+                # Stringify and lowercase the output once for all three evaluators
+                content = str(result.output) if getattr(result, 'output', None) else str(result)
+                content_lower = content.lower()
+                
                 # Evaluate different aspects
-                creativity_eval = self.evaluate_creativity(result, test_case['expected_themes'])
-                feasibility_eval = self.evaluate_feasibility(result)
-                engagement_eval = self.evaluate_engagement(result)
+                creativity_eval = self.evaluate_creativity(
+                    content_lower, test_case['expected_themes'],
+                    semantic=EVAL_EMBEDDINGS and not defer_embeddings
+                )
+                feasibility_eval = self.evaluate_feasibility(content_lower)
+                engagement_eval = self.evaluate_engagement(content_lower)
                 
                 # Calculate overall score
                 overall_score = (
@@ -221,10 +404,13 @@ class AdventureEvaluator:
                     "creativity": creativity_eval,
                     "feasibility": feasibility_eval,
                     "engagement": engagement_eval,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "success": True
                 }
                 
+                if defer_embeddings:
+                    evaluation_result["_content"] = content_lower
+                
                 trace.add_tag("overall_score", overall_score)
                 trace.add_tag("status", "completed")
                 
@@ -236,79 +422,153 @@ class AdventureEvaluator:
                 "error": str(e),
                 "overall_score": 0,
                 "success": False,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
-            weave.log({
+            error_log = {
                 "test_case_error": test_case['name'],
                 "error": str(e)
-            })
+            }
+            if self._pending_logs is None:
+                weave.log(error_log)
+            else:
+                self._pending_logs.append(error_log)
             
             return error_result
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(transcript_file):
-                os.remove(transcript_file)
                 
+    def _apply_semantic_theme_scores(self, results: List[Dict[str, Any]]):
+        """
+        Rescore theme coverage by embedding similarity for a whole run.
+        
+        Every result's content and every distinct expected theme are embedded
+        together, and all similarities come from one matrix product.
+        
+        Args:
+            results: run_single_evaluation results with "_content", in test case order
+        """
+        pending = []
+        for result, test_case in zip(results, self.test_cases):
+            content = result.pop("_content", None)
+            if content is not None and test_case['expected_themes'] and "creative_richness" in result['creativity']:
+                pending.append((result, test_case['expected_themes'], content))
+        if not pending:
+            return
+        
+        themes = list(dict.fromkeys(theme for _, expected, _ in pending for theme in expected))
+        try:
+            vectors = _embed([content for _, _, content in pending] + themes)
+        except Exception as e:
+            print(f"⚠️  Warning: Embedding theme scores unavailable, keeping keyword match: {e}")
+            return
+        
+        similarities = vectors[:len(pending)] @ vectors[len(pending):].T
+        column = {theme: index for index, theme in enumerate(themes)}
+        
+        for row, (result, expected, _) in enumerate(pending):
+            theme_score = float(similarities[row, [column[theme] for theme in expected]].mean())
+            theme_score = min(max(theme_score, 0.0), 1.0)
+            
+            creativity = result['creativity']
+            creativity['theme_coverage'] = theme_score
+            creativity['creativity_score'] = (theme_score + creativity['creative_richness']) / 2
+            result['overall_score'] = (
+                creativity['creativity_score'] +
+                result['feasibility']['feasibility_score'] +
+                result['engagement']['engagement_score']
+            ) / 3
+        
+    def run_full_evaluation(self, max_workers: int = EVAL_MAX_PARALLEL) -> Dict[str, Any]:
+        """Synchronous wrapper for run_full_evaluation_async."""
+        return asyncio.run(self.run_full_evaluation_async(max_workers))
+        
     @weave.op(name="run_full_evaluation")
-    def run_full_evaluation(self) -> Dict[str, Any]:
-        """Run complete evaluation suite."""
+    async def run_full_evaluation_async(self, max_workers: int = EVAL_MAX_PARALLEL) -> Dict[str, Any]:
+        """
+        Run complete evaluation suite, several test cases at a time.
+        
+        Args:
+            max_workers: Maximum number of test cases running at the same time
+            
+        Returns:
+            Evaluation summary with per-test results in test case order
+        """
         print("🔬 Starting Adventure System Evaluation")
         print("=" * 60)
         
         # Initialize Weave
         self.initialize_weave()
         
-        # Log evaluation start
-        weave.log({
-            "evaluation_start": datetime.now().isoformat(),
+        # One timestamp identifies the whole run: its start log, results, and summary
+        run_timestamp = datetime.now().isoformat()
+        
+        # Log evaluation start (flushed with the summary)
+        self._pending_logs = [{
+            "evaluation_start": run_timestamp,
             "num_test_cases": len(self.test_cases),
             "project": self.project_name
-        })
+        }]
         
-        # Run all test cases
-        results = []
-        for test_case in self.test_cases:
-            result = self.run_single_evaluation(test_case)
-            results.append(result)
+        summary = {}
+        try:
+            # Run all test cases; each one blocks on the crew, so it gets its own thread
+            slots = asyncio.Semaphore(max_workers)
             
-            # Display result
-            if result['success']:
-                print(f"   ✅ {result['test_case']}: {result['overall_score']:.2f}/1.0")
-            else:
-                print(f"   ❌ {result['test_case']}: FAILED")
+            async def run(test_case):
+                async with slots:
+                    return await asyncio.to_thread(
+                        self.run_single_evaluation, test_case, run_timestamp, EVAL_EMBEDDINGS
+                    )
+            
+            results = await asyncio.gather(*(run(test_case) for test_case in self.test_cases))
+            if EVAL_EMBEDDINGS:
+                self._apply_semantic_theme_scores(results)
+            
+            for result in results:
+                # Display result
+                if result['success']:
+                    print(f"   ✅ {result['test_case']}: {result['overall_score']:.2f}/1.0")
+                else:
+                    print(f"   ❌ {result['test_case']}: FAILED")
+                    
+            # Calculate summary statistics
+            successful_tests = [r for r in results if r['success']]
+            total_tests = len(results)
+            success_rate = len(successful_tests) / total_tests if total_tests > 0 else 0
+            
+            # One pass over the results for all four averages
+            total_score = total_creativity = total_feasibility = total_engagement = 0
+            for r in successful_tests:
+                total_score += r['overall_score']
+                total_creativity += r['creativity']['creativity_score']
+                total_feasibility += r['feasibility']['feasibility_score']
+                total_engagement += r['engagement']['engagement_score']
+            
+            count = len(successful_tests) or 1
+            avg_score = total_score / count
+            avg_creativity = total_creativity / count
+            avg_feasibility = total_feasibility / count
+            avg_engagement = total_engagement / count
                 
-        # Calculate summary statistics
-        successful_tests = [r for r in results if r['success']]
-        total_tests = len(results)
-        success_rate = len(successful_tests) / total_tests if total_tests > 0 else 0
-        
-        if successful_tests:
-            avg_score = sum(r['overall_score'] for r in successful_tests) / len(successful_tests)
-            avg_creativity = sum(r['creativity']['creativity_score'] for r in successful_tests) / len(successful_tests)
-            avg_feasibility = sum(r['feasibility']['feasibility_score'] for r in successful_tests) / len(successful_tests)
-            avg_engagement = sum(r['engagement']['engagement_score'] for r in successful_tests) / len(successful_tests)
-        else:
-            avg_score = avg_creativity = avg_feasibility = avg_engagement = 0
+            # Create summary
+            summary = {
+                "evaluation_summary": {
+                    "total_tests": total_tests,
+                    "successful_tests": len(successful_tests),
+                    "success_rate": success_rate,
+                    "average_overall_score": avg_score,
+                    "average_creativity": avg_creativity,
+                    "average_feasibility": avg_feasibility,
+                    "average_engagement": avg_engagement,
+                    "timestamp": run_timestamp
+                },
+                "individual_results": results
+            }
             
-        # Create summary
-        summary = {
-            "evaluation_summary": {
-                "total_tests": total_tests,
-                "successful_tests": len(successful_tests),
-                "success_rate": success_rate,
-                "average_overall_score": avg_score,
-                "average_creativity": avg_creativity,
-                "average_feasibility": avg_feasibility,
-                "average_engagement": avg_engagement,
-                "timestamp": datetime.now().isoformat()
-            },
-            "individual_results": results
-        }
-        
-        # Log summary
-        weave.log(summary)
+        finally:
+            # Log the summary together with everything buffered during the run in one
+            # call; a run that fails part-way still sends what it buffered
+            weave.log({**summary, "batch": self._pending_logs})
+            self._pending_logs = None
         
         # Display summary
         print("\n📊 Evaluation Summary:")
@@ -393,8 +653,15 @@ def main():
         
         # Save results
         results_file = f"evaluation_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
+        if EVAL_PRETTY_JSON:
+            payload = json.dumps(results, indent=2, ensure_ascii=False)
+        else:
+            payload = json.dumps(results, ensure_ascii=False, separators=(',', ':'))
+        # Written beside the target and renamed, so an interrupted save leaves no partial file
+        tmp_file = f"{results_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_file, results_file)
             
         print(f"\n💾 Results saved to: {results_file}")
         print("🔍 Check Weave dashboard for detailed traces and metrics")
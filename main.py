@@ -17,7 +17,6 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from weave_custom import setup_weave_tracing
-from crew import ContentCreationCrew
 
 
 class CrewAIMCPApp:
@@ -27,15 +26,18 @@ class CrewAIMCPApp:
     
     def __init__(self):
         self.weave_initialized = False
-        self._setup_components()
+        self._crew = None
     
-    def _setup_components(self):
-        """Initialize content creation crew."""
-        
-        # Initialize content creation crew (proper CrewAI structure)
-        self.crew = ContentCreationCrew()
-        
-        print("✅ CrewAI MCP components initialized with proper crew structure")
+    @property
+    def crew(self):
+        """Content creation crew, built on the first command that needs it."""
+        if self._crew is None:
+            # Deferred so help, status and exit never import CrewAI or build the agents
+            from crew import ContentCreationCrew
+            
+            self._crew = ContentCreationCrew()
+            print("✅ CrewAI MCP components initialized with proper crew structure")
+        return self._crew
     
     def initialize_weave(self, project_name: str = "crewai-mcp-pipeline", api_key: str = None):
         """
@@ -67,7 +69,7 @@ class CrewAIMCPApp:
         """
         print(f"🎬 Analyzing YouTube content: {video_url}")
         
-        result = self.crew.analyze_content(video_url, location, date)
+        result = await self.crew.analyze_content_async(video_url, location, date)
         
         print(f"✅ Analysis complete")
         return result
@@ -91,7 +93,7 @@ class CrewAIMCPApp:
         print(f"   Location: {location}")
         print(f"   Date: {date}")
         
-        result = self.crew.complete_pipeline(
+        result = await self.crew.complete_pipeline_async(
             video_url, location, date, participants or []
         )
         
@@ -131,7 +133,7 @@ class CrewAIMCPApp:
         """
         print(f"🗺️  Planning routes for {len(experiences)} experiences")
         
-        result = self.crew.plan_experience(experiences, location, date, "full-day")
+        result = await self.crew.plan_experience_async(experiences, location, date, "full-day")
         
         print(f"✅ Route planning complete")
         return result
@@ -172,7 +174,7 @@ Examples:
         print(f"""
 System Status:
   Weave Tracing: {'✅ Enabled' if self.weave_initialized else '❌ Disabled'}
-  Content Crew: ✅ Loaded (6 specialized agents)
+  Content Crew: {'✅ Loaded (6 specialized agents)' if self._crew else '⏳ Loads on first command'}
   Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """)
     
@@ -7,6 +7,7 @@ Provides video analysis, caption extraction, and metadata retrieval capabilities
 
 import os
 import json
+import asyncio
 from typing import Dict, Any, List, Optional
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
@@ -69,6 +70,8 @@ class YouTubeServer:
                 return await self._get_metadata(args)
             elif method == "extract_themes":
                 return await self._extract_themes(args)
+            elif method == "process":
+                return await self._process_video(args)
             else:
                 raise HTTPException(status_code=400, detail=f"Unknown method: {method}")
         
@@ -234,6 +237,39 @@ class YouTubeServer:
         return result
 
 
+    async def _process_video(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get metadata, captions, and analysis for one video in a single request.
+        
+        Args:
+            args: Parameters including video_url, analysis_type, language, and
+                optionally want (a subset of "metadata", "transcript", "analysis")
+            
+        Returns:
+            Dictionary with one entry per requested part
+        """
+        
+        video_url = args.get("video_url")
+        
+        if not video_url:
+            raise HTTPException(status_code=400, detail="video_url is required")
+        
+        handlers = {
+            "metadata": self._get_metadata,
+            "transcript": self._get_captions,
+            "analysis": self._analyze_video
+        }
+        want = [part for part in args.get("want", list(handlers)) if part in handlers]
+        
+        # The parts are independent, so they are fetched concurrently
+        results = await asyncio.gather(*(handlers[part](args) for part in want))
+        bundle = dict(zip(want, results))
+        if "transcript" in bundle:
+            bundle["transcript"] = bundle["transcript"].get("captions", "")
+        
+        return {"video_url": video_url, **bundle}
+
+
 # Factory function to create server instance
 def create_youtube_server() -> YouTubeServer:
     """Create and return a YouTube MCP server instance."""
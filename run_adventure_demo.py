@@ -100,8 +100,9 @@ def run_adventure_demo():
         
         # Check and display generated files
         expected_files = [
-            "adventure_ideas.md",
-            "adventure_research.md", 
+            "adventure_ideas.json",
+            "adventure_context.json",
+            "adventure_research.json", 
             "adventure_complete.md"
         ]
         
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Crew Workflow Test Suite
+
+Checks how DAGWorkflow groups tasks into parallel phases, trims itself to the
+tasks a target needs, and rejects broken dependency graphs.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# crew.py needs the project's schema dependencies; CrewAI itself is loaded lazily
+pytest.importorskip("pydantic")
+
+from crew import DAGWorkflow
+
+
+def _workflow(edges):
+    """Build a workflow of stand-in tasks from {name: deps}."""
+    workflow = DAGWorkflow()
+    for name, deps in edges.items():
+        workflow.add(name, SimpleNamespace(name=name, context=None), deps)
+    return workflow
+
+
+def _names(phases):
+    """Task names per phase, sorted within a phase."""
+    return [sorted(task.name for task in phase) for phase in phases]
+
+
+def test_phases_group_independent_tasks():
+    """Tasks whose dependencies are all done share a phase."""
+    workflow = _workflow({
+        "analyze": [],
+        "research": ["analyze"],
+        "plan": ["analyze"],
+        "itinerary": ["research", "plan"],
+        "calendar": ["itinerary"],
+        "podcast": ["itinerary"]
+    })
+    
+    assert _names(workflow.phases()) == [
+        ["analyze"], ["plan", "research"], ["itinerary"], ["calendar", "podcast"]
+    ]
+
+
+def test_phases_wire_context_from_dependencies():
+    """Each task's context is its dependencies' tasks, in declared order."""
+    workflow = _workflow({"a": [], "b": [], "c": ["b", "a"]})
+    
+    workflow.phases()
+    
+    tasks = {name: task for name, (task, _) in workflow.nodes.items()}
+    assert tasks["c"].context == [tasks["b"], tasks["a"]]
+    assert tasks["a"].context is None
+
+
+def test_until_keeps_only_needed_tasks():
+    """until() keeps the targets and everything they transitively depend on."""
+    workflow = _workflow({
+        "analyze": [],
+        "research": ["analyze"],
+        "plan": ["analyze"],
+        "itinerary": ["research"],
+        "podcast": ["itinerary"],
+        "calendar": ["plan"]
+    })
+    
+    subset = workflow.until("podcast")
+    
+    assert set(subset.nodes) == {"analyze", "research", "itinerary", "podcast"}
+    assert _names(subset.phases()) == [["analyze"], ["research"], ["itinerary"], ["podcast"]]
+    assert set(workflow.nodes) == {"analyze", "research", "plan", "itinerary", "podcast", "calendar"}
+
+
+def test_until_rejects_unknown_tasks():
+    """until() names the targets that aren't in the workflow."""
+    workflow = _workflow({"analyze": []})
+    
+    with pytest.raises(ValueError, match="missing"):
+        workflow.until("analyze", "missing")
+
+
+def test_cycle_is_rejected():
+    """A dependency cycle is reported instead of silently dropping tasks."""
+    workflow = _workflow({"start": [], "a": ["start", "c"], "b": ["a"], "c": ["b"]})
+    
+    with pytest.raises(ValueError, match="cycle"):
+        workflow.phases()
+
+
+def test_unknown_dependency_is_rejected():
+    """Depending on a task that was never added is an error."""
+    workflow = _workflow({"a": ["ghost"]})
+    
+    with pytest.raises(ValueError, match="ghost"):
+        workflow.phases()
+
+
+def test_duplicate_task_is_rejected():
+    """Task names are unique within a workflow."""
+    workflow = _workflow({"a": []})
+    
+    with pytest.raises(ValueError, match="Duplicate"):
+        workflow.add("a", SimpleNamespace(name="a", context=None))
+
+
+if __name__ == "__main__":
+    tests = [
+        test_phases_group_independent_tasks,
+        test_phases_wire_context_from_dependencies,
+        test_until_keeps_only_needed_tasks,
+        test_until_rejects_unknown_tasks,
+        test_cycle_is_rejected,
+        test_unknown_dependency_is_rejected,
+        test_duplicate_task_is_rejected
+    ]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
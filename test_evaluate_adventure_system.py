@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Adventure Evaluation Test Suite
+
+Pins which words the evaluation's keyword scanners count, so changes to the
+matching rules show up as test failures instead of silent score shifts.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+pytest.importorskip("weave")
+
+from evaluate_adventure_system import (
+    _KeywordScanner,
+    _stem,
+    CREATIVE_INDICATORS,
+    FEASIBILITY_INDICATORS,
+    ENGAGEMENT_INDICATORS
+)
+
+INDICATORS = CREATIVE_INDICATORS + FEASIBILITY_INDICATORS + ENGAGEMENT_INDICATORS
+
+
+def test_inflections_count_for_their_keyword():
+    """Plurals and -ed/-ing forms count for the base keyword."""
+    scanner = _KeywordScanner(INDICATORS)
+    
+    cases = [
+        ("three adventures await", "adventure"),
+        ("memorable experiences", "experience"),
+        ("we explored the old town", "explore"),
+        ("exploring the harbor", "explore"),
+        ("they discovered a mural", "discover"),
+        ("local stories and legends", "story"),
+        ("two locations nearby", "location"),
+        ("opening hours vary", "hours"),
+        ("share your photos", "photo"),
+        ("sharing is encouraged", "share"),
+        ("visitors participated", "participate")
+    ]
+    for text, keyword in cases:
+        assert keyword in scanner.scan(text), f"{keyword!r} not found in {text!r}"
+
+
+def test_longer_words_do_not_count_for_prefix_keywords():
+    """A keyword is not found inside a different, longer word."""
+    scanner = _KeywordScanner(INDICATORS)
+    
+    assert "photo" not in scanner.scan("a photography workshop")
+    assert "photo" not in scanner.scan("frame the photograph")
+    assert "social" not in scanner.scan("the historical society")
+    assert "story" not in scanner.scan("a history walk")
+
+
+def test_theme_forms_count_for_the_theme():
+    """Adjective and plural forms of a theme count toward its coverage."""
+    scanner = _KeywordScanner(("architecture", "history", "buildings", "stories", "culture"))
+    
+    found = scanner.scan("an architectural history tour past a building full of cultural story")
+    assert found == {"architecture", "history", "buildings", "stories", "culture"}
+
+
+def test_phrases_match_as_substrings():
+    """Multi-word and hyphenated keywords are matched as written."""
+    scanner = _KeywordScanner(("hands-on", "golden hour", "street food", "food"))
+    
+    assert scanner.scan("a hands-on class at golden hour") == {"hands-on", "golden hour"}
+    assert scanner.scan("street food stalls") == {"street food", "food"}
+    assert scanner.scan("hands on the golden hours") == {"golden hour"}
+
+
+def test_stem_keeps_words_without_suffixes():
+    """Words that only look inflected are left alone."""
+    for word in ("access", "status", "analysis", "nearby", "history"):
+        assert _stem(word) == word
+
+
+if __name__ == "__main__":
+    tests = [
+        test_inflections_count_for_their_keyword,
+        test_longer_words_do_not_count_for_prefix_keywords,
+        test_theme_forms_count_for_the_theme,
+        test_phrases_match_as_substrings,
+        test_stem_keeps_words_without_suffixes
+    ]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+MCP HTTP Helpers Test Suite
+
+Checks that coalesce() runs one call per key for concurrent callers, shares its
+result or exception with every waiter, and forgets the key once it settles.
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+pytest.importorskip("requests")
+
+from tools import _http
+from tools._http import coalesce
+
+WAITERS = 4
+
+
+def _run_concurrently(key, call):
+    """
+    Start one caller, let it block inside call, then add WAITERS more callers.
+    
+    Args:
+        key: Coalescing key shared by every caller
+        call: Function that blocks until the returned event is set
+    
+    Returns:
+        (release event, futures for every caller's coalesce result)
+    """
+    release = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=WAITERS + 1)
+    owner = pool.submit(coalesce, key, lambda: call(release))
+    
+    while key not in _http._INFLIGHT:
+        time.sleep(0.001)
+    waiters = [pool.submit(coalesce, key, lambda: call(release)) for _ in range(WAITERS)]
+    
+    # Give the waiters time to reach the in-flight future before the owner finishes
+    time.sleep(0.1)
+    pool.shutdown(wait=False)
+    return release, [owner] + waiters
+
+
+def test_concurrent_callers_share_one_call():
+    """Callers arriving while a request is in flight get its result without calling."""
+    calls = []
+    
+    def call(release):
+        calls.append(1)
+        release.wait(5)
+        return {"answer": 42}
+    
+    release, futures = _run_concurrently("shared", call)
+    release.set()
+    results = [future.result(timeout=5) for future in futures]
+    
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert "shared" not in _http._INFLIGHT
+
+
+def test_exception_reaches_every_waiter():
+    """A failed call raises the same exception in the owner and all waiters."""
+    calls = []
+    
+    def call(release):
+        calls.append(1)
+        release.wait(5)
+        raise ConnectionError("server down")
+    
+    release, futures = _run_concurrently("failing", call)
+    release.set()
+    
+    for future in futures:
+        with pytest.raises(ConnectionError, match="server down"):
+            future.result(timeout=5)
+    assert len(calls) == 1
+    assert "failing" not in _http._INFLIGHT
+
+
+def test_key_is_released_after_each_call():
+    """Once a call settles, the next call with that key runs again."""
+    calls = []
+    
+    def call():
+        calls.append(1)
+        return len(calls)
+    
+    def fail():
+        raise ValueError("bad")
+    
+    assert coalesce("sequential", call) == 1
+    assert coalesce("sequential", call) == 2
+    
+    with pytest.raises(ValueError):
+        coalesce("sequential", fail)
+    assert coalesce("sequential", call) == 3
+    assert "sequential" not in _http._INFLIGHT
+
+
+def test_different_keys_do_not_coalesce():
+    """Requests with different arguments each make their own call."""
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(lambda key: coalesce(key, lambda: key), ["a", "b", "c"]))
+    
+    assert results == ["a", "b", "c"]
+
+
+if __name__ == "__main__":
+    tests = [
+        test_concurrent_callers_share_one_call,
+        test_exception_reaches_every_waiter,
+        test_key_is_released_after_each_call,
+        test_different_keys_do_not_coalesce
+    ]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
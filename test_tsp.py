@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Visit Order Optimization Test Suite
+
+Checks tools/_tsp.py against brute-force optimal orders and, when Numba is
+installed, that the compiled path returns the same order as the pure one.
+"""
+
+import sys
+import random
+import itertools
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tools import _tsp
+from tools._tsp import haversine_matrix, nearest_neighbor, optimize_order, two_opt
+
+
+def _path_length(order, dist):
+    """Length of the open path from point 0 through order."""
+    path = [0] + list(order)
+    return sum(dist[a][b] for a, b in zip(path, path[1:]))
+
+
+def _random_points(seed, count):
+    """Reproducible (lat, lng) points around Seattle."""
+    rng = random.Random(seed)
+    return [(rng.uniform(47.5, 47.7), rng.uniform(-122.4, -122.2)) for _ in range(count)]
+
+
+def test_haversine_matrix():
+    """Distances are symmetric, zero on the diagonal, and in kilometres."""
+    dist = haversine_matrix([(47.6062, -122.3321), (45.5152, -122.6784)])
+    
+    assert dist[0][0] == dist[1][1] == 0.0
+    assert dist[0][1] == dist[1][0]
+    assert 230 < dist[0][1] < 236  # Seattle to Portland
+
+
+def test_scrambled_line_is_put_in_order():
+    """Stops on a straight line are visited from nearest to farthest."""
+    offsets = [0, 3, 1, 5, 2, 4, 6]
+    points = [(47.6, -122.3 + 0.01 * offset) for offset in offsets]
+    
+    order = optimize_order(points)
+    
+    assert [offsets[index] for index in order] == [1, 2, 3, 4, 5, 6]
+
+
+def test_matches_brute_force_on_small_sets():
+    """
+    On 5-7 points the order is a permutation of the stops, usually optimal,
+    and never far from the brute-force optimum.
+    """
+    ratios = []
+    for seed in range(50):
+        points = _random_points(seed, 5 + seed % 3)
+        dist = haversine_matrix(points)
+        
+        order = optimize_order(points)
+        assert sorted(order) == list(range(1, len(points)))
+        
+        best = min(_path_length(perm, dist) for perm in itertools.permutations(range(1, len(points))))
+        ratios.append(_path_length(order, dist) / best)
+    
+    assert sum(ratio < 1 + 1e-9 for ratio in ratios) >= 35
+    assert max(ratios) < 1.35
+
+
+def test_two_opt_never_lengthens_the_route():
+    """2-opt only applies reversals that shorten the path."""
+    for seed in range(20):
+        dist = haversine_matrix(_random_points(seed, 12))
+        route = nearest_neighbor(dist)
+        
+        improved = two_opt(route, dist)
+        
+        assert improved[0] == 0
+        assert sorted(improved) == sorted(route)
+        assert _path_length(improved[1:], dist) <= _path_length(route[1:], dist) + 1e-9
+
+
+def test_jit_and_pure_paths_agree():
+    """The Numba path returns the same order as the pure Python one."""
+    pytest.importorskip("numba")
+    
+    for seed in range(3):
+        points = _random_points(seed, _tsp.JIT_MIN_POINTS + 16)
+        
+        compiled = optimize_order(points)
+        with patch.object(_tsp, "_NUMBA", False):
+            pure = optimize_order(points)
+        
+        assert compiled == pure
+
+
+if __name__ == "__main__":
+    tests = [
+        test_haversine_matrix,
+        test_scrambled_line_is_put_in_order,
+        test_matches_brute_force_on_small_sets,
+        test_two_opt_never_lengthens_the_route,
+        test_jit_and_pure_paths_agree
+    ]
+    for test in tests:
+        try:
+            test()
+        except pytest.skip.Exception as e:
+            print(f"⏭️  {test.__name__}: {e}")
+        else:
+            print(f"✅ {test.__name__}")
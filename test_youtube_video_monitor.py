@@ -12,6 +12,8 @@ import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+import pytest
+
 # Add youtube_monitor to path
 youtube_monitor_path = str(Path(__file__).parent / "youtube_monitor" / "src")
 sys.path.insert(0, youtube_monitor_path)
@@ -253,6 +255,226 @@ def test_cli_interface():
         print(f"❌ CLI interface test failed: {e}")
         return False
 
+def _skip_without_monitor_deps():
+    """Skip when the monitor's YouTube client libraries aren't installed."""
+    for module in ("requests", "googleapiclient", "youtube_transcript_api"):
+        pytest.importorskip(module)
+
+def _video_response(video_id):
+    """Minimal videos().list response for one video."""
+    return {
+        'items': [{
+            'id': video_id,
+            'snippet': {
+                'title': f'Video {video_id}',
+                'description': 'Test video description',
+                'publishedAt': '2024-01-01T00:00:00Z',
+                'channelTitle': 'Test Channel',
+                'channelId': 'test_channel_id',
+                'categoryId': '22'
+            },
+            'statistics': {'viewCount': '1000'},
+            'contentDetails': {
+                'duration': 'PT10M30S',
+                'definition': 'hd',
+                'caption': 'true',
+                'licensedContent': False,
+                'projection': 'rectangular'
+            }
+        }]
+    }
+
+class FakePlaylistItems:
+    """Stands in for youtube.playlistItems(), serving fixed pages and honoring ETags."""
+    
+    def __init__(self, pages):
+        # page token (None for the first page) -> (etag, video IDs, next page token)
+        self.pages = pages
+        self.calls = []
+    
+    def list(self, part, playlistId, maxResults, pageToken=None):
+        assert maxResults == 50
+        return FakePlaylistRequest(self, pageToken)
+
+class FakePlaylistRequest:
+    """One playlistItems().list request; answers 304 when If-None-Match matches."""
+    
+    def __init__(self, playlist_items, page_token):
+        self.playlist_items = playlist_items
+        self.page_token = page_token
+        self.headers = {}
+    
+    def execute(self, num_retries=0):
+        from googleapiclient.errors import HttpError
+        
+        etag, video_ids, next_page_token = self.playlist_items.pages[self.page_token]
+        self.playlist_items.calls.append((self.page_token, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == etag:
+            raise HttpError(Mock(status=304, reason='Not Modified'), b'')
+        
+        response = {
+            'etag': etag,
+            'items': [{'contentDetails': {'videoId': video_id}} for video_id in video_ids]
+        }
+        if next_page_token:
+            response['nextPageToken'] = next_page_token
+        return response
+
+def test_playlist_pagination():
+    """Test that every page of a playlist is fetched, in order."""
+    print("\n📋 Testing Playlist Pagination...")
+    
+    _skip_without_monitor_deps()
+    
+    from monitor import YouTubeVideoMonitor
+    
+    playlist_items = FakePlaylistItems({
+        None: ('etag-1', [f'video{i:06d}' for i in range(50)], 'page-2'),
+        'page-2': ('etag-2', [f'video{i:06d}' for i in range(50, 100)], 'page-3'),
+        'page-3': ('etag-3', ['video000100'], None)
+    })
+    
+    with patch('monitor.build') as mock_build:
+        mock_build.return_value.playlistItems.return_value = playlist_items
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monitor = YouTubeVideoMonitor(api_key="test_api_key", output_dir=temp_dir, use_cache=False)
+            video_ids = monitor.get_playlist_video_ids("PLtest")
+    
+    assert video_ids == [f'video{i:06d}' for i in range(101)]
+    assert [page_token for page_token, _ in playlist_items.calls] == [None, 'page-2', 'page-3']
+    
+    print(f"✅ Fetched {len(video_ids)} videos over {len(playlist_items.calls)} pages")
+    return True
+
+def test_playlist_etag_revalidation():
+    """Test that unchanged playlist pages are revalidated and served from the cache."""
+    print("\n🏷️ Testing Playlist ETag Revalidation...")
+    
+    _skip_without_monitor_deps()
+    
+    from monitor import YouTubeVideoMonitor
+    
+    playlist_items = FakePlaylistItems({
+        None: ('etag-1', ['aaaaaaaaaaa'], 'page-2'),
+        'page-2': ('etag-2', ['bbbbbbbbbbb'], None)
+    })
+    
+    with patch('monitor.build') as mock_build:
+        mock_build.return_value.playlistItems.return_value = playlist_items
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monitor = YouTubeVideoMonitor(api_key="test_api_key", output_dir=temp_dir)
+            
+            # First run downloads both pages and stores their ETags
+            assert monitor.get_playlist_video_ids("PLtest") == ['aaaaaaaaaaa', 'bbbbbbbbbbb']
+            assert playlist_items.calls == [(None, None), ('page-2', None)]
+            assert (monitor.cache_dir / "playlist_PLtest.json").exists()
+            
+            # Second run sends If-None-Match and reuses both pages on 304
+            playlist_items.calls.clear()
+            assert monitor.get_playlist_video_ids("PLtest") == ['aaaaaaaaaaa', 'bbbbbbbbbbb']
+            assert playlist_items.calls == [(None, 'etag-1'), ('page-2', 'etag-2')]
+            
+            # A changed page is downloaded again and replaces the cached one
+            playlist_items.pages['page-2'] = ('etag-3', ['ccccccccccc'], None)
+            playlist_items.calls.clear()
+            assert monitor.get_playlist_video_ids("PLtest") == ['aaaaaaaaaaa', 'ccccccccccc']
+            with open(monitor.cache_dir / "playlist_PLtest.json") as f:
+                assert json.load(f)['page-2']['etag'] == 'etag-3'
+    
+    print("✅ Unchanged pages reused on 304, changed pages refreshed")
+    return True
+
+def test_video_cache():
+    """Test the per-video cache: hits, expiry, and unavailable transcripts."""
+    print("\n💾 Testing Video Cache...")
+    
+    _skip_without_monitor_deps()
+    
+    from monitor import YouTubeVideoMonitor
+    
+    video_id = 'dQw4w9WgXcQ'
+    
+    # The formatter is patched too: its input type differs between the
+    # youtube-transcript-api versions the requirements allow
+    with patch('monitor.build') as mock_build, \
+            patch('monitor.YouTubeTranscriptApi') as mock_transcript, \
+            patch('monitor.TextFormatter') as mock_formatter:
+        mock_youtube = mock_build.return_value
+        videos_list = mock_youtube.videos.return_value.list
+        videos_list.return_value.execute.return_value = _video_response(video_id)
+        mock_transcript.get_transcript.return_value = [
+            {'text': 'Never gonna give you up', 'start': 0.0, 'duration': 2.0}
+        ]
+        mock_formatter.return_value.format_transcript.return_value = 'Never gonna give you up'
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monitor = YouTubeVideoMonitor(api_key="test_api_key", output_dir=temp_dir)
+            cache_file = monitor.cache_dir / f"{video_id}.json"
+            
+            # First run fetches and caches
+            assert monitor.process_video(video_id) is not None
+            assert cache_file.exists()
+            assert videos_list.call_count == 1
+            assert mock_transcript.get_transcript.call_count == 1
+            
+            # Second run is served from the cache
+            assert monitor.process_video(video_id) is not None
+            assert videos_list.call_count == 1
+            assert mock_transcript.get_transcript.call_count == 1
+            
+            # An expired entry is fetched again
+            with open(cache_file) as f:
+                entry = json.load(f)
+            entry['fetched_at'] = 0
+            with open(cache_file, 'w') as f:
+                json.dump(entry, f)
+            assert monitor.process_video(video_id) is not None
+            assert videos_list.call_count == 2
+            assert mock_transcript.get_transcript.call_count == 2
+            
+            # A video without a transcript is not cached, so a later run tries again
+            cache_file.unlink()
+            mock_transcript.get_transcript.side_effect = Exception("No transcript")
+            assert monitor.process_video(video_id) is not None
+            assert not cache_file.exists()
+    
+    print("✅ Cache hit, expiry, and missing transcripts handled")
+    return True
+
+def test_process_videos_concurrently():
+    """Test that batch processing keeps input order and isolates failures."""
+    print("\n🚀 Testing Concurrent Video Processing...")
+    
+    _skip_without_monitor_deps()
+    
+    import time
+    from monitor import YouTubeVideoMonitor
+    
+    delays = {'first': 0.2, 'second': 0.0, 'broken': 0.1, 'third': 0.05}
+    
+    def fake_process_video(video_url):
+        time.sleep(delays[video_url])
+        if video_url == 'broken':
+            raise RuntimeError("boom")
+        return Path(video_url)
+    
+    with patch('monitor.build'):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monitor = YouTubeVideoMonitor(api_key="test_api_key", output_dir=temp_dir)
+            
+            with patch.object(monitor, 'process_video', side_effect=fake_process_video):
+                results = monitor.process_videos(list(delays), max_concurrency=4)
+                # A non-positive limit still processes the videos, one at a time
+                serial_results = monitor.process_videos(list(delays), max_concurrency=0)
+    
+    assert results == [Path('first'), Path('second'), None, Path('third')]
+    assert serial_results == results
+    
+    print("✅ Results in input order, failed video reported as None")
+    return True
+
 def run_all_tests():
     """Run all tests."""
     print("🎬 YouTube Video Monitor Test Suite")
@@ -264,6 +486,10 @@ def run_all_tests():
         test_video_metadata_extraction,
         test_video_processing,
         test_cli_interface,
+        test_playlist_pagination,
+        test_playlist_etag_revalidation,
+        test_video_cache,
+        test_process_videos_concurrently,
     ]
     
     passed = 0
@@ -275,6 +501,8 @@ def run_all_tests():
                 passed += 1
             else:
                 failed += 1
+        except pytest.skip.Exception as e:
+            print(f"⏭️  Test {test.__name__} skipped: {e}")
         except Exception as e:
             print(f"❌ Test {test.__name__} failed with exception: {e}")
             failed += 1
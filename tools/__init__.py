@@ -3,20 +3,52 @@ CrewAI Tools Package
 
 This package contains MCP tool definitions and wrappers for external services.
 Tools are used by agents to interact with external systems.
+
+Tools are re-exported lazily: a wrapper module is only imported the first time
+one of its tools is referenced, and every agent then shares the same objects.
 """
 
-from .mcp_tools import (
-    YouTubeMCPTool,
-    ExaMCPTool,
-    MapsMCPTool,
-    CalendarMCPTool,
-    TTSMCPTool
-)
-
-__all__ = [
-    "YouTubeMCPTool",
-    "ExaMCPTool", 
-    "MapsMCPTool",
-    "CalendarMCPTool",
-    "TTSMCPTool"
-] 
\ No newline at end of file
+import importlib
+
+# Public tool name -> submodule that defines it
+_EXPORTS = {
+    "YouTubeMCPTool": "mcp_tools",
+    "ExaMCPTool": "mcp_tools",
+    "MapsMCPTool": "mcp_tools",
+    "CalendarMCPTool": "mcp_tools",
+    "TTSMCPTool": "mcp_tools",
+    "youtube_transcribe": "youtube_mcp",
+    "youtube_analyze": "youtube_mcp",
+    "youtube_metadata": "youtube_mcp",
+    "youtube_process": "youtube_mcp",
+    "exa_search": "exa_mcp",
+    "exa_find_events": "exa_mcp",
+    "maps_route": "maps_mcp",
+    "maps_generate_shareable_link": "maps_mcp",
+    "maps_itinerary_route": "maps_mcp",
+    "calendar_create_event": "calendar_mcp",
+    "calendar_create_itinerary_events": "calendar_mcp",
+    "calendar_health_check": "calendar_mcp",
+    "tts_generate_audio": "tts_mcp",
+    "tts_generate_podcast": "tts_mcp",
+    "tts_health_check": "tts_mcp",
+    "finalize_adventure": "adventure_mcp"
+}
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access and cache the tool."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,121 @@
+"""
+Shared MCP HTTP Session
+
+All MCP tool wrappers send their requests through one pooled session, so every
+agent reuses the same keep-alive connections to the MCP servers.
+"""
+
+import os
+import functools
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+# Caps concurrent MCP requests across all agents and tools
+MCP_CONCURRENCY = int(os.getenv("MCP_CONCURRENCY", "16"))
+_MCP_SLOTS = threading.BoundedSemaphore(MCP_CONCURRENCY)
+
+# Requests currently on the wire, keyed by their arguments
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Failed MCP requests since startup; every tool fallback starts with one of these
+_FAILURES = 0
+_FAILURES_LOCK = threading.Lock()
+
+
+def _record_failure():
+    """Count one failed MCP request."""
+    global _FAILURES
+    with _FAILURES_LOCK:
+        _FAILURES += 1
+
+
+def failure_count() -> int:
+    """
+    Get the number of MCP requests that have failed in this process.
+    
+    Callers compare the count before and after a run to tell whether any tool
+    answered with fallback data during it.
+    
+    Returns:
+        Requests that raised or got an error status
+    """
+    return _FAILURES
+
+
+class BoundedSession(requests.Session):
+    """Session whose requests share the process-wide MCP concurrency limit."""
+    
+    def request(self, *args, **kwargs):
+        with _MCP_SLOTS:
+            try:
+                response = super().request(*args, **kwargs)
+            except Exception:
+                _record_failure()
+                raise
+        if response.status_code >= 400:
+            _record_failure()
+        return response
+
+
+@functools.cache
+def get_session() -> BoundedSession:
+    """
+    Get the process-wide session used for MCP server calls.
+    
+    Returns:
+        Shared BoundedSession instance
+    """
+    session = BoundedSession()
+    
+    # Transient 429/5xx answers are retried with backoff for idempotent methods
+    # (health checks); tool POSTs are only retried when the connection fails
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                  raise_on_status=False)
+    
+    # requests keeps at most 10 idle connections per host by default, so with more
+    # requests in flight the extras were closed after use and re-opened next time
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=MCP_CONCURRENCY, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def coalesce(key: Hashable, call: Callable[[], Any]) -> Any:
+    """
+    Run call once for all concurrent requests with the same key.
+    
+    The first caller sends the request; callers arriving while it is in flight
+    wait for and share its result instead of sending their own.
+    
+    Args:
+        key: Hashable identity of the request arguments
+        call: Function that performs the request
+        
+    Returns:
+        The result of the single call
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _INFLIGHT[key] = Future()
+    
+    if not owner:
+        return future.result()
+    
+    try:
+        result = call()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
@@ -0,0 +1,132 @@
+"""
+Visit Order Optimization
+
+Orders itinerary stops locally (nearest neighbour, then 2-opt) so the route
+planner receives a good sequence instead of reasoning about the order itself.
+"""
+
+import math
+import importlib.util
+from typing import List, Sequence, Tuple
+
+EARTH_RADIUS_KM = 6371.0
+
+# Numba compiles the distance matrix and 2-opt loops to native code when installed.
+# Compilation costs far more than a typical itinerary's handful of stops, so the
+# compiled path is only taken for large stop sets.
+_NUMBA = importlib.util.find_spec("numba") is not None
+JIT_MIN_POINTS = 64
+
+if _NUMBA:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _haversine_matrix_jit(lats, lngs):
+        n = lats.shape[0]
+        dist = np.zeros((n, n))
+        for i in range(n):
+            for j in range(i + 1, n):
+                a = (np.sin((lats[j] - lats[i]) / 2) ** 2
+                     + np.cos(lats[i]) * np.cos(lats[j]) * np.sin((lngs[j] - lngs[i]) / 2) ** 2)
+                dist[i, j] = dist[j, i] = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        return dist
+
+    @njit(cache=True)
+    def _two_opt_jit(route, dist):
+        n = route.shape[0]
+        improved = True
+        while improved:
+            improved = False
+            for i in range(1, n - 1):
+                for j in range(i + 1, n):
+                    a, b, c = route[i - 1], route[i], route[j]
+                    after = dist[b, route[j + 1]] - dist[c, route[j + 1]] if j + 1 < n else 0.0
+                    if dist[a, c] + after < dist[a, b] - 1e-9:
+                        route[i:j + 1] = route[i:j + 1][::-1].copy()
+                        improved = True
+        return route
+
+
+def haversine_matrix(points: Sequence[Tuple[float, float]]) -> List[List[float]]:
+    """
+    Great-circle distances between every pair of points.
+
+    Args:
+        points: (lat, lng) pairs in degrees
+
+    Returns:
+        Square matrix of distances in kilometres
+    """
+    radians = [(math.radians(lat), math.radians(lng)) for lat, lng in points]
+    n = len(radians)
+    dist = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        lat1, lng1 = radians[i]
+        for j in range(i + 1, n):
+            lat2, lng2 = radians[j]
+            a = (math.sin((lat2 - lat1) / 2) ** 2
+                 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2)
+            dist[i][j] = dist[j][i] = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+    return dist
+
+
+def nearest_neighbor(dist: List[List[float]]) -> List[int]:
+    """Open path from point 0 that always moves to the closest unvisited point."""
+    route = [0]
+    remaining = set(range(1, len(dist)))
+    while remaining:
+        current = route[-1]
+        closest = min(remaining, key=lambda j: dist[current][j])
+        route.append(closest)
+        remaining.remove(closest)
+    return route
+
+
+def two_opt(route: List[int], dist: List[List[float]]) -> List[int]:
+    """
+    Improve an open path by reversing segments until no reversal shortens it.
+
+    The first point stays fixed; the path does not return to it.
+
+    Args:
+        route: Point indices, starting with the fixed origin
+        dist: Distance matrix
+
+    Returns:
+        Improved route
+    """
+    route = list(route)
+    n = len(route)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            for j in range(i + 1, n):
+                a, b, c = route[i - 1], route[i], route[j]
+                # The last stop has no outgoing edge on an open path
+                after = dist[b][route[j + 1]] - dist[c][route[j + 1]] if j + 1 < n else 0.0
+                if dist[a][c] + after < dist[a][b] - 1e-9:
+                    route[i:j + 1] = reversed(route[i:j + 1])
+                    improved = True
+    return route
+
+
+def optimize_order(points: Sequence[Tuple[float, float]]) -> List[int]:
+    """
+    Short visiting order for stops, starting from the first point.
+
+    Args:
+        points: (lat, lng) of the origin followed by each stop
+
+    Returns:
+        Indices of the stops (1-based into points) in visiting order
+    """
+    if _NUMBA and len(points) >= JIT_MIN_POINTS:
+        radians = np.radians(np.asarray(points, dtype=np.float64))
+        dist = _haversine_matrix_jit(radians[:, 0].copy(), radians[:, 1].copy())
+        route = np.asarray(nearest_neighbor(dist), dtype=np.int64)
+        return [int(index) for index in _two_opt_jit(route, dist)[1:]]
+    
+    dist = haversine_matrix(points)
+    return two_opt(nearest_neighbor(dist), dist)[1:]
@@ -0,0 +1,43 @@
+"""
+Adventure MCP Tool Wrapper
+
+Composite tool that finalizes an adventure by calling the Calendar and TTS
+MCP servers concurrently, so the agent needs one tool turn instead of two.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from crewai.tools import tool
+from typing import Dict, Any, List
+from .calendar_mcp import calendar_create_event
+from .tts_mcp import tts_generate_podcast
+
+@tool("adventure.finalize")
+def finalize_adventure(
+    title: str,
+    narrative: str,
+    start_time: str,
+    end_time: str,
+    audio_script: str,
+    attendees: List[str] = None
+) -> Dict[str, Any]:
+    """Schedule the adventure in the calendar and generate its audio guide in one step."""
+    # The two backends are independent, so run both requests at once
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        calendar_future = pool.submit(
+            calendar_create_event.func,
+            title=title,
+            description=narrative,
+            start_time=start_time,
+            end_time=end_time,
+            attendees=attendees or []
+        )
+        audio_future = pool.submit(
+            tts_generate_podcast.func,
+            script=audio_script,
+            title=title
+        )
+
+        return {
+            "calendar_event": calendar_future.result(),
+            "audio_guide": audio_future.result()
+        }
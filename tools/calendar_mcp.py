@@ -5,10 +5,10 @@ Thin wrapper for Google Calendar MCP server calls.
 """
 
 import os
-import requests
 from crewai.tools import tool
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
+from ._http import get_session
 
 BASE_URL = os.getenv("CALENDAR_MCP_URL", "http://localhost:8003")
 
@@ -22,7 +22,7 @@ def calendar_create_event(
 ) -> Dict[str, Any]:
     """Create a calendar event."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "create_event",
@@ -59,7 +59,7 @@ def calendar_create_itinerary_events(
 ) -> List[Dict[str, Any]]:
     """Create multiple calendar events for an itinerary."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "create_itinerary_events",
@@ -116,7 +116,7 @@ def calendar_create_itinerary_events(
 def calendar_health_check() -> Dict[str, Any]:
     """Check if calendar service is healthy."""
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = get_session().get(f"{BASE_URL}/health", timeout=5)
         response.raise_for_status()
         return {"status": "healthy", "service": "calendar"}
     except Exception as e:
@@ -5,9 +5,9 @@ Thin wrapper for Exa search MCP server calls.
 """
 
 import os
-import requests
 from crewai.tools import tool
 from typing import Dict, Any, List
+from ._http import get_session
 
 BASE_URL = os.getenv("EXA_MCP_URL", "http://localhost:8001")
 
@@ -15,7 +15,7 @@ BASE_URL = os.getenv("EXA_MCP_URL", "http://localhost:8001")
 def exa_search(query: str, location: str = "", date: str = "") -> List[Dict[str, Any]]:
     """Search for local experiences using Exa semantic search."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "search",
@@ -68,7 +68,7 @@ def exa_search(query: str, location: str = "", date: str = "") -> List[Dict[str,
 def exa_find_events(topics: List[str], location: str, date: str) -> List[Dict[str, Any]]:
     """Find local events matching specific topics."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "find_events",
@@ -5,17 +5,64 @@ Thin wrapper for Google Maps MCP server calls.
 """
 
 import os
-import requests
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, quote
 from crewai.tools import tool
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Hashable, Optional, Tuple
+from ._http import get_session, coalesce
+from ._tsp import optimize_order
 
 BASE_URL = os.getenv("MAPS_MCP_URL", "http://localhost:8002")
 
+# Routes through the same stops come back the same, so repeat itineraries skip the API
+MAPS_CACHE_ENABLED = os.getenv("MAPS_CACHE", "true").lower() == "true"
+MAPS_CACHE_SIZE = int(os.getenv("MAPS_CACHE_SIZE", "512"))
+
+_route_cache = OrderedDict()
+_route_cache_lock = threading.Lock()
+
+def _place(name: str) -> str:
+    """Normalize a place name so case and spacing differences share a cache entry."""
+    return " ".join(name.strip().lower().split())
+
+def _cached(key: Hashable, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a cached route, or make the call and cache a successful result (LRU)."""
+    if not MAPS_CACHE_ENABLED:
+        return call()
+    
+    with _route_cache_lock:
+        if key in _route_cache:
+            _route_cache.move_to_end(key)
+            return _route_cache[key]
+    
+    result = call()
+    if not result.get("fallback"):
+        with _route_cache_lock:
+            _route_cache[key] = result
+            if len(_route_cache) > MAPS_CACHE_SIZE:
+                _route_cache.popitem(last=False)
+    return result
+
+def build_shareable_link(origin: str, destination: str, waypoints: List[str] = None) -> str:
+    """Build a Google Maps directions link; pure string formatting, no API call needed."""
+    params = {"api": "1", "origin": origin, "destination": destination}
+    if waypoints:
+        params["waypoints"] = "|".join(waypoints)
+    return f"https://www.google.com/maps/dir/?{urlencode(params, quote_via=quote)}"
+
 @tool("maps.route")
 def maps_route(origin: str, destination: str, mode: str = "driving") -> Dict[str, Any]:
     """Get route between two locations."""
+    key = ("route", _place(origin), _place(destination), mode)
+    result = coalesce(key, lambda: _cached(key, lambda: _route(origin, destination, mode)))
+    return dict(result)
+
+def _route(origin: str, destination: str, mode: str) -> Dict[str, Any]:
+    """Send one route request to the Maps MCP server."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "route",
@@ -28,13 +75,17 @@ def maps_route(origin: str, destination: str, mode: str = "driving") -> Dict[str
             timeout=30
         )
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        # Embed the share link so agents never spend a tool turn generating it
+        result.setdefault("share_url", build_shareable_link(origin, destination))
+        return result
     except Exception as e:
         # Fallback data for testing
         return {
             "origin": origin,
             "destination": destination,
             "mode": mode,
+            "share_url": build_shareable_link(origin, destination),
             "distance": "Estimated 5.3 miles",
             "duration": "Estimated 15 minutes",
             "steps": [
@@ -51,32 +102,20 @@ def maps_route(origin: str, destination: str, mode: str = "driving") -> Dict[str
 @tool("maps.generate_shareable_link")
 def maps_generate_shareable_link(origin: str, destination: str, waypoints: List[str] = None) -> str:
     """Generate shareable Google Maps link for navigation."""
-    try:
-        response = requests.post(
-            f"{BASE_URL}/mcp/run",
-            json={
-                "method": "generate_shareable_link",
-                "args": {
-                    "origin": origin,
-                    "destination": destination,
-                    "waypoints": waypoints or []
-                }
-            },
-            timeout=15
-        )
-        response.raise_for_status()
-        return response.json().get("url", "")
-    except Exception as e:
-        # Generate fallback link
-        encoded_origin = origin.replace(" ", "+").replace(",", "%2C")
-        encoded_dest = destination.replace(" ", "+").replace(",", "%2C")
-        return f"https://www.google.com/maps/dir/{encoded_origin}/{encoded_dest}/"
+    return build_shareable_link(origin, destination, waypoints)
 
 @tool("maps.itinerary_route")
 def maps_itinerary_route(origin: str, destinations: List[str], mode: str = "driving") -> Dict[str, Any]:
     """Generate complete itinerary route with shareable links."""
+    # Stop order stays in the key: legs and the complete route link follow it
+    key = ("itinerary_route", _place(origin), tuple(_place(dest) for dest in destinations), mode)
+    result = coalesce(key, lambda: _cached(key, lambda: _itinerary_route(origin, destinations, mode)))
+    return dict(result)
+
+def _itinerary_route(origin: str, destinations: List[str], mode: str) -> Dict[str, Any]:
+    """Send one generate_itinerary_route request to the Maps MCP server."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "generate_itinerary_route",
@@ -89,7 +128,10 @@ def maps_itinerary_route(origin: str, destinations: List[str], mode: str = "driv
             timeout=45
         )
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        if destinations:
+            result.setdefault("complete_route_link", build_shareable_link(origin, destinations[-1], destinations[:-1]))
+        return result
     except Exception as e:
         # Fallback route generation
         legs = []
@@ -98,8 +140,6 @@ def maps_itinerary_route(origin: str, destinations: List[str], mode: str = "driv
         
         current_location = origin
         for i, dest in enumerate(destinations):
-            leg_data = maps_route(current_location, dest, mode)
-            
             # Extract numeric values for totals (simplified)
             distance_val = 5.0 + i * 2.0  # Estimated
             duration_val = 15 + i * 8     # Estimated
@@ -109,7 +149,7 @@ def maps_itinerary_route(origin: str, destinations: List[str], mode: str = "driv
                 "destination": dest,
                 "distance": f"{distance_val} miles",
                 "duration": f"{duration_val} mins",
-                "shareable_link": maps_generate_shareable_link(current_location, dest)
+                "shareable_link": build_shareable_link(current_location, dest)
             })
             
             total_distance += distance_val
@@ -123,7 +163,67 @@ def maps_itinerary_route(origin: str, destinations: List[str], mode: str = "driv
             "total_distance": f"{total_distance:.1f} miles",
             "total_duration": f"{total_duration} mins",
             "legs": legs,
-            "complete_route_link": maps_generate_shareable_link(origin, destinations[-1], destinations[:-1]),
+            "complete_route_link": build_shareable_link(origin, destinations[-1], destinations[:-1]),
             "error": str(e),
             "fallback": True
-        }
\ No newline at end of file
+        }
+
+def geocode(address: str) -> Optional[Tuple[float, float]]:
+    """
+    Look up an address's coordinates (cached like routes).
+
+    Args:
+        address: Place name or street address
+
+    Returns:
+        (lat, lng), or None if the Maps server could not geocode it
+    """
+    key = ("geocode", _place(address))
+    result = coalesce(key, lambda: _cached(key, lambda: _geocode(address)))
+    coordinates = result.get("coordinates") or {}
+    if "lat" not in coordinates or "lng" not in coordinates:
+        return None
+    return float(coordinates["lat"]), float(coordinates["lng"])
+
+def _geocode(address: str) -> Dict[str, Any]:
+    """Send one geocode request to the Maps MCP server."""
+    try:
+        response = get_session().post(
+            f"{BASE_URL}/mcp/run",
+            json={"method": "geocode", "args": {"address": address}},
+            timeout=15
+        )
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        return {"address": address, "error": str(e), "fallback": True}
+
+def order_stops(origin: str, destinations: List[str]) -> Optional[List[str]]:
+    """
+    Reorder destinations into a short visiting sequence from origin.
+
+    Solved locally (nearest neighbour + 2-opt on great-circle distances), so the
+    route planner only has to produce directions and links for a fixed order.
+
+    Args:
+        origin: Starting location
+        destinations: Stops to visit
+
+    Returns:
+        Destinations in visiting order, or None if any place cannot be geocoded
+        or two places geocode to the same point
+    """
+    if len(destinations) < 2:
+        return list(destinations)
+    
+    places = [origin, *destinations]
+    with ThreadPoolExecutor(max_workers=min(len(places), 8)) as pool:
+        points = list(pool.map(geocode, places))
+    if any(point is None for point in points):
+        return None
+    # A placeholder geocoder answers every address with the same coordinates, and
+    # the order computed from repeated points would be arbitrary
+    if len(set(points)) < len(points):
+        return None
+    
+    return [places[index] for index in optimize_order(points)]
@@ -7,11 +7,12 @@ Each tool provides a standardized interface to external services.
 
 import os
 import json
-import requests
 from typing import Dict, Any, List, Optional
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from ._http import get_session
+
 
 class YouTubeMCPTool(BaseTool):
     """
@@ -186,7 +187,7 @@ class MapsMCPTool(BaseTool):
             }
             
             # Call MCP server
-            response = requests.post(
+            response = get_session().post(
                 f"{self.server_url}/run",
                 json=request_data,
                 timeout=30
@@ -253,7 +254,7 @@ class MapsMCPTool(BaseTool):
             }
             
             # Call MCP server
-            response = requests.post(
+            response = get_session().post(
                 f"{self.server_url}/run",
                 json=request_data,
                 timeout=30
@@ -5,12 +5,46 @@ Thin wrapper for Text-to-Speech MCP server calls.
 """
 
 import os
-import requests
+import json
+import hashlib
+import threading
+from collections import OrderedDict
 from crewai.tools import tool
-from typing import Dict, Any
+from typing import Dict, Any, Callable
+from ._http import get_session, coalesce
 
 BASE_URL = os.getenv("TTS_MCP_URL", "http://localhost:8004")
 
+# Synthesized audio is deterministic for a given text and voice, so results are reused
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE", "true").lower() == "true"
+TTS_CACHE_SIZE = int(os.getenv("TTS_CACHE_SIZE", "1024"))
+
+_audio_cache = OrderedDict()
+_audio_cache_lock = threading.Lock()
+
+def _cache_key(method: str, text: str, *settings) -> str:
+    """Hash a TTS request, ignoring whitespace-only differences in the text."""
+    payload = json.dumps([method, " ".join(text.split()), *settings], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+def _cached(key: str, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a cached TTS result, or make the call and cache a successful result (LRU)."""
+    if not TTS_CACHE_ENABLED:
+        return call()
+    
+    with _audio_cache_lock:
+        if key in _audio_cache:
+            _audio_cache.move_to_end(key)
+            return _audio_cache[key]
+    
+    result = call()
+    if not result.get("fallback"):
+        with _audio_cache_lock:
+            _audio_cache[key] = result
+            if len(_audio_cache) > TTS_CACHE_SIZE:
+                _audio_cache.popitem(last=False)
+    return result
+
 @tool("tts.generate_audio")
 def tts_generate_audio(
     text: str,
@@ -18,8 +52,15 @@ def tts_generate_audio(
     speed: float = 1.0
 ) -> Dict[str, Any]:
     """Generate audio from text using TTS."""
+    # Podcasts often repeat intros, outros and transitions; synthesize each once
+    key = _cache_key("generate_audio", text, voice, speed)
+    result = coalesce(key, lambda: _cached(key, lambda: _generate_audio(text, voice, speed)))
+    return dict(result)
+
+def _generate_audio(text: str, voice: str, speed: float) -> Dict[str, Any]:
+    """Send one generate_audio request to the TTS MCP server."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "generate_audio",
@@ -52,8 +93,14 @@ def tts_generate_podcast(
     voice_settings: Dict[str, Any] = None
 ) -> Dict[str, Any]:
     """Generate a complete podcast from script."""
+    key = _cache_key("generate_podcast", script, title, voice_settings or {})
+    result = coalesce(key, lambda: _cached(key, lambda: _generate_podcast(script, title, voice_settings)))
+    return dict(result)
+
+def _generate_podcast(script: str, title: str, voice_settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Send one generate_podcast request to the TTS MCP server."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "generate_podcast",
@@ -83,7 +130,7 @@ def tts_generate_podcast(
 def tts_health_check() -> Dict[str, Any]:
     """Check if TTS service is healthy."""
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = get_session().get(f"{BASE_URL}/health", timeout=5)
         response.raise_for_status()
         return {"status": "healthy", "service": "tts"}
     except Exception as e:
@@ -5,17 +5,32 @@ Thin wrapper for YouTube MCP server calls.
 """
 
 import os
-import requests
+import re
+import json
+import time
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from crewai.tools import tool
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from ._http import get_session
 
 BASE_URL = os.getenv("YOUTUBE_MCP_URL", "http://localhost:8000")
 
+# Complete youtube.process results are kept on disk, keyed by video ID, language and
+# analysis type, so re-runs over the same videos skip the MCP round trips
+YOUTUBE_CACHE_ENABLED = os.getenv("YOUTUBE_CACHE", "true").lower() == "true"
+YOUTUBE_CACHE_DIR = Path(os.getenv("YOUTUBE_CACHE_DIR", ".youtube_cache"))
+YOUTUBE_CACHE_TTL = int(os.getenv("YOUTUBE_CACHE_TTL", str(7 * 24 * 3600)))
+
+# Video ID in watch, youtu.be, embed, shorts and /v/ URLs, or on its own
+VIDEO_ID_PATTERN = re.compile(r'(?:[?&]v=|youtu\.be/|/embed/|/shorts/|/v/|^)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])')
+
 @tool("youtube.transcribe")
 def youtube_transcribe(video_url: str) -> str:
     """Extract transcript/captions from YouTube video."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "transcribe",
@@ -32,7 +47,7 @@ def youtube_transcribe(video_url: str) -> str:
 def youtube_analyze(video_url: str, analysis_type: str = "full") -> Dict[str, Any]:
     """Analyze YouTube video content and extract insights."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "analyze",
@@ -70,7 +85,7 @@ def youtube_analyze(video_url: str, analysis_type: str = "full") -> Dict[str, An
 def youtube_metadata(video_url: str) -> Dict[str, Any]:
     """Get YouTube video metadata."""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/mcp/run",
             json={
                 "method": "metadata",
@@ -88,4 +103,90 @@ def youtube_metadata(video_url: str) -> Dict[str, Any]:
             "duration": "10:00",
             "error": str(e),
             "fallback": True
-        }
\ No newline at end of file
+        }
+
+@tool("youtube.process")
+def youtube_process(video_url: str, analysis_type: str = "full", language: str = "en") -> Dict[str, Any]:
+    """Get a YouTube video's metadata, transcript, and content analysis in one call."""
+    if not YOUTUBE_CACHE_ENABLED:
+        return _fetch_process(video_url, analysis_type, language)
+    
+    # Keyed on the video ID, so every URL form of one video shares an entry
+    match = VIDEO_ID_PATTERN.search(video_url)
+    video_id = match.group(1) if match else video_url
+    key = hashlib.blake2b(f"{video_id}\0{language}\0{analysis_type}".encode("utf-8"), digest_size=16)
+    path = YOUTUBE_CACHE_DIR / f"{key.hexdigest()}.json"
+    
+    result = _load_cached(path)
+    if result is None:
+        result = _fetch_process(video_url, analysis_type, language)
+        if _is_complete(result):
+            _store_cached(path, result)
+    return result
+
+
+def _fetch_process(video_url: str, analysis_type: str, language: str) -> Dict[str, Any]:
+    """Ask the server for all three parts, or make the three calls if it can't bundle them."""
+    try:
+        response = get_session().post(
+            f"{BASE_URL}/mcp/run",
+            json={
+                "method": "process",
+                "args": {
+                    "video_url": video_url,
+                    "analysis_type": analysis_type,
+                    "language": language
+                }
+            },
+            timeout=45
+        )
+        response.raise_for_status()
+        return response.json()
+    except Exception:
+        # Servers without the bundled method still answer the three separate calls
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            metadata = pool.submit(youtube_metadata.func, video_url)
+            transcript = pool.submit(youtube_transcribe.func, video_url)
+            analysis = pool.submit(youtube_analyze.func, video_url, analysis_type)
+            
+            return {
+                "video_url": video_url,
+                "metadata": metadata.result(),
+                "transcript": transcript.result(),
+                "analysis": analysis.result()
+            }
+
+
+def _is_complete(result: Dict[str, Any]) -> bool:
+    """Whether every part was actually fetched, so the result is worth caching."""
+    parts = [result.get(part) for part in ("metadata", "analysis")]
+    if any(not isinstance(part, dict) or part.get("fallback") for part in parts):
+        return False
+    transcript = result.get("transcript")
+    return isinstance(transcript, str) and not transcript.startswith("Error transcribing video")
+
+
+def _load_cached(path: Path) -> Optional[Dict[str, Any]]:
+    """Return a cached result, or None on a miss or expired entry."""
+    try:
+        if time.time() - path.stat().st_mtime > YOUTUBE_CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(path: Path, result: Dict[str, Any]) -> None:
+    """Write a result through a temporary sibling so readers never see a partial file."""
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        YOUTUBE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is an optimization; a full or read-only disk leaves the result uncached
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
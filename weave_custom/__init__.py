@@ -4,7 +4,7 @@ Weave Integration Package
 This package provides W&B Weave integration for observability and tracing.
 """
 
-from .trace_hooks import traced, setup_weave_tracing
+from .trace_hooks import traced, sampled_op, setup_weave_tracing
 from .config import WeaveConfig
 
-__all__ = ["traced", "setup_weave_tracing", "WeaveConfig"] 
\ No newline at end of file
+__all__ = ["traced", "sampled_op", "setup_weave_tracing", "WeaveConfig"] 
\ No newline at end of file
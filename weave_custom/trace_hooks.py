@@ -5,11 +5,24 @@ This module provides automatic instrumentation for CrewAI agents and flows.
 """
 
 import os
-import weave
+import random
+import inspect
+import functools
 from typing import Any, Callable, Dict, Optional
 from functools import wraps
 from datetime import datetime
 
+# With tracing off, the decorators below return the function untouched so calls
+# skip span creation and argument serialization entirely
+WEAVE_DISABLED = os.getenv("WEAVE_DISABLED", "false").lower() == "true"
+
+
+@functools.cache
+def _weave():
+    """Import weave on first use; it pulls in wandb and takes seconds to load."""
+    import weave
+    return weave
+
 
 def traced(component: str = None, operation: str = None):
     """
@@ -20,25 +33,54 @@ def traced(component: str = None, operation: str = None):
         operation: Operation name (e.g., "analyze_content", "plan_route")
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Extract component and operation names
-            comp_name = component or getattr(func, '__name__', 'unknown')
-            op_name = operation or func.__name__
+        if WEAVE_DISABLED:
+            return func
+        
+        # Extract component and operation names
+        comp_name = component or getattr(func, '__name__', 'unknown')
+        op_name = operation or func.__name__
+        
+        # Create trace name
+        trace_name = f"{comp_name}.{op_name}"
+        
+        def annotate(trace, kwargs):
+            # Add metadata
+            trace.add_tag("component", comp_name)
+            trace.add_tag("operation", op_name)
+            trace.add_tag("timestamp", datetime.now().isoformat())
             
-            # Create trace name
-            trace_name = f"{comp_name}.{op_name}"
+            # Add input parameters (sanitized)
+            sanitized_kwargs = _sanitize_trace_data(kwargs)
+            trace.log_input(sanitized_kwargs)
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                # Keep the trace open until the coroutine has finished
+                with _weave().trace(name=trace_name) as trace:
+                    annotate(trace, kwargs)
+                    
+                    try:
+                        result = await func(*args, **kwargs)
+                        
+                        # Log output (sanitized)
+                        trace.log_output(_sanitize_trace_data(result))
+                        
+                        return result
+                        
+                    except Exception as e:
+                        # Log error
+                        trace.log_error(str(e))
+                        trace.add_tag("status", "error")
+                        raise
             
+            return async_wrapper
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
             # Start trace
-            with weave.trace(name=trace_name) as trace:
-                # Add metadata
-                trace.add_tag("component", comp_name)
-                trace.add_tag("operation", op_name)
-                trace.add_tag("timestamp", datetime.now().isoformat())
-                
-                # Add input parameters (sanitized)
-                sanitized_kwargs = _sanitize_trace_data(kwargs)
-                trace.log_input(sanitized_kwargs)
+            with _weave().trace(name=trace_name) as trace:
+                annotate(trace, kwargs)
                 
                 try:
                     # Execute function
@@ -62,6 +104,67 @@ def traced(component: str = None, operation: str = None):
     return decorator
 
 
+def _untraced_error(operation: str, error: str) -> None:
+    """Weave op that records a failure from a call that was not sampled."""
+
+
+def _record_untraced_error(operation: str, error: str) -> None:
+    """Record a failure from an unsampled call, creating the op on first use."""
+    _untraced_error_op()(operation, error)
+
+
+@functools.cache
+def _untraced_error_op():
+    return _weave().op()(_untraced_error)
+
+
+def sampled_op(sample: float = None):
+    """
+    Decorator that applies weave.op() to only a fraction of calls.
+    
+    Unsampled calls skip argument serialization and span upload entirely. When
+    one of them fails, the error is still recorded in Weave. With WEAVE_DISABLED
+    set, the function is returned unwrapped.
+    
+    Args:
+        sample: Fraction of calls to trace (defaults to TRACE_SAMPLE, or 1.0)
+    """
+    rate = float(os.getenv("TRACE_SAMPLE", "1.0")) if sample is None else sample
+    
+    def decorator(func: Callable) -> Callable:
+        if WEAVE_DISABLED:
+            return func
+        
+        # Wrapping is deferred to the first call so decorating doesn't import weave
+        op_func = functools.cache(lambda: _weave().op()(func))
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if rate >= 1.0 or random.random() < rate:
+                    return await op_func()(*args, **kwargs)
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    _record_untraced_error(func.__qualname__, str(e))
+                    raise
+            
+            return async_wrapper
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if rate >= 1.0 or random.random() < rate:
+                return op_func()(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                _record_untraced_error(func.__qualname__, str(e))
+                raise
+        
+        return wrapper
+    return decorator
+
+
 def _sanitize_trace_data(data: Any) -> Any:
     """
     Sanitize data for tracing by removing sensitive information.
@@ -117,7 +220,7 @@ class WeaveTraceManager:
             os.environ["WANDB_API_KEY"] = api_key
         
         # Initialize Weave
-        weave.init(self.project_name)
+        _weave().init(self.project_name)
         self.initialized = True
         
         print(f"✅ Weave tracing initialized for project: {self.project_name}")
@@ -134,7 +237,7 @@ class WeaveTraceManager:
             Weave trace context manager
         """
         trace_name = f"crew.{crew_name}.{task_name}"
-        return weave.trace(name=trace_name)
+        return _weave().trace(name=trace_name)
     
     def trace_agent_action(self, agent_name: str, action: str):
         """
@@ -148,7 +251,7 @@ class WeaveTraceManager:
             Weave trace context manager
         """
         trace_name = f"agent.{agent_name}.{action}"
-        return weave.trace(name=trace_name)
+        return _weave().trace(name=trace_name)
     
     def trace_mcp_call(self, server_name: str, method: str):
         """
@@ -162,7 +265,7 @@ class WeaveTraceManager:
             Weave trace context manager
         """
         trace_name = f"mcp.{server_name}.{method}"
-        return weave.trace(name=trace_name)
+        return _weave().trace(name=trace_name)
 
 
 # Global trace manager instance
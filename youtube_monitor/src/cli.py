@@ -21,7 +21,7 @@ except ImportError:
 # Add the src directory to the path
 sys.path.append(str(Path(__file__).parent))
 
-from monitor import YouTubeVideoMonitor, extract_video_id
+from monitor import YouTubeVideoMonitor, extract_video_id, MAX_CONCURRENT_VIDEOS
 
 def main():
     """Main function to run the YouTube video monitor."""
@@ -42,12 +42,24 @@ Examples:
 
   # Process with just video ID
   python cli.py dQw4w9WgXcQ
+
+  # Process several videos concurrently
+  python cli.py dQw4w9WgXcQ https://youtu.be/9bZkp7q19f0
+
+  # Process every video in a playlist
+  python cli.py --playlist PLxxxxxxxxxxxxxxxx
         """
     )
     
     parser.add_argument(
-        'video_url',
-        help='YouTube video URL or video ID'
+        'video_urls',
+        nargs='*',
+        metavar='video_url',
+        help='YouTube video URL or video ID; several are processed concurrently'
+    )
+    parser.add_argument(
+        '--playlist',
+        help='YouTube playlist ID whose videos are processed as well'
     )
     parser.add_argument(
         '--api-key',
@@ -58,6 +70,22 @@ Examples:
         default='youtube_data',
         help='Output directory for extracted data (default: youtube_data)'
     )
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=MAX_CONCURRENT_VIDEOS,
+        help=f'Videos processed at the same time (default: {MAX_CONCURRENT_VIDEOS})'
+    )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent metadata.json for reading (default: compact)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Fetch metadata and transcript again instead of reusing earlier runs'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -66,6 +94,11 @@ Examples:
     
     args = parser.parse_args()
     
+    if not args.video_urls and not args.playlist:
+        parser.error('provide at least one video_url or --playlist')
+    if args.max_concurrency < 1:
+        parser.error('--max-concurrency must be at least 1')
+    
     # Set up logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(
@@ -81,18 +114,22 @@ Examples:
         print("Please set YOUTUBE_API_KEY environment variable or use --api-key")
         sys.exit(1)
     
-    # Validate video URL/ID
-    video_id = extract_video_id(args.video_url)
-    if not video_id:
-        print(f"❌ Error: Invalid YouTube video URL or ID: {args.video_url}")
-        print("Please provide a valid YouTube video URL or 11-character video ID")
-        sys.exit(1)
+    # Validate video URLs/IDs
+    video_ids = [extract_video_id(video_url) for video_url in args.video_urls]
+    for video_url, video_id in zip(args.video_urls, video_ids):
+        if not video_id:
+            print(f"❌ Error: Invalid YouTube video URL or ID: {video_url}")
+            print("Please provide a valid YouTube video URL or 11-character video ID")
+            sys.exit(1)
     
     # Print configuration
     print("🎬 YouTube Video Monitor")
     print("=" * 40)
-    print(f"Video URL/ID: {args.video_url}")
-    print(f"Video ID: {video_id}")
+    for video_url, video_id in zip(args.video_urls, video_ids):
+        print(f"Video URL/ID: {video_url}")
+        print(f"Video ID: {video_id}")
+    if args.playlist:
+        print(f"Playlist ID: {args.playlist}")
     print(f"Output Directory: {args.output_dir}")
     print("=" * 40)
     
@@ -100,20 +137,34 @@ Examples:
     try:
         monitor = YouTubeVideoMonitor(
             api_key=api_key,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            pretty_json=args.pretty,
+            use_cache=not args.no_cache
         )
         
-        # Process the video
-        video_dir = monitor.process_video(args.video_url)
+        video_urls = list(args.video_urls)
+        if args.playlist:
+            playlist_video_ids = monitor.get_playlist_video_ids(args.playlist)
+            if not playlist_video_ids:
+                print(f"❌ No videos found in playlist: {args.playlist}")
+                sys.exit(1)
+            print(f"📋 Found {len(playlist_video_ids)} videos in playlist")
+            video_urls.extend(playlist_video_ids)
+        
+        # Process the videos; with more than one, their requests overlap
+        video_dirs = monitor.process_videos(video_urls, args.max_concurrency)
+        
+        for video_url, video_dir in zip(video_urls, video_dirs):
+            if video_dir:
+                print(f"✅ Successfully processed video!")
+                print(f"📁 Data saved to: {video_dir}")
+                print(f"   - metadata.json: Video metadata")
+                print(f"   - transcript.txt: Full transcript")
+                print(f"   - summary.txt: Video summary")
+            else:
+                print(f"❌ Failed to process video: {video_url}")
         
-        if video_dir:
-            print(f"✅ Successfully processed video!")
-            print(f"📁 Data saved to: {video_dir}")
-            print(f"   - metadata.json: Video metadata")
-            print(f"   - transcript.txt: Full transcript")
-            print(f"   - summary.txt: Video summary")
-        else:
-            print("❌ Failed to process video")
+        if not all(video_dirs):
             sys.exit(1)
             
     except KeyboardInterrupt:
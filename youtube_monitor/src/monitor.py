@@ -11,6 +11,9 @@ import json
 import time
 import logging
 import re
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -33,6 +36,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Videos processed at the same time by process_videos; each one mostly waits on the
+# YouTube API and transcript requests
+MAX_CONCURRENT_VIDEOS = int(os.getenv('MAX_CONCURRENT_VIDEOS', '8'))
+
+# Times a YouTube Data API request is retried (with exponential backoff) after a
+# connection error, 429 or 5xx response
+API_RETRIES = int(os.getenv('API_RETRIES', '3'))
+
+# Fetched metadata and transcripts are reused for this long (seconds) on later runs
+VIDEO_CACHE_TTL = int(os.getenv('VIDEO_CACHE_TTL', str(7 * 24 * 3600)))
+
+# YouTube URL formats, tried in order; compiled once rather than looked up per call
+VIDEO_URL_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
+    r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
+    r'(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})',
+    r'(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})',
+    r'(?:https?://)?(?:www\.)?youtube\.com/watch\?.*v=([a-zA-Z0-9_-]{11})',
+])
+BARE_VIDEO_ID = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+
 def extract_video_id(url: str) -> Optional[str]:
     """
     Extract video ID from various YouTube URL formats.
@@ -44,55 +68,70 @@ def extract_video_id(url: str) -> Optional[str]:
         Video ID if valid, None otherwise
     """
     # Parse different YouTube URL formats first
-    patterns = [
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?.*v=([a-zA-Z0-9_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in VIDEO_URL_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     
     # If it's already a video ID (11 characters, alphanumeric and dashes/underscores)
     # and contains typical YouTube video ID patterns (not just any 11-character string)
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', url) and not url.lower().startswith('invalid'):
+    if BARE_VIDEO_ID.match(url) and not url.lower().startswith('invalid'):
         return url
     
     return None
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file through a temporary sibling so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
 class YouTubeVideoMonitor:
     """Class for monitoring individual YouTube videos and extracting video data."""
     
-    def __init__(self, api_key: str, output_dir: str = "youtube_data"):
+    def __init__(self, api_key: str, output_dir: str = "youtube_data", pretty_json: bool = False,
+                 use_cache: bool = True):
         """
         Initialize the YouTube video monitor.
         
         Args:
             api_key: YouTube Data API key
             output_dir: Directory to save extracted data
+            pretty_json: Indent metadata.json instead of writing it compactly
+            use_cache: Reuse metadata and transcripts fetched by earlier runs
         """
         self.api_key = api_key
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.pretty_json = pretty_json
+        self.use_cache = use_cache
+        self.cache_dir = self.output_dir / ".cache"
         
         # Initialize YouTube API client
         self.youtube = build('youtube', 'v3', developerKey=api_key)
         
+        # googleapiclient clients are not thread-safe, so worker threads build their own
+        self._local = threading.local()
+        self._local.youtube = self.youtube
+        
         logger.info("Initialized YouTube video monitor")
         logger.info(f"Output directory: {self.output_dir}")
     
+    def _client(self):
+        """YouTube API client for the calling thread."""
+        client = getattr(self._local, 'youtube', None)
+        if client is None:
+            client = self._local.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        return client
+    
     def get_video_metadata(self, video_id: str) -> Dict[str, Any]:
         """Get detailed metadata for a specific video."""
         try:
-            request = self.youtube.videos().list(
+            request = self._client().videos().list(
                 part='snippet,statistics,contentDetails',
                 id=video_id
             )
-            response = request.execute()
+            response = request.execute(num_retries=API_RETRIES)
             
             if response['items']:
                 video = response['items'][0]
@@ -124,6 +163,77 @@ class YouTubeVideoMonitor:
             logger.error(f"Error fetching video metadata for {video_id}: {e}")
             return {}
     
+    def get_playlist_video_ids(self, playlist_id: str) -> List[str]:
+        """
+        Get the IDs of every video in a playlist.
+        
+        playlistItems returns at most 50 items per request, so the pages are
+        followed through nextPageToken until the playlist is exhausted. Pages
+        from earlier runs are revalidated with their ETag; an unchanged page
+        comes back as 304 without a body and is read from the cache.
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            
+        Returns:
+            Video IDs in playlist order, or an empty list if the playlist could not be read
+        """
+        cache_path = self.cache_dir / f"playlist_{playlist_id}.json"
+        cached_pages = self._load_cached_playlist(cache_path) if self.use_cache else {}
+        pages = {}
+        
+        video_ids = []
+        page_token = None
+        try:
+            while True:
+                key = page_token or ''
+                cached = cached_pages.get(key)
+                request = self._client().playlistItems().list(
+                    part='contentDetails',
+                    playlistId=playlist_id,
+                    maxResults=50,
+                    pageToken=page_token
+                )
+                if cached:
+                    request.headers['If-None-Match'] = cached['etag']
+                
+                try:
+                    response = request.execute(num_retries=API_RETRIES)
+                    page = {
+                        'etag': response.get('etag'),
+                        'video_ids': [item['contentDetails']['videoId'] for item in response.get('items', [])],
+                        'next_page_token': response.get('nextPageToken')
+                    }
+                except HttpError as e:
+                    if not (cached and e.resp.status == 304):
+                        raise
+                    page = cached
+                
+                pages[key] = page
+                video_ids.extend(page['video_ids'])
+                
+                page_token = page['next_page_token']
+                if not page_token:
+                    break
+                
+        except HttpError as e:
+            logger.error(f"Error fetching playlist {playlist_id}: {e}")
+            return []
+        
+        if self.use_cache and pages != cached_pages:
+            self.cache_dir.mkdir(exist_ok=True)
+            _write_atomic(cache_path, json.dumps(pages, separators=(',', ':')).encode('utf-8'))
+        return video_ids
+    
+    @staticmethod
+    def _load_cached_playlist(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Return the playlist pages stored by an earlier run, keyed by page token."""
+        try:
+            with open(cache_path, 'rb') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+    
     def get_video_transcript(self, video_id: str) -> str:
         """Get transcript for a YouTube video."""
         try:
@@ -141,6 +251,27 @@ class YouTubeVideoMonitor:
                 logger.warning(f"Could not get transcript for video {video_id}: {e2}")
                 return f"Transcript not available for video {video_id}"
     
+    def _load_cached_video(self, video_id: str) -> Optional[tuple]:
+        """Return (metadata, transcript) from an earlier run if still fresh."""
+        try:
+            with open(self.cache_dir / f"{video_id}.json", 'rb') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        
+        if time.time() - entry.get('fetched_at', 0) > VIDEO_CACHE_TTL:
+            return None
+        return entry['metadata'], entry['transcript']
+    
+    def _store_cached_video(self, video_id: str, metadata: Dict[str, Any], transcript: str):
+        """Keep fetched video data for later runs."""
+        self.cache_dir.mkdir(exist_ok=True)
+        entry = {'metadata': metadata, 'transcript': transcript, 'fetched_at': time.time()}
+        _write_atomic(
+            self.cache_dir / f"{video_id}.json",
+            json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        )
+    
     def save_video_data(self, video_id: str, metadata: Dict[str, Any], transcript: str):
         """Save video data to files."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -151,39 +282,50 @@ class YouTubeVideoMonitor:
         
         # Save metadata
         metadata_file = video_dir / "metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        # json.dump would issue one write per token; encode the document once instead
+        if self.pretty_json:
+            metadata_json = json.dumps(metadata, indent=2, ensure_ascii=False)
+        else:
+            metadata_json = json.dumps(metadata, ensure_ascii=False, separators=(',', ':'))
+        _write_atomic(metadata_file, metadata_json.encode('utf-8'))
+        
+        # Each file is built in memory, encoded once, and written with a single call
+        transcript_parts = [
+            f"Video ID: {video_id}\n",
+            f"Title: {metadata.get('title', 'Unknown')}\n",
+            f"Published: {metadata.get('published_at', 'Unknown')}\n",
+            f"Channel: {metadata.get('channel_title', 'Unknown')}\n",
+            f"Duration: {metadata.get('duration', 'Unknown')}\n",
+            f"Views: {metadata.get('view_count', 'Unknown')}\n",
+            f"Likes: {metadata.get('like_count', 'Unknown')}\n",
+            f"Comments: {metadata.get('comment_count', 'Unknown')}\n",
+            "=" * 80 + "\n\n",
+            transcript
+        ]
         
         # Save transcript
         transcript_file = video_dir / "transcript.txt"
-        with open(transcript_file, 'w', encoding='utf-8') as f:
-            f.write(f"Video ID: {video_id}\n")
-            f.write(f"Title: {metadata.get('title', 'Unknown')}\n")
-            f.write(f"Published: {metadata.get('published_at', 'Unknown')}\n")
-            f.write(f"Channel: {metadata.get('channel_title', 'Unknown')}\n")
-            f.write(f"Duration: {metadata.get('duration', 'Unknown')}\n")
-            f.write(f"Views: {metadata.get('view_count', 'Unknown')}\n")
-            f.write(f"Likes: {metadata.get('like_count', 'Unknown')}\n")
-            f.write(f"Comments: {metadata.get('comment_count', 'Unknown')}\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(transcript)
+        _write_atomic(transcript_file, ''.join(transcript_parts).encode('utf-8'))
+        
+        summary_parts = [
+            "VIDEO SUMMARY\n",
+            "=" * 50 + "\n",
+            f"Video ID: {video_id}\n",
+            f"Title: {metadata.get('title', 'Unknown')}\n",
+            f"Channel: {metadata.get('channel_title', 'Unknown')}\n",
+            f"Published: {metadata.get('published_at', 'Unknown')}\n",
+            f"Duration: {metadata.get('duration', 'Unknown')}\n",
+            f"Views: {metadata.get('view_count', 'Unknown')}\n",
+            f"Likes: {metadata.get('like_count', 'Unknown')}\n",
+            f"Comments: {metadata.get('comment_count', 'Unknown')}\n",
+            f"Description: {metadata.get('description', 'No description')[:500]}...\n",
+            f"Tags: {', '.join(metadata.get('tags', []))}\n",
+            f"Transcript Length: {len(transcript)} characters\n"
+        ]
         
         # Save summary
         summary_file = video_dir / "summary.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(f"VIDEO SUMMARY\n")
-            f.write(f"=" * 50 + "\n")
-            f.write(f"Video ID: {video_id}\n")
-            f.write(f"Title: {metadata.get('title', 'Unknown')}\n")
-            f.write(f"Channel: {metadata.get('channel_title', 'Unknown')}\n")
-            f.write(f"Published: {metadata.get('published_at', 'Unknown')}\n")
-            f.write(f"Duration: {metadata.get('duration', 'Unknown')}\n")
-            f.write(f"Views: {metadata.get('view_count', 'Unknown')}\n")
-            f.write(f"Likes: {metadata.get('like_count', 'Unknown')}\n")
-            f.write(f"Comments: {metadata.get('comment_count', 'Unknown')}\n")
-            f.write(f"Description: {metadata.get('description', 'No description')[:500]}...\n")
-            f.write(f"Tags: {', '.join(metadata.get('tags', []))}\n")
-            f.write(f"Transcript Length: {len(transcript)} characters\n")
+        _write_atomic(summary_file, ''.join(summary_parts).encode('utf-8'))
         
         logger.info(f"Saved data for video {video_id} to {video_dir}")
         return video_dir
@@ -205,19 +347,83 @@ class YouTubeVideoMonitor:
         
         logger.info(f"Processing video: {video_id}")
         
-        # Get detailed metadata
-        metadata = self.get_video_metadata(video_id)
-        if not metadata:
-            logger.error(f"Could not get metadata for video {video_id}")
-            return None
-        
-        logger.info(f"Found video: {metadata['title']}")
-        
-        # Get transcript
-        transcript = self.get_video_transcript(video_id)
+        cached = self._load_cached_video(video_id) if self.use_cache else None
+        if cached:
+            metadata, transcript = cached
+            logger.info(f"Using cached data for video: {metadata['title']}")
+        else:
+            # The transcript and the metadata come from different services, so the
+            # transcript is fetched on a helper thread while the metadata call runs
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                transcript_future = pool.submit(self.get_video_transcript, video_id)
+                
+                # Get detailed metadata
+                metadata = self.get_video_metadata(video_id)
+                if not metadata:
+                    logger.error(f"Could not get metadata for video {video_id}")
+                    return None
+                
+                logger.info(f"Found video: {metadata['title']}")
+                
+                # Get transcript
+                transcript = transcript_future.result()
+            
+            # A missing transcript may appear later, so only complete fetches are kept
+            if self.use_cache and transcript != f"Transcript not available for video {video_id}":
+                self._store_cached_video(video_id, metadata, transcript)
         
         # Save all data
         video_dir = self.save_video_data(video_id, metadata, transcript)
         
         logger.info(f"Successfully processed video {video_id}")
-        return video_dir 
\ No newline at end of file
+        return video_dir
+    
+    def process_playlist(self, playlist_id: str,
+                         max_concurrency: int = MAX_CONCURRENT_VIDEOS) -> List[Optional[Path]]:
+        """
+        Process every video in a playlist concurrently.
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            max_concurrency: Maximum number of videos processed at the same time
+            
+        Returns:
+            Per video, the saved video data directory or None, in playlist order
+        """
+        video_ids = self.get_playlist_video_ids(playlist_id)
+        logger.info(f"Found {len(video_ids)} videos in playlist {playlist_id}")
+        return self.process_videos(video_ids, max_concurrency)
+    
+    def process_videos(self, video_urls: List[str],
+                       max_concurrency: int = MAX_CONCURRENT_VIDEOS) -> List[Optional[Path]]:
+        """Synchronous wrapper for process_videos_async."""
+        return asyncio.run(self.process_videos_async(video_urls, max_concurrency))
+    
+    async def process_videos_async(self, video_urls: List[str],
+                                   max_concurrency: int = MAX_CONCURRENT_VIDEOS) -> List[Optional[Path]]:
+        """
+        Process several videos concurrently.
+        
+        Each video runs process_video in a worker thread, so the API and
+        transcript requests of different videos overlap.
+        
+        Args:
+            video_urls: YouTube video URLs or video IDs
+            max_concurrency: Maximum number of videos processed at the same time;
+                values below 1 are treated as 1
+            
+        Returns:
+            Per URL, the saved video data directory or None, in input order
+        """
+        # A zero-slot semaphore would never let any video start
+        slots = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def process(video_url):
+            async with slots:
+                try:
+                    return await asyncio.to_thread(self.process_video, video_url)
+                except Exception as e:
+                    logger.error(f"Error processing video {video_url}: {e}")
+                    return None
+        
+        return await asyncio.gather(*(process(video_url) for video_url in video_urls))